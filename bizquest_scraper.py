@@ -1,21 +1,32 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import html
+import json
+import queue
 import re
-import time
-from typing import List, Set, Tuple
-from urllib.parse import urljoin
+import sys
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import urljoin, urlsplit
 
-from playwright.sync_api import Page, sync_playwright
+from playwright.sync_api import APIResponse, Browser, BrowserContext, Page, sync_playwright
 
+from ecw_scraper_browser import block_heavy_requests
 from ecw_scraper_data import (
     BrokerContact,
+    ProfileCache,
     clean_contacts_dataframe,
+    contact_to_row,
     contacts_to_dataframe,
+    find_ecw_keywords,
     save_to_csv,
 )
 from ecw_scraper_google_sheets import (
-    append_row_to_google_sheet,
+    SheetBuffer,
     clear_worksheet_data,
     upload_dataframe_to_google_sheet,
 )
@@ -25,26 +36,25 @@ DIRECTORY_URLS: List[Tuple[str, str]] = [
     ("Florida", "https://www.bizquest.com/florida-business-brokers/"),
 ]
 
-ECW_KEYWORDS = [
-    "express car wash",
-    "express wash",
-    "tunnel wash",
-    "car wash",
-    "carwash",
-    "conveyor wash",
-]
-
 OUTPUT_CSV = "bizquest_ecw_brokers.csv"
 SHEET_ID = "1MMnxeTTlf9noOKmmvGEBl9xPinsNTd12ZXv7lBa6S9A"
 WORKSHEET_NAME = "BizQuest"
 SERVICE_ACCOUNT_JSON = "ecw-broker-scraper-ef955c25c30d.json"
+PROFILE_WORKERS = 4
+PROFILE_CACHE_PATH: Optional[str] = ".bizquest_cache.db"
+SHEET_FLUSH_ROWS = 25
+SHEET_FLUSH_SECONDS = 5.0
+DIRECTORY_MAX_PAGES = 60
+DIRECTORY_FETCH_WORKERS = 16
 
 _PROFILE_PATH_RE = re.compile(r"/business-broker/[^/]+/[^/]+/BW\d+", re.I)
+_RE_PAGE_HREF = re.compile(r"""href\s*=\s*["'][^"']*/page-(\d+)/?["']""", re.I)
+_RE_BROKER_HREF = re.compile(r"""href\s*=\s*["']([^"']*/business-broker/[^"']*)["']""", re.I)
+
+_RE_HTML_SKIP = re.compile(r"<(script|style|noscript)\b.*?</\1\s*>", re.I | re.S)
+_RE_HTML_TAG = re.compile(r"<[^>]+>")
 
 _CITY_STATE_ONLY = re.compile(r"^[^,]+,\s*[A-Za-z]{2}$")
-_RE_CITY_ST = re.compile(
-    r"([A-Za-z][A-Za-z\s\.\-']+),\s*([A-Za-z]{2})(?:\s+\d{5}(?:-\d{4})?|\s+United States|\s|$)"
-)
 _STATE_ABBREV = {
     "alabama": "AL", "alaska": "AK", "arizona": "AZ", "arkansas": "AR", "california": "CA",
     "colorado": "CO", "connecticut": "CT", "delaware": "DE", "florida": "FL", "georgia": "GA",
@@ -58,24 +68,114 @@ _STATE_ABBREV = {
     "texas": "TX", "utah": "UT", "vermont": "VT", "virginia": "VA", "washington": "WA",
     "west virginia": "WV", "wisconsin": "WI", "wyoming": "WY", "district of columbia": "DC",
 }
-_RE_CITY_FULL_STATE = re.compile(
-    r"([A-Za-z][A-Za-z\s\.\-']+?),?\s*,\s*([A-Za-z]+(?:\s+[A-Za-z]+)*)\s*(?=\d{5}(?:-\d{4})?|$|,)",
-    re.I
+# Text is whitespace-collapsed before matching, so a matched state name is
+# always a literal _STATE_ABBREV key once lowercased.
+_STATE_NAMES_ALT = "|".join(
+    re.escape(name) for name in sorted(_STATE_ABBREV, key=len, reverse=True)
 )
-_RE_CITY_STATE_BEFORE_ZIP = re.compile(
-    r"([A-Za-z][A-Za-z\s\.\-']+?),\s*([A-Za-z]+(?:\s+[A-Za-z]+)*)\s+\d{5}(?:-\d{4})?",
-    re.I
+# The city/state shapes in order of preference: "City, State 12345",
+# "City, ST", "City, State," and a loose "City, ST" fallback. Each is its
+# own scan; in one alternation a lower tier's match consumes text a higher
+# tier needs ("Broker, St. Louis, MO" came out as "Louis, MO").
+_RE_LOCATION_TIERS = (
+    ("zip", re.compile(
+        r"(?P<city>[A-Za-z][A-Za-z\s\.\-']+?),\s*"
+        rf"(?P<state>{_STATE_NAMES_ALT})\s+\d{{5}}(?:-\d{{4}})?",
+        re.I,
+    )),
+    ("abbrev", re.compile(
+        r"(?P<city>[A-Za-z][A-Za-z\s\.\-']+),\s*"
+        r"(?P<state>[A-Za-z]{2})(?:\s+\d{5}(?:-\d{4})?|\s+United States|\s|$)"
+    )),
+    ("full", re.compile(
+        r"(?P<city>[A-Za-z][A-Za-z\s\.\-']+?),?\s*,\s*"
+        rf"(?P<state>{_STATE_NAMES_ALT})\s*(?=\d{{5}}(?:-\d{{4}})?|$|,)",
+        re.I,
+    )),
+    ("loose", re.compile(r"(?P<city>[A-Za-z][A-Za-z\s\.\-']+),\s*(?P<state>[A-Za-z]{2})\b")),
 )
-
-
-def _safe_text(locator, default: str = "N/A") -> str:
+_RE_PHONE_ONLY = re.compile(r"^[\d\s\-\(\)\.]+$")
+_RE_THREE_DIGITS = re.compile(r"\d{3}")
+
+_LOCATION_LABELS = ("Address", "Location", "City", "Office")
+_LOCATION_BLOCK_CHARS = 500
+_LOCATION_BODY_SLICES = (4000, 20000)
+_COMPANY_CLASS_SELECTORS = ("[class*='company']", "[class*='firm']", "[class*='brokerage']")
+
+# Everything the profile extractors read, collected in one round trip.
+# findByText mirrors get_by_text(label, exact=False) for every label at once:
+# a single text-node walk records, per label, the element owning the first
+# visible text node that contains it. Installed once per context as an init
+# script, with the label and selector lists baked in.
+_PROFILE_FIELDS_JS = """
+window.__bizquestExtract = () => {
+    const locationLabels = %s;
+    const companySelectors = %s;
+    const text = (el) => (el && el.innerText ? el.innerText : "").trim();
+    // Rendered and not visibility:hidden; only checked once a label matches.
+    const visible = (el) => el.getClientRects().length > 0 && getComputedStyle(el).visibility !== "hidden";
+    const findByText = (labels) => {
+        const found = {};
+        let missing = labels.length;
+        const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+        for (let node = walker.nextNode(); node && missing; node = walker.nextNode()) {
+            const parent = node.parentElement;
+            if (!parent || /^(SCRIPT|STYLE|NOSCRIPT)$/.test(parent.tagName)) continue;
+            const value = node.nodeValue.toLowerCase();
+            for (const label of labels) {
+                if (!(label in found) && value.includes(label.toLowerCase()) && visible(parent)) {
+                    found[label] = parent;
+                    missing--;
+                }
+            }
+        }
+        return found;
+    };
+    const labelled = findByText(["Company", ...locationLabels]);
+    const h1 = document.querySelector("h1");
+    const heading = document.querySelector("h1, h2, h3, h4, h5, h6, [role='heading']");
+    const tel = document.querySelector("a[href^='tel:']");
+    const mailto = document.querySelector("a[href^='mailto:']");
+    const companyLabel = labelled["Company"];
+    const main = document.querySelector("main") || document.body;
+    return {
+        h1: text(h1),
+        h1_next: h1 ? text(h1.nextElementSibling) : "",
+        heading: text(heading),
+        heading_next: heading ? text(heading.nextElementSibling) : "",
+        company_label_next: companyLabel ? text(companyLabel.nextElementSibling) : "",
+        company_classes: companySelectors.map((sel) => text(document.querySelector(sel))),
+        location_blocks: locationLabels.flatMap((label) => {
+            const el = labelled[label];
+            return el ? [text(el.parentElement), text(el.nextElementSibling)] : [];
+        }),
+        tel_href: tel ? tel.getAttribute("href") : null,
+        tel_text: tel ? tel.innerText : null,
+        mailto_href: mailto ? mailto.getAttribute("href") : null,
+        body: main ? (main.innerText || "").slice(0, 20000) : "",
+    };
+};
+""" % (json.dumps(_LOCATION_LABELS), json.dumps(_COMPANY_CLASS_SELECTORS))
+
+
+def _new_page(browser: Browser) -> Tuple[BrowserContext, Page]:
+    context = browser.new_context(java_script_enabled=True)
+    context.route("**/*", block_heavy_requests)
+    context.add_init_script(script=_PROFILE_FIELDS_JS)
+    context.set_default_timeout(30000)
+    context.set_default_navigation_timeout(60000)
+    return context, context.new_page()
+
+
+def _wait_for_tab_panel(page: Page, tab, timeout: float = 1000) -> None:
+    # Waits for the clicked tab's own panel when it names one, else any tab
+    # panel; pages that keep polling never reach networkidle.
     try:
-        if locator is None or locator.count() == 0:
-            return default
-        text = locator.first.inner_text(timeout=5000).strip()
-        return text or default
+        panel_id = tab.get_attribute("aria-controls", timeout=500)
+        selector = f"[id='{panel_id}']" if panel_id else "[role='tabpanel']"
+        page.wait_for_selector(selector, state="visible", timeout=timeout)
     except Exception:
-        return default
+        pass
 
 
 def _click_tab_by_role_or_text(page: Page, role_pattern: str, text_fallback: str) -> bool:
@@ -84,7 +184,7 @@ def _click_tab_by_role_or_text(page: Page, role_pattern: str, text_fallback: str
         if el.count() > 0:
             el.scroll_into_view_if_needed(timeout=3000)
             el.click()
-            time.sleep(1.0)
+            _wait_for_tab_panel(page, el)
             return True
     except Exception:
         pass
@@ -93,7 +193,7 @@ def _click_tab_by_role_or_text(page: Page, role_pattern: str, text_fallback: str
         if el.count() > 0:
             el.scroll_into_view_if_needed(timeout=3000)
             el.click()
-            time.sleep(1.0)
+            _wait_for_tab_panel(page, el)
             return True
     except Exception:
         pass
@@ -114,218 +214,188 @@ def _click_show_phone_number(page: Page) -> None:
         if link.count() > 0:
             link.scroll_into_view_if_needed(timeout=3000)
             link.click()
-            time.sleep(0.8)
+            page.wait_for_selector("a[href^='tel:']", timeout=3000)
     except Exception:
         pass
 
 
-def _profile_contains_ecw_keywords(page: Page) -> Tuple[bool, List[str]]:
+def _profile_ecw_keywords(page: Page) -> Optional[List[str]]:
+    # None means the rendered body could not be read, which is not a miss.
     try:
         body = page.inner_text("body", timeout=8000) or ""
-        lower = body.lower()
-        found = [kw for kw in ECW_KEYWORDS if kw in lower]
-        return (len(found) > 0, found)
     except Exception:
-        return (False, [])
+        return None
+    return find_ecw_keywords(body.lower()) if body.strip() else None
 
 
-def _extract_location_from_profile(page: Page) -> str:
-    def parse_city_state(text: str) -> str:
-        if not text or len(text) > 2000:
-            return "N/A"
-        text = text.replace("\u00a0", " ")
-        text = " ".join(text.split())
+def _fetch_profile_html(
+    page: Page,
+    profile_url: str,
+    cached: Optional[Tuple[Optional[BrokerContact], Optional[str], Optional[str]]] = None,
+) -> Optional[APIResponse]:
+    headers: Dict[str, str] = {}
+    if cached is not None:
+        _, etag, last_modified = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    try:
+        return page.request.get(profile_url, headers=headers, timeout=20000)
+    except Exception:
+        return None
 
-        for match in _RE_CITY_STATE_BEFORE_ZIP.finditer(text):
-            city = match.group(1).strip()
-            state_raw = match.group(2).strip()
-            if not city or len(city) > 50 or re.match(r"^\d+$", city):
-                continue
-            state_lower = state_raw.lower()
-            state_abbrev = _STATE_ABBREV.get(state_lower)
-            if state_abbrev:
-                out = f"{city}, {state_abbrev}"
-                if _CITY_STATE_ONLY.match(out):
-                    return out
-
-        for match in _RE_CITY_ST.finditer(text):
-            city = match.group(1).strip()
-            state = match.group(2).strip()
-            if len(state) != 2 or not city or len(city) > 50 or re.match(r"^\d+$", city):
+
+def _html_contains_ecw_keywords(raw_html: str) -> bool:
+    text = _RE_HTML_TAG.sub(" ", _RE_HTML_SKIP.sub(" ", raw_html))
+    lower = " ".join(html.unescape(text).split()).lower()
+    return bool(find_ecw_keywords(lower))
+
+
+def _parse_city_state(text: str) -> str:
+    if not text:
+        return "N/A"
+    text = text.replace("\u00a0", " ")
+    text = " ".join(text.split())
+
+    for tier, pattern in _RE_LOCATION_TIERS:
+        for match in pattern.finditer(text):
+            city = match.group("city").strip()
+            state = match.group("state").strip()
+            if not city or len(city) > 50 or city.isdigit():
                 continue
+            if tier in ("zip", "full"):
+                state = _STATE_ABBREV[state.lower()]
             out = f"{city}, {state}"
             if _CITY_STATE_ONLY.match(out):
                 return out
-        for match in _RE_CITY_FULL_STATE.finditer(text):
-            city = match.group(1).strip()
-            state_raw = match.group(2).strip()
-            if not city or len(city) > 50 or re.match(r"^\d+$", city):
-                continue
-            state_lower = state_raw.lower()
-            state_abbrev = _STATE_ABBREV.get(state_lower)
-            if state_abbrev:
-                out = f"{city}, {state_abbrev}"
-                if _CITY_STATE_ONLY.match(out):
-                    return out
-        for match in re.finditer(r"([A-Za-z][A-Za-z\s\.\-']+),\s*([A-Za-z]{2})\b", text):
-            city, state = match.group(1).strip(), match.group(2).strip()
-            if len(state) == 2 and city and len(city) <= 50 and not re.match(r"^\d+$", city):
-                out = f"{city}, {state}"
-                if _CITY_STATE_ONLY.match(out):
-                    return out
-        return "N/A"
+    return "N/A"
 
-    for label in ["Address", "Location", "City", "Office"]:
-        try:
-            el = page.get_by_text(label, exact=False).first
-            if el.count() == 0:
-                continue
-            parent = el.locator("xpath=..")
-            if parent.count() > 0:
-                block = parent.first.inner_text(timeout=3000).strip()
-                if block:
-                    loc = parse_city_state(block)
-                    if loc != "N/A":
-                        return loc
-            sib = el.locator("xpath=following-sibling::*[1]")
-            if sib.count() > 0:
-                block = sib.first.inner_text(timeout=3000).strip()
-                if block:
-                    loc = parse_city_state(block)
-                    if loc != "N/A":
-                        return loc
-        except Exception:
-            continue
+
+def _read_profile_fields(page: Page) -> Dict:
     try:
-        body_text = page.evaluate(
-            "() => (document.querySelector('main') || document.body || {}).innerText || ''"
-        )
+        return page.evaluate("() => window.__bizquestExtract && window.__bizquestExtract()") or {}
     except Exception:
-        body_text = ""
-    if not body_text or not isinstance(body_text, str):
-        try:
-            body_text = page.inner_text("body", timeout=3000) or ""
-        except Exception:
-            return "N/A"
-    return parse_city_state(body_text[:50000])
+        return {}
+
+
+def _parse_location_block(block: str) -> str:
+    block = block[:_LOCATION_BLOCK_CHARS]
+    for line in block.splitlines():
+        line = line.strip()
+        if len(line) < 60 and _CITY_STATE_ONLY.match(line):
+            loc = _parse_city_state(line)
+            if loc != "N/A":
+                return loc
+    return _parse_city_state(block)
+
+
+def _extract_location_from_profile(fields: Dict) -> str:
+    for block in fields.get("location_blocks") or []:
+        if block:
+            loc = _parse_location_block(block)
+            if loc != "N/A":
+                return loc
+    body = fields.get("body") or ""
+    for limit in _LOCATION_BODY_SLICES:
+        loc = _parse_city_state(body[:limit])
+        if loc != "N/A" or len(body) <= limit:
+            return loc
+    return "N/A"
 
 
-def _extract_phone_from_profile(page: Page) -> str:
-    try:
-        tel = page.locator("a[href^='tel:']").first
-        if tel.count() > 0:
-            href = tel.get_attribute("href")
-            if href and href.startswith("tel:"):
-                num = href.replace("tel:", "").strip().split("?")[0].strip()
-                if num and re.search(r"\d{3}", num):
-                    return num
-            text = tel.inner_text(timeout=2000).strip()
-            if text and re.search(r"\d{3}", text):
-                return text
-    except Exception:
-        pass
+def _extract_phone_from_profile(fields: Dict) -> str:
+    href = (fields.get("tel_href") or "").strip()
+    if href.startswith("tel:"):
+        num = href.replace("tel:", "").strip().split("?")[0].strip()
+        if num and _RE_THREE_DIGITS.search(num):
+            return num
+    text = (fields.get("tel_text") or "").strip()
+    if text and _RE_THREE_DIGITS.search(text):
+        return text
     return "N/A"
 
 
-def _extract_email_from_profile(page: Page) -> str:
-    try:
-        mailto = page.locator("a[href^='mailto:']").first
-        if mailto.count() > 0:
-            href = mailto.get_attribute("href")
-            if href and "@" in href:
-                return href.replace("mailto:", "").strip().split("?")[0].strip()
-    except Exception:
-        pass
+def _extract_email_from_profile(fields: Dict) -> str:
+    href = fields.get("mailto_href") or ""
+    if "@" in href:
+        return href.replace("mailto:", "").strip().split("?")[0].strip()
     return "N/A"
 
 
-def _extract_company_from_profile(page: Page) -> str:
+def _extract_company_from_profile(fields: Dict) -> str:
     def _is_company_like(text: str) -> bool:
         if not text or len(text) > 200:
             return False
         lower = text.lower()
         if lower.startswith("phone") or "show phone" in lower or lower == "share":
             return False
-        if re.match(r"^[\d\s\-\(\)\.]+$", text.strip()):
+        if _RE_PHONE_ONLY.match(text.strip()):
             return False
         return True
 
     def _first_line(s: str) -> str:
         return s.split("\n")[0].strip() if s else ""
 
-    try:
-        heading = page.locator("h1").first
-        if heading.count() > 0:
-            next_el = heading.locator("xpath=following-sibling::*[1]")
-            if next_el.count() > 0:
-                t = _first_line(next_el.inner_text(timeout=2000).strip())
-                if t and _is_company_like(t):
-                    return t
-    except Exception:
-        pass
-    try:
-        heading = page.get_by_role("heading").first
-        if heading.count() > 0:
-            next_el = heading.locator("xpath=following-sibling::*[1]")
-            if next_el.count() > 0:
-                t = _first_line(next_el.inner_text(timeout=2000).strip())
-                if t and _is_company_like(t):
-                    return t
-    except Exception:
-        pass
-    try:
-        company_label = page.get_by_text("Company", exact=False).first
-        if company_label.count() > 0:
-            sib = company_label.locator("xpath=following-sibling::*[1]")
-            if sib.count() > 0:
-                t = _safe_text(sib)
-                if t != "N/A" and _is_company_like(t):
-                    return t
-    except Exception:
-        pass
-    try:
-        for sel in ["[class*='company']", "[class*='firm']", "[class*='brokerage']"]:
-            el = page.locator(sel).first
-            if el.count() > 0:
-                t = _safe_text(el)
-                if t != "N/A" and _is_company_like(t):
-                    return t
-    except Exception:
-        pass
+    for key in ("h1_next", "heading_next"):
+        t = _first_line(fields.get(key) or "")
+        if t and _is_company_like(t):
+            return t
+    candidates = [fields.get("company_label_next") or ""]
+    candidates += fields.get("company_classes") or []
+    for t in candidates:
+        t = (t or "").strip()
+        if t and _is_company_like(t):
+            return t
     return "N/A"
 
 
+@functools.lru_cache(maxsize=8192)
+def _resolve_profile_url(base_url: str, href: str) -> Optional[str]:
+    full = urljoin(base_url, href)
+    return sys.intern(full) if _PROFILE_PATH_RE.search(full) else None
+
+
+def _profile_urls_from_hrefs(hrefs, base_url: str) -> Set[str]:
+    # Root-relative hrefs resolve the same on every listing page, so they are
+    # keyed on the origin and hit the cache across pagination.
+    parts = urlsplit(base_url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    resolved = (
+        _resolve_profile_url(origin if href.startswith("/") and not href.startswith("//") else base_url, href)
+        for href in hrefs
+        if href
+    )
+    return set(filter(None, resolved))
+
+
 def _get_profile_urls_from_page(page: Page, base_url: str) -> Set[str]:
     urls: Set[str] = set()
-    links = page.locator("a[href*='/business-broker/']")
     try:
-        n = links.count()
+        hrefs = page.eval_on_selector_all(
+            "a[href*='/business-broker/']",
+            "els => els.map(e => e.getAttribute('href'))",
+        )
     except Exception:
         return urls
-    for i in range(n):
-        try:
-            href = links.nth(i).get_attribute("href")
-            if not href:
-                continue
-            full = urljoin(base_url, href)
-            if _PROFILE_PATH_RE.search(full):
-                urls.add(full)
-        except Exception:
-            continue
+    urls.update(_profile_urls_from_hrefs(hrefs, base_url))
     return urls
 
 
 def _scroll_to_bottom(page: Page, steps: int = 3) -> None:
-    try:
-        for _ in range(steps):
-            page.evaluate("window.scrollBy(0, window.innerHeight)")
-            time.sleep(0.3)
-        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        time.sleep(0.5)
-    except Exception:
-        pass
+    for _ in range(steps):
+        try:
+            height = page.evaluate(
+                "() => { window.scrollTo(0, document.body.scrollHeight); return document.body.scrollHeight; }"
+            )
+            page.wait_for_function(
+                "h => document.body.scrollHeight > h", arg=height, timeout=1000
+            )
+        except Exception:
+            break
 
 
+@functools.lru_cache(maxsize=256)
 def _directory_page_url(base_url: str, page_num: int) -> str:
     base = base_url.rstrip("/")
     if page_num <= 1:
@@ -333,101 +403,244 @@ def _directory_page_url(base_url: str, page_num: int) -> str:
     return f"{base}/page-{page_num}/"
 
 
+def _fetch_directory_html(page_url: str, user_agent: str) -> Optional[str]:
+    req = urllib.request.Request(page_url, headers={"User-Agent": user_agent})
+    try:
+        with urllib.request.urlopen(req, timeout=20) as resp:
+            charset = resp.headers.get_content_charset() or "utf-8"
+            return resp.read().decode(charset, errors="replace")
+    except Exception:
+        return None
+
+
+def _get_profile_urls_from_html(raw_html: str, base_url: str) -> Set[str]:
+    return _profile_urls_from_hrefs(map(html.unescape, _RE_BROKER_HREF.findall(raw_html)), base_url)
+
+
+def _last_directory_page(raw_html: str) -> Optional[int]:
+    pages = [int(n) for n in _RE_PAGE_HREF.findall(raw_html)]
+    return max(pages) if pages else None
+
+
+def _get_profile_urls_with_browser(page: Page, page_url: str) -> Set[str]:
+    page.goto(page_url, wait_until="domcontentloaded", timeout=60000)
+    try:
+        page.wait_for_selector("a[href*='/business-broker/']", timeout=10000)
+    except Exception:
+        pass
+    _scroll_to_bottom(page)
+    return _get_profile_urls_from_page(page, page_url)
+
+
 def _get_all_profile_urls_from_directory(page: Page, directory_url: str) -> Set[str]:
+    # Listing pages are fetched as plain HTML in parallel batches; only pages
+    # whose HTML has no broker links are rendered in the browser. Page 1 is
+    # fetched alone so its pagination links can bound the next batch, and no
+    # page past the furthest one linked so far is requested. Without a
+    # pagination widget, the walk ends at the first page that adds nothing new
+    # (out-of-range page numbers repeat the last page).
     all_urls: Set[str] = set()
-    max_pages = 60
-    for page_num in range(1, max_pages + 1):
-        page_url = _directory_page_url(directory_url, page_num)
-        try:
-            page.goto(page_url, wait_until="domcontentloaded", timeout=60000)
-            page.wait_for_load_state("load", timeout=20000)
-            time.sleep(1)
-            _scroll_to_bottom(page)
-            time.sleep(0.5)
-            before = len(all_urls)
-            all_urls |= _get_profile_urls_from_page(page, page_url)
-            added = len(all_urls) - before
-            print(f"    Page {page_num}: {added} broker links (total {len(all_urls)})")
-            if added == 0:
+    try:
+        user_agent = page.evaluate("() => navigator.userAgent")
+    except Exception:
+        user_agent = "Mozilla/5.0"
+    page_num = 1
+    furthest: Optional[int] = None
+    with ThreadPoolExecutor(max_workers=DIRECTORY_FETCH_WORKERS) as executor:
+        while page_num <= DIRECTORY_MAX_PAGES:
+            if page_num == 1:
+                last = 1
+            elif furthest is None:
+                last = page_num + DIRECTORY_FETCH_WORKERS - 1
+            elif furthest < page_num:
                 break
-        except Exception as e:
-            print(f"    Page {page_num}: {e}")
-            break
+            else:
+                last = min(furthest, page_num + DIRECTORY_FETCH_WORKERS - 1)
+            batch = range(page_num, min(last, DIRECTORY_MAX_PAGES) + 1)
+            page_urls = [_directory_page_url(directory_url, n) for n in batch]
+            pages_html = list(executor.map(lambda u: _fetch_directory_html(u, user_agent), page_urls))
+            for n, page_url, raw_html in zip(batch, page_urls, pages_html):
+                found = set()
+                if raw_html:
+                    found = _get_profile_urls_from_html(raw_html, page_url)
+                    linked = _last_directory_page(raw_html)
+                    if linked:
+                        furthest = max(furthest or 0, linked)
+                if not found:
+                    try:
+                        found = _get_profile_urls_with_browser(page, page_url)
+                    except Exception as e:
+                        print(f"    Page {n}: {e}")
+                        return all_urls
+                before = len(all_urls)
+                all_urls.update(found)
+                added = len(all_urls) - before
+                print(f"    Page {n}: {added} broker links (total {len(all_urls)})")
+                if added == 0:
+                    return all_urls
+            page_num += len(batch)
     return all_urls
 
 
+def _scrape_profile(
+    page: Page,
+    profile_url: str,
+    cache: Optional[ProfileCache] = None,
+) -> BrokerContact | None:
+    cached = cache.get(profile_url) if cache is not None else None
+    response = _fetch_profile_html(page, profile_url, cached)
+    if response is not None and response.status == 304 and cached is not None:
+        return cached[0]
+
+    etag = last_modified = None
+    raw_html = None
+    if response is not None and response.ok:
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        raw_html = response.text()
+
+    # Without validators a stored outcome could never be revalidated.
+    cacheable = cache is not None and bool(etag or last_modified)
+
+    # Server-rendered HTML already carries the bio tab; only render the
+    # profile in Chromium when the raw page mentions a keyword (or when the
+    # plain fetch fails).
+    if raw_html is not None and not _html_contains_ecw_keywords(raw_html):
+        if cacheable:
+            cache.put(profile_url, None, etag, last_modified)
+        return None
+    # A render that failed to read the page is not cached, or a real match
+    # would be skipped until the page's validators change.
+    contact, read_ok = _render_profile(page, profile_url)
+    if cacheable and read_ok:
+        cache.put(profile_url, contact, etag, last_modified)
+    return contact
+
+
+def _render_profile(page: Page, profile_url: str) -> Tuple[BrokerContact | None, bool]:
+    page.goto(profile_url, wait_until="domcontentloaded", timeout=30000)
+    try:
+        page.wait_for_selector("h1", timeout=10000)
+    except Exception:
+        pass
+    _click_broker_bio_tab(page)
+    keywords_found = _profile_ecw_keywords(page)
+    if not keywords_found:
+        return None, keywords_found is not None
+    _click_company_info_tab(page)
+    _click_show_phone_number(page)
+    fields = _read_profile_fields(page)
+    full_name = fields.get("heading") or fields.get("h1") or "N/A"
+    company = _extract_company_from_profile(fields)
+    location = _extract_location_from_profile(fields)
+    phone = _extract_phone_from_profile(fields)
+    email = _extract_email_from_profile(fields)
+    notes = "; ".join(keywords_found)
+
+    contact = BrokerContact(
+        full_name=full_name,
+        phone_number=phone,
+        location=location,
+        company=company,
+        email=email,
+        source_url=profile_url,
+        notes=notes,
+    )
+    return contact, bool(fields)
+
+
+def _profile_worker(
+    url_queue: "queue.Queue[str]",
+    headless: bool,
+    on_contact: Callable[[BrokerContact], None],
+    cache: Optional[ProfileCache] = None,
+    stop: Optional[threading.Event] = None,
+) -> List[BrokerContact]:
+    # Playwright's sync API is bound to the thread that started it, so every
+    # worker drives its own Playwright instance and browser.
+    contacts: List[BrokerContact] = []
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=headless)
+        context, page = _new_page(browser)
+        while stop is None or not stop.is_set():
+            try:
+                profile_url = url_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                contact = _scrape_profile(page, profile_url, cache)
+            except Exception as e:
+                print(f"  Skip broker {profile_url[:60]}...: {e}")
+                continue
+            if contact is None:
+                continue
+            contacts.append(contact)
+            on_contact(contact)
+        context.close()
+        browser.close()
+    return contacts
+
+
 def _scrape_directory_page(
     page: Page,
     region_name: str,
     directory_url: str,
     seen_urls: Set[str],
     *,
-    sheet_id: str | None = None,
-    worksheet_name: str = "BizQuest",
-    service_account_json: str | None = None,
+    headless: bool = True,
+    workers: int = PROFILE_WORKERS,
+    cache: Optional[ProfileCache] = None,
+    sheet_buffer: Optional[SheetBuffer] = None,
 ) -> List[BrokerContact]:
     contacts: List[BrokerContact] = []
     profile_urls = _get_all_profile_urls_from_directory(page, directory_url)
-    profile_list = sorted(profile_urls)
-    print(f"  Opening {len(profile_list)} broker profiles to check for ECW keywords...")
-    for profile_url in profile_list:
+    url_queue: "queue.Queue[str]" = queue.Queue()
+    for profile_url in sorted(profile_urls):
         if profile_url in seen_urls:
             continue
         seen_urls.add(profile_url)
+        url_queue.put(profile_url)
+    if url_queue.empty():
+        return contacts
+    n_workers = max(1, min(workers, url_queue.qsize()))
+    print(
+        f"  Opening {url_queue.qsize()} broker profiles with {n_workers} workers "
+        "to check for ECW keywords..."
+    )
+
+    def _on_contact(contact: BrokerContact) -> None:
+        print(f"  + {contact.full_name} ({contact.company}) — keywords: {contact.notes}")
+        if sheet_buffer is None:
+            return
         try:
-            page.goto(profile_url, wait_until="domcontentloaded", timeout=30000)
-            page.wait_for_load_state("load", timeout=15000)
-            time.sleep(1)
-            _click_broker_bio_tab(page)
-            time.sleep(0.6)
-            has_keywords, keywords_found = _profile_contains_ecw_keywords(page)
-            if not has_keywords:
-                continue
-            _click_company_info_tab(page)
-            time.sleep(0.8)
-            _click_show_phone_number(page)
-            full_name = _safe_text(page.get_by_role("heading").first)
-            if full_name == "N/A":
-                full_name = _safe_text(page.locator("h1").first)
-            company = _extract_company_from_profile(page)
-            location = _extract_location_from_profile(page)
-            phone = _extract_phone_from_profile(page)
-            email = _extract_email_from_profile(page)
-            notes = "; ".join(keywords_found) if keywords_found else "N/A"
-
-            contacts.append(
-                BrokerContact(
-                    full_name=full_name,
-                    phone_number=phone,
-                    location=location,
-                    company=company,
-                    email=email,
-                    source_url=profile_url,
-                    notes=notes,
-                )
-            )
-            print(f"  + {full_name} ({company}) — keywords: {notes}")
-            if sheet_id and service_account_json:
+            sheet_buffer.add(contact_to_row(contact))
+        except Exception as e:
+            print(f"  (Sheet append failed: {e})")
+
+    stop = threading.Event()
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        futures = [
+            executor.submit(_profile_worker, url_queue, headless, _on_contact, cache, stop)
+            for _ in range(n_workers)
+        ]
+        try:
+            for future in as_completed(futures):
                 try:
-                    df_one = contacts_to_dataframe([contacts[-1]])
-                    row = df_one.astype(str).fillna("").values.tolist()[0]
-                    append_row_to_google_sheet(
-                        row,
-                        sheet_id=sheet_id,
-                        worksheet_name=worksheet_name,
-                        service_account_json_path=service_account_json,
-                    )
+                    contacts.extend(future.result())
                 except Exception as e:
-                    print(f"  (Sheet append failed: {e})")
-        except Exception as e:
-            print(f"  Skip broker {profile_url[:60]}...: {e}")
-            continue
+                    print(f"  Profile worker failed: {e}")
+        except KeyboardInterrupt:
+            # Workers finish the profile in hand and leave the rest queued.
+            stop.set()
+            executor.shutdown(cancel_futures=True)
+            raise
     return contacts
 
 
 def scrape_bizquest_directory(
     headless: bool = True,
     regions: List[Tuple[str, str]] | None = None,
+    use_cache: bool = True,
 ) -> None:
     urls = regions if regions is not None else DIRECTORY_URLS
     all_contacts: List[BrokerContact] = []
@@ -446,27 +659,44 @@ def scrape_bizquest_directory(
     elif SHEET_ID and regions is not None:
         print(f"Appending to existing worksheet {WORKSHEET_NAME!r} (next empty row).")
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=headless)
-        page = browser.new_page()
-        page.set_default_timeout(30000)
-        page.set_default_navigation_timeout(60000)
-
-        for region_name, directory_url in urls:
-            print(f"Scraping: {region_name} — {directory_url}")
-            region_contacts = _scrape_directory_page(
-                page,
-                region_name,
-                directory_url,
-                seen_urls,
-                sheet_id=SHEET_ID or None,
-                worksheet_name=WORKSHEET_NAME,
-                service_account_json=SERVICE_ACCOUNT_JSON,
-            )
-            all_contacts.extend(region_contacts)
-            print(f"  Collected {len(region_contacts)} ECW-matching brokers from {region_name}.")
+    cache = ProfileCache(PROFILE_CACHE_PATH) if use_cache and PROFILE_CACHE_PATH else None
+    sheet_buffer = (
+        SheetBuffer(
+            SHEET_ID,
+            WORKSHEET_NAME,
+            SERVICE_ACCOUNT_JSON,
+            max_rows=SHEET_FLUSH_ROWS,
+            max_age=SHEET_FLUSH_SECONDS,
+        )
+        if SHEET_ID and SERVICE_ACCOUNT_JSON
+        else None
+    )
+    try:
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=headless)
+            context, page = _new_page(browser)
+
+            for region_name, directory_url in urls:
+                print(f"Scraping: {region_name} — {directory_url}")
+                region_contacts = _scrape_directory_page(
+                    page,
+                    region_name,
+                    directory_url,
+                    seen_urls,
+                    headless=headless,
+                    cache=cache,
+                    sheet_buffer=sheet_buffer,
+                )
+                all_contacts.extend(region_contacts)
+                print(f"  Collected {len(region_contacts)} ECW-matching brokers from {region_name}.")
 
-        browser.close()
+            if sheet_buffer is not None:
+                sheet_buffer.close()
+            context.close()
+            browser.close()
+    finally:
+        if cache is not None:
+            cache.close()
 
     df = contacts_to_dataframe(all_contacts)
     df_clean = clean_contacts_dataframe(df)
@@ -488,10 +718,13 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Scrape BizQuest for ECW brokers.")
     parser.add_argument("--ny", action="store_true", help="Scrape New York only (~17 pages)")
     parser.add_argument("--fl", action="store_true", help="Scrape Florida only (~40 pages)")
+    parser.add_argument(
+        "--no-cache", action="store_true", help=f"Re-scrape every profile, ignoring {PROFILE_CACHE_PATH}"
+    )
     args = parser.parse_args()
     regions = None
     if args.ny and not args.fl:
         regions = [("New York", "https://www.bizquest.com/new-york-business-brokers/")]
     elif args.fl and not args.ny:
         regions = [("Florida", "https://www.bizquest.com/florida-business-brokers/")]
-    scrape_bizquest_directory(headless=False, regions=regions)
+    scrape_bizquest_directory(headless=False, regions=regions, use_cache=not args.no_cache)
@@ -1,21 +1,33 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import csv
 import re
-import time
-from typing import List, Optional, Set, Tuple
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, Optional, Set, Tuple
 from urllib.parse import urljoin
 
-from playwright.sync_api import Page, sync_playwright
+from playwright.async_api import BrowserContext, Page, async_playwright
 
+try:
+    import re2 as _body_re
+except ImportError:
+    _body_re = re
+
+from ecw_scraper_browser import block_heavy_requests_async
 from ecw_scraper_data import (
+    CSV_COLUMNS,
+    ECW_KEYWORDS,
     BrokerContact,
     clean_contacts_dataframe,
-    contacts_to_dataframe,
+    contact_to_row,
+    find_ecw_keywords,
+    load_from_csv,
     save_to_csv,
 )
 from ecw_scraper_google_sheets import (
-    append_row_to_google_sheet,
+    SheetBuffer,
     clear_worksheet_data,
     upload_dataframe_to_google_sheet,
 )
@@ -25,23 +37,34 @@ DIRECTORY_URLS: List[Tuple[str, str]] = [
     ("New York", "https://www.businessbroker.net/brokers/new-york.aspx?"),
 ]
 
-ECW_KEYWORDS = [
-    "express car wash",
-    "express wash",
-    "tunnel wash",
-    "car wash",
-    "carwash",
-    "conveyor wash",
-]
-
 OUTPUT_CSV = "businessbroker_ecw_brokers.csv"
 SHEET_ID = "1MMnxeTTlf9noOKmmvGEBl9xPinsNTd12ZXv7lBa6S9A"
 WORKSHEET_NAME = "BusinessBroker"
 SERVICE_ACCOUNT_JSON = "ecw-broker-scraper-ef955c25c30d.json"
+PROFILE_CONCURRENCY = 5
+BROWSER_PROFILE_DIR = ".businessbroker_browser"
+SHEET_FLUSH_ROWS = 25
+SHEET_FLUSH_SECONDS = 30.0
+
+# Matches any keyword in raw profile HTML; words may be split by whitespace,
+# &nbsp; or inline tags, which innerText would have collapsed to a space.
+_KW_RE = re.compile(
+    "|".join(
+        r"(?:\s|&nbsp;|&#160;|<[^>]*>)+".join(re.escape(word) for word in kw.split())
+        for kw in ECW_KEYWORDS
+    ),
+    re.I,
+)
+# The Sold Listings section is lazy-loaded on the rendered page. Raw HTML is
+# only taken as the whole profile when it already carries that heading.
+_RE_SOLD_LISTINGS_HTML = re.compile(r"<h[1-6][^>]*>(?:\s|<[^>]*>)*sold\s+listings", re.I)
 
-_PROFILE_URL_RE = re.compile(r"/brokers/[a-z0-9][a-z0-9\-]+-\d+\.aspx", re.I)
-
-_CITY_STATE_ONLY = re.compile(r"^[^,]+,\s*[A-Za-z]{2}$")
+# Patterns run over page text use RE2 when google-re2 is installed (no
+# backtracking), else the stdlib engine. Keep them RE2-compatible: inline
+# flags only, no lookarounds or backreferences.
+# Matched against the lowercased URL, so no case-folding in the engine.
+_PROFILE_URL_RE = _body_re.compile(r"/brokers/[a-z0-9][a-z0-9\-]+-\d+\.aspx")
+_LISTING_PAGE_MARKERS = ("brokers.aspx", "florida.aspx", "new-york.aspx")
 
 _US_STATE_ABBREV = {
     "alabama": "AL", "alaska": "AK", "arizona": "AZ", "arkansas": "AR", "california": "CA",
@@ -57,292 +80,471 @@ _US_STATE_ABBREV = {
     "west virginia": "WV", "wisconsin": "WI", "wyoming": "WY", "district of columbia": "DC",
 }
 
-_RE_CITY_STATE_ZIP = re.compile(
-    r"([A-Za-z][A-Za-z\s\.\-']+?),\s*([A-Za-z]+(?:\s+[A-Za-z]+)*)\s+(\d{5}(?:-\d{4})?)",
-    re.I,
+_US_STATE_CODES = frozenset(_US_STATE_ABBREV.values())
+
+# "City, State 12345" (state as a name or two letters) and the looser
+# "City, ST" in one pattern; ZIP-bearing matches win, else the first "City, ST".
+_STATE_NAMES_ALT = "|".join(
+    re.escape(name) for name in sorted(_US_STATE_ABBREV, key=len, reverse=True)
 )
-_RE_CITY_ST = re.compile(
-    r"([A-Za-z][A-Za-z\s\.\-']+),\s*([A-Za-z]{2})(?:\s+\d{5}|\s|$)"
+_RE_LOCATION = _body_re.compile(
+    r"(?i)(?P<zip_city>[A-Za-z][A-Za-z\s\.\-']+?),\s*"
+    rf"(?P<zip_state>{_STATE_NAMES_ALT}|[A-Za-z]{{2}})\s+\d{{5}}(?:-\d{{4}})?"
+    r"|(?P<st_city>[A-Za-z][A-Za-z\s\.\-']+),\s*(?P<st_state>[A-Za-z]{2})(?:\s+\d{5}|\s|$)"
 )
-
-
-
-def _safe_text(locator, default: str = "N/A") -> str:
-    try:
-        if locator is None or locator.count() == 0:
-            return default
-        text = locator.first.inner_text(timeout=5000).strip()
-        return text or default
-    except Exception:
-        return default
+_RE_CITY_ST = _body_re.compile(r"([A-Za-z][A-Za-z\s\.\-']+),\s*([A-Za-z]{2})(?:\s+\d{5}|\s|$)")
+_RE_PHONE_IN_BODY = _body_re.compile(r"\(?\d{3}\)?[\s.\-]?\d{3}[\s.\-]?\d{4}")
+_RE_EMAIL_IN_BODY = _body_re.compile(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}")
+_RE_HAS_3DIGITS = re.compile(r"\d{3}")
+
+# Everything the profile extractors read, in one round trip. The Company
+# lookup mirrors get_by_text("Company", exact=False) followed by its next
+# sibling element.
+_PROFILE_JS = """
+() => {
+    const text = (el) => (el && el.innerText ? el.innerText : "");
+    const h1 = document.querySelector("h1");
+    const h2 = document.querySelector("h2");
+    const tel = document.querySelector("a[href^='tel:']");
+    const mailto = document.querySelector("a[href^='mailto:']");
+    let companyLabel = null;
+    const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+    for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+        const parent = node.parentElement;
+        if (!parent || /^(SCRIPT|STYLE|NOSCRIPT)$/.test(parent.tagName)) continue;
+        if (node.nodeValue.toLowerCase().includes("company")) {
+            companyLabel = parent;
+            break;
+        }
+    }
+    return {
+        h1: text(h1),
+        h2: text(h2),
+        company_label_next: companyLabel ? text(companyLabel.nextElementSibling) : "",
+        tel_href: tel ? tel.getAttribute("href") : null,
+        tel_text: tel ? tel.innerText : null,
+        mailto_href: mailto ? mailto.getAttribute("href") : null,
+        body: document.body ? document.body.innerText : "",
+    };
+}
+"""
 
 
 def _normalize_state(state_raw: str) -> Optional[str]:
     s = (state_raw or "").strip()
-    if len(s) == 2 and s.isalpha():
-        return s.upper()
+    if len(s) == 2:
+        up = s.upper()
+        return up if up in _US_STATE_CODES else None
     return _US_STATE_ABBREV.get(s.lower())
 
 
-def _scroll_to_bottom(page: Page, steps: int = 5, pause: float = 0.5) -> None:
+# Keeps scrolling to the bottom until scrollHeight is unchanged between two
+# polls, i.e. lazy-loaded content has stopped arriving.
+_SCROLL_UNTIL_STABLE_JS = """
+() => {
+    const h = document.body.scrollHeight;
+    if (h === window.__lastScrollHeight) return true;
+    window.__lastScrollHeight = h;
+    window.scrollTo(0, h);
+    return false;
+}
+"""
+
+
+async def _scroll_to_bottom(page: Page, timeout: float = 5000) -> None:
     try:
-        for _ in range(steps):
-            page.evaluate("window.scrollBy(0, window.innerHeight)")
-            time.sleep(pause)
-        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        time.sleep(1.0)
+        await page.evaluate("window.__lastScrollHeight = -1")
+        await page.wait_for_function(_SCROLL_UNTIL_STABLE_JS, polling=500, timeout=timeout)
     except Exception:
         pass
 
 
 
-def _get_profile_urls_from_state_page(page: Page, state_url: str) -> List[str]:
+async def _get_profile_urls_from_state_page(page: Page, state_url: str) -> List[str]:
     urls: List[str] = []
     seen: Set[str] = set()
 
     try:
         search_btn = page.locator("input[value='SEARCH'], button:has-text('SEARCH')").first
-        if search_btn.count() > 0:
-            search_btn.click()
-            time.sleep(2)
+        if await search_btn.count() > 0:
+            await search_btn.click()
+            await asyncio.sleep(2)
     except Exception:
         pass
 
-    _scroll_to_bottom(page, steps=6, pause=0.8)
+    await _scroll_to_bottom(page, timeout=8000)
 
-    links = page.locator("a[href*='/brokers/']")
     try:
-        n = links.count()
+        hrefs = await page.eval_on_selector_all(
+            "a[href*='/brokers/']",
+            "els => els.map(e => e.getAttribute('href')).filter(Boolean)",
+        )
     except Exception:
         return urls
-    for i in range(n):
-        try:
-            href = links.nth(i).get_attribute("href")
-            if not href:
-                continue
-            full = urljoin(state_url, href)
-            if _PROFILE_URL_RE.search(full) and full not in seen:
-                if "brokers.aspx" in full.lower() or "florida.aspx" in full.lower() or "new-york.aspx" in full.lower():
-                    continue
-                seen.add(full)
-                urls.append(full)
-        except Exception:
+    for href in hrefs:
+        full = urljoin(state_url, href)
+        if full in seen:
+            continue
+        full_l = full.lower()
+        if not _PROFILE_URL_RE.search(full_l):
             continue
+        if any(marker in full_l for marker in _LISTING_PAGE_MARKERS):
+            continue
+        seen.add(full)
+        urls.append(full)
     return urls
 
 
 
-def _profile_contains_ecw_keywords(page: Page) -> Tuple[bool, List[str]]:
-    try:
-        body = page.inner_text("body", timeout=10000) or ""
-        lower = body.lower()
-        found = [kw for kw in ECW_KEYWORDS if kw in lower]
-        return (len(found) > 0, found)
-    except Exception:
-        return (False, [])
+def _profile_contains_ecw_keywords(body: str) -> Tuple[bool, List[str]]:
+    found = find_ecw_keywords(body.lower())
+    return (len(found) > 0, found)
 
 
-def _extract_name(page: Page) -> str:
+async def _read_profile(page: Page) -> Dict[str, Optional[str]]:
     try:
-        h1 = page.locator("h1").first
-        if h1.count() > 0:
-            text = h1.inner_text(timeout=5000).strip()
-            if text:
-                return text
+        return await page.evaluate(_PROFILE_JS) or {}
     except Exception:
-        pass
-    return "N/A"
+        return {}
 
 
-def _extract_company(page: Page) -> str:
-    try:
-        h2 = page.locator("h2").first
-        if h2.count() > 0:
-            text = h2.inner_text(timeout=5000).strip()
-            lower = text.lower()
-            if text and len(text) < 200 and "company overview" not in lower and "broker profile" not in lower and "services offered" not in lower and "areas served" not in lower:
-                return text
-    except Exception:
-        pass
-    try:
-        company_label = page.get_by_text("Company", exact=False).first
-        if company_label.count() > 0:
-            sib = company_label.locator("xpath=following-sibling::*[1]")
-            if sib.count() > 0:
-                text = sib.first.inner_text(timeout=2000).strip()
-                if text and len(text) < 200:
-                    return text
-    except Exception:
-        pass
+def _extract_name(data: Dict[str, Optional[str]]) -> str:
+    return (data.get("h1") or "").strip() or "N/A"
+
+
+def _extract_company(data: Dict[str, Optional[str]]) -> str:
+    text = (data.get("h2") or "").strip()
+    lower = text.lower()
+    if text and len(text) < 200 and "company overview" not in lower and "broker profile" not in lower and "services offered" not in lower and "areas served" not in lower:
+        return text
+    text = (data.get("company_label_next") or "").strip()
+    if text and len(text) < 200:
+        return text
     return "N/A"
 
 
-def _extract_phone(page: Page) -> str:
-    try:
-        tel = page.locator("a[href^='tel:']").first
-        if tel.count() > 0:
-            href = tel.get_attribute("href")
-            if href and href.startswith("tel:"):
-                num = href.replace("tel:", "").strip().split("?")[0].strip()
-                if num and re.search(r"\d{3}", num):
-                    return num
-            text = tel.inner_text(timeout=2000).strip()
-            if text and re.search(r"\d{3}", text):
-                return text
-    except Exception:
-        pass
-    try:
-        body = page.inner_text("body", timeout=5000) or ""
-        match = re.search(r"\(?\d{3}\)?[\s.\-]?\d{3}[\s.\-]?\d{4}", body[:5000])
-        if match:
-            return match.group(0).strip()
-    except Exception:
-        pass
+def _extract_phone(data: Dict[str, Optional[str]]) -> str:
+    href = data.get("tel_href")
+    if href and href.startswith("tel:"):
+        num = href.replace("tel:", "").strip().split("?")[0].strip()
+        if num and _RE_HAS_3DIGITS.search(num):
+            return num
+    text = (data.get("tel_text") or "").strip()
+    if text and _RE_HAS_3DIGITS.search(text):
+        return text
+    body = data.get("body") or ""
+    match = _RE_PHONE_IN_BODY.search(body, 0, 5000)
+    if match:
+        return match.group(0).strip()
     return "N/A"
 
 
-def _extract_location(page: Page) -> str:
-    try:
-        body = page.inner_text("body", timeout=5000) or ""
-        body = body[:10000].replace("\u00a0", " ")
-        text = " ".join(body.split())
-    except Exception:
-        return "N/A"
+def _extract_location(data: Dict[str, Optional[str]]) -> str:
+    # str.split() already treats non-breaking spaces as whitespace.
+    text = " ".join((data.get("body") or "")[:10000].split())
 
-    for match in _RE_CITY_STATE_ZIP.finditer(text):
-        city = match.group(1).strip()
-        state_raw = match.group(2).strip()
-        if not city or len(city) > 50 or re.match(r"^\d+$", city):
-            continue
-        state_abbrev = _normalize_state(state_raw)
-        if state_abbrev:
-            city_title = city.title() if city.isupper() else city
-            out = f"{city_title}, {state_abbrev}"
-            if _CITY_STATE_ONLY.match(out):
-                return out
-
-    for match in _RE_CITY_ST.finditer(text):
-        city = match.group(1).strip()
-        state = match.group(2).strip().upper()
-        if not city or len(city) > 50 or re.match(r"^\d+$", city):
+    fallback = None
+    for match in _RE_LOCATION.finditer(text):
+        if match.group("zip_city") is not None:
+            city = match.group("zip_city").strip()
+            state = _normalize_state(match.group("zip_state"))
+            # The city groups start with a letter, so only the length can fail.
+            if state and len(city) <= 50:
+                return f"{city.title() if city.isupper() else city}, {state}"
+            if fallback is not None:
+                continue
+            # A rejected ZIP match may hide a bare "City, ST" at the same spot.
+            match = _RE_CITY_ST.match(text, match.start())
+            if not match:
+                continue
+            city, st = match.group(1).strip(), match.group(2)
+        elif fallback is None:
+            city, st = match.group("st_city").strip(), match.group("st_state")
+        else:
             continue
-        city_title = city.title() if city.isupper() else city
-        out = f"{city_title}, {state}"
-        if _CITY_STATE_ONLY.match(out):
-            return out
+        if len(city) <= 50:
+            fallback = f"{city.title() if city.isupper() else city}, {st.upper()}"
 
+    return fallback or "N/A"
+
+
+def _extract_email(data: Dict[str, Optional[str]]) -> str:
+    href = data.get("mailto_href")
+    if href and "@" in href:
+        return href.replace("mailto:", "").strip().split("?")[0].strip()
+    body = data.get("body") or ""
+    match = _RE_EMAIL_IN_BODY.search(body, 0, 10000)
+    if match:
+        return match.group(0)
     return "N/A"
 
 
-def _extract_email(page: Page) -> str:
+
+class _ProfileHTMLParser(HTMLParser):
+    # Pulls the same fields as _PROFILE_JS out of server-rendered HTML. The
+    # "Company" label's sibling is not tracked, so that fallback needs a render.
+    # Like innerText, only <body> is read and hidden subtrees are left out.
+    _SKIP = {"head", "title", "script", "style", "noscript", "template"}
+    _BLOCK = {"p", "div", "br", "li", "tr", "h1", "h2", "h3", "h4", "h5", "h6", "section", "article"}
+    _VOID = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"}
+    _RE_HIDDEN_STYLE = re.compile(r"display\s*:\s*none|visibility\s*:\s*hidden", re.I)
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.data: Dict[str, Optional[str]] = {
+            "h1": "", "h2": "", "company_label_next": "",
+            "tel_href": None, "tel_text": None, "mailto_href": None,
+        }
+        self._body: List[str] = []
+        self._in_body = False
+        self._skip = 0
+        self._hidden_tag: Optional[str] = None
+        self._hidden_depth = 0
+        self._heading: Optional[str] = None
+        self._in_tel = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "body":
+            self._in_body = True
+        if tag in self._SKIP:
+            self._skip += 1
+            return
+        if self._hidden_tag is not None:
+            if tag == self._hidden_tag:
+                self._hidden_depth += 1
+            return
+        attrs = dict(attrs)
+        if tag not in self._VOID and (
+            "hidden" in attrs
+            or (attrs.get("aria-hidden") or "").lower() == "true"
+            or self._RE_HIDDEN_STYLE.search(attrs.get("style") or "")
+        ):
+            self._hidden_tag = tag
+            self._hidden_depth = 1
+            return
+        if tag in self._BLOCK:
+            self._body.append("\n")
+        if tag in ("h1", "h2") and not self.data[tag]:
+            self._heading = tag
+        if tag == "a":
+            href = (attrs.get("href") or "").strip()
+            if href.startswith("tel:") and self.data["tel_href"] is None:
+                self.data["tel_href"] = href
+                self.data["tel_text"] = ""
+                self._in_tel = True
+            elif href.startswith("mailto:") and self.data["mailto_href"] is None:
+                self.data["mailto_href"] = href
+
+    def handle_endtag(self, tag):
+        if tag in self._SKIP:
+            self._skip = max(0, self._skip - 1)
+        elif self._hidden_tag is not None:
+            if tag == self._hidden_tag:
+                self._hidden_depth -= 1
+                if not self._hidden_depth:
+                    self._hidden_tag = None
+        elif tag == "body":
+            self._in_body = False
+        elif tag == self._heading:
+            self._heading = None
+        elif tag == "a":
+            self._in_tel = False
+
+    def handle_data(self, data):
+        if self._skip or self._hidden_tag is not None or not self._in_body:
+            return
+        self._body.append(data)
+        if self._heading:
+            self.data[self._heading] += data
+        if self._in_tel:
+            self.data["tel_text"] += data
+
+    def result(self) -> Dict[str, Optional[str]]:
+        for key in ("h1", "h2", "tel_text"):
+            if self.data[key]:
+                self.data[key] = " ".join(self.data[key].split())
+        self.data["body"] = "".join(self._body).replace("\u00a0", " ")
+        return self.data
+
+
+def _parse_profile_html(raw_html: str) -> Dict[str, Optional[str]]:
+    parser = _ProfileHTMLParser()
     try:
-        mailto = page.locator("a[href^='mailto:']").first
-        if mailto.count() > 0:
-            href = mailto.get_attribute("href")
-            if href and "@" in href:
-                return href.replace("mailto:", "").strip().split("?")[0].strip()
+        parser.feed(raw_html)
+        parser.close()
     except Exception:
         pass
+    return parser.result()
+
+
+async def _fetch_profile_html(page: Page, profile_url: str) -> Optional[str]:
     try:
-        body = page.inner_text("body", timeout=3000) or ""
-        match = re.search(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}", body[:10000])
-        if match:
-            return match.group(0)
+        response = await page.request.get(profile_url, timeout=20000)
+        if not response.ok:
+            return None
+        return await response.text()
+    except Exception:
+        return None
+
+
+def _contact_from_data(
+    data: Dict[str, Optional[str]], profile_url: str, keywords_found: List[str]
+) -> BrokerContact:
+    return BrokerContact(
+        full_name=_extract_name(data),
+        phone_number=_extract_phone(data),
+        location=_extract_location(data),
+        company=_extract_company(data),
+        email=_extract_email(data),
+        source_url=profile_url,
+        notes="; ".join(keywords_found) if keywords_found else "N/A",
+    )
+
+
+async def _scrape_profile(page: Page, profile_url: str) -> Optional[BrokerContact]:
+    # Server-rendered profiles are handled from one plain GET when the raw
+    # HTML already holds the Sold Listings section: no keyword in it means no
+    # match, and a parse that yields a name and company skips the browser.
+    # Failed fetches, lazy sold listings and incomplete parses get a render,
+    # so the notes also list keywords that only a sold listing carries.
+    raw_html = await _fetch_profile_html(page, profile_url)
+    if raw_html is not None:
+        sold_in_html = _RE_SOLD_LISTINGS_HTML.search(raw_html) is not None
+        if not _KW_RE.search(raw_html):
+            if sold_in_html:
+                return None
+        else:
+            data = _parse_profile_html(raw_html)
+            has_keywords, keywords_found = _profile_contains_ecw_keywords(data.get("body") or "")
+            if has_keywords:
+                contact = _contact_from_data(data, profile_url, keywords_found)
+                if sold_in_html and contact.full_name != "N/A" and contact.company != "N/A":
+                    return contact
+
+    for attempt in range(2):
+        try:
+            await page.goto(profile_url, wait_until="domcontentloaded", timeout=60000)
+            break
+        except Exception as e:
+            if attempt == 0:
+                continue
+            raise e
+    try:
+        await page.wait_for_load_state("networkidle", timeout=10000)
     except Exception:
         pass
-    return "N/A"
 
+    # Sold Listings are lazy-loaded, so scroll before the keyword check or a
+    # broker whose only match is a sold listing would be rejected.
+    await _scroll_to_bottom(page)
+
+    data = await _read_profile(page)
+    has_keywords, keywords_found = _profile_contains_ecw_keywords(data.get("body") or "")
+    if not has_keywords:
+        return None
+    return _contact_from_data(data, profile_url, keywords_found)
 
 
-def _scrape_state(
-    page: Page,
+async def _scrape_state(
+    pages: List[Page],
     state_name: str,
     state_url: str,
     seen_urls: Set[str],
     *,
-    sheet_id: Optional[str] = None,
-    worksheet_name: str = "BusinessBroker",
-    service_account_json: Optional[str] = None,
+    sheet_buffer: Optional[SheetBuffer] = None,
+    write_row: Optional[Callable[[List[str]], None]] = None,
 ) -> List[BrokerContact]:
     contacts: List[BrokerContact] = []
 
-    page.goto(state_url, wait_until="domcontentloaded", timeout=60000)
-    page.wait_for_load_state("load", timeout=30000)
-    time.sleep(2)
+    page = pages[0]
+    await page.goto(state_url, wait_until="domcontentloaded", timeout=60000)
+    await page.wait_for_load_state("load", timeout=30000)
+    await asyncio.sleep(2)
 
-    profile_urls = _get_profile_urls_from_state_page(page, state_url)
+    profile_urls = await _get_profile_urls_from_state_page(page, state_url)
     print(f"  Found {len(profile_urls)} broker profiles on the page.")
 
+    url_queue: "asyncio.Queue[str]" = asyncio.Queue()
     for profile_url in profile_urls:
-        if profile_url in seen_urls:
-            continue
+        before = len(seen_urls)
         seen_urls.add(profile_url)
-
-        try:
-            for attempt in range(2):
-                try:
-                    page.goto(profile_url, wait_until="domcontentloaded", timeout=60000)
-                    page.wait_for_load_state("load", timeout=30000)
-                    break
-                except Exception as e:
-                    if attempt == 0:
-                        continue
-                    raise e
-
-            time.sleep(1)
-
-            _scroll_to_bottom(page, steps=5, pause=0.5)
-            time.sleep(1)
-
-            has_keywords, keywords_found = _profile_contains_ecw_keywords(page)
-            if not has_keywords:
+        if len(seen_urls) == before:
+            continue
+        url_queue.put_nowait(profile_url)
+
+    async def _worker(worker_page: Page) -> None:
+        while True:
+            try:
+                profile_url = url_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                contact = await _scrape_profile(worker_page, profile_url)
+            except Exception as e:
+                print(f"  Skip broker {profile_url[:80]}...: {e}")
+                continue
+            if contact is None:
                 continue
-
-            full_name = _extract_name(page)
-            company = _extract_company(page)
-            phone = _extract_phone(page)
-            location = _extract_location(page)
-            email = _extract_email(page)
-            notes = "; ".join(keywords_found) if keywords_found else "N/A"
-
-            contact = BrokerContact(
-                full_name=full_name,
-                phone_number=phone,
-                location=location,
-                company=company,
-                email=email,
-                source_url=profile_url,
-                notes=notes,
-            )
             contacts.append(contact)
-            print(f"  + {full_name} ({company}) — keywords: {notes}")
-
-            if sheet_id and service_account_json:
-                try:
-                    df_one = contacts_to_dataframe([contact])
-                    row = df_one.astype(str).fillna("").values.tolist()[0]
-                    append_row_to_google_sheet(
-                        row,
-                        sheet_id=sheet_id,
-                        worksheet_name=worksheet_name,
-                        service_account_json_path=service_account_json,
-                    )
-                except Exception as e:
-                    print(f"  (Sheet append failed: {e})")
+            print(f"  + {contact.full_name} ({contact.company}) — keywords: {contact.notes}")
 
-        except Exception as e:
-            print(f"  Skip broker {profile_url[:80]}...: {e}")
-            continue
+            row = contact_to_row(contact)
+            if write_row is not None:
+                write_row(row)
+            if sheet_buffer is not None:
+                sheet_buffer.add(row)
 
+    await asyncio.gather(*(_worker(worker_page) for worker_page in pages))
     return contacts
 
 
+async def _open_pages(context: BrowserContext, count: int) -> List[Page]:
+    await context.route("**/*", block_heavy_requests_async)
+    context.set_default_timeout(30000)
+    context.set_default_navigation_timeout(60000)
+    pages: List[Page] = list(context.pages[:count])
+    while len(pages) < count:
+        pages.append(await context.new_page())
+    return pages
+
+
+async def _scrape_regions(
+    urls: List[Tuple[str, str]],
+    seen_urls: Set[str],
+    concurrency: int,
+    headless: bool = True,
+    sheet_buffer: Optional[SheetBuffer] = None,
+    write_row: Optional[Callable[[List[str]], None]] = None,
+) -> None:
+    async with async_playwright() as p:
+        # A persistent profile keeps cookies, open connections and Chromium's
+        # disk cache across profiles and across runs.
+        context = await p.chromium.launch_persistent_context(
+            BROWSER_PROFILE_DIR, headless=headless
+        )
+        pages = await _open_pages(context, max(1, concurrency))
+
+        for state_name, state_url in urls:
+            print(f"Scraping: {state_name} — {state_url}")
+            state_contacts = await _scrape_state(
+                pages,
+                state_name,
+                state_url,
+                seen_urls,
+                sheet_buffer=sheet_buffer,
+                write_row=write_row,
+            )
+            print(f"  Collected {len(state_contacts)} ECW-matching brokers from {state_name}.")
+
+        await context.close()
+
 
 def scrape_businessbroker_directory(
     regions: Optional[List[Tuple[str, str]]] = None,
+    concurrency: int = PROFILE_CONCURRENCY,
+    headless: bool = True,
 ) -> None:
     urls = regions if regions is not None else DIRECTORY_URLS
-    all_contacts: List[BrokerContact] = []
     seen_urls: Set[str] = set()
 
     if SHEET_ID and regions is None:
@@ -358,35 +560,38 @@ def scrape_businessbroker_directory(
     elif SHEET_ID and regions is not None:
         print(f"Appending to existing worksheet {WORKSHEET_NAME!r} (next empty row).")
 
-    try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=False)
-            page = browser.new_page()
-            page.set_default_timeout(30000)
-            page.set_default_navigation_timeout(60000)
-
-            for state_name, state_url in urls:
-                print(f"Scraping: {state_name} — {state_url}")
-                state_contacts = _scrape_state(
-                    page,
-                    state_name,
-                    state_url,
-                    seen_urls,
-                    sheet_id=SHEET_ID or None,
-                    worksheet_name=WORKSHEET_NAME,
-                    service_account_json=SERVICE_ACCOUNT_JSON,
+    sheet_buffer = (
+        SheetBuffer(
+            SHEET_ID,
+            WORKSHEET_NAME,
+            SERVICE_ACCOUNT_JSON,
+            max_rows=SHEET_FLUSH_ROWS,
+            max_age=SHEET_FLUSH_SECONDS,
+        )
+        if SHEET_ID and SERVICE_ACCOUNT_JSON
+        else None
+    )
+    # Matches are streamed to the CSV as they are found, so an interrupted
+    # run loses nothing; the file is deduped and rewritten once at the end.
+    with open(OUTPUT_CSV, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_COLUMNS)
+        try:
+            asyncio.run(
+                _scrape_regions(
+                    urls, seen_urls, concurrency, headless, sheet_buffer, writer.writerow
                 )
-                all_contacts.extend(state_contacts)
-                print(f"  Collected {len(state_contacts)} ECW-matching brokers from {state_name}.")
-
-            browser.close()
-    except KeyboardInterrupt:
-        print("\nStopped by user (Ctrl+C). Saving what we have so far...")
+            )
+        except KeyboardInterrupt:
+            print("\nStopped by user (Ctrl+C). Saving what we have so far...")
+        finally:
+            if sheet_buffer is not None:
+                sheet_buffer.close()
 
-    df = contacts_to_dataframe(all_contacts)
+    df = load_from_csv(OUTPUT_CSV)
     df_clean = clean_contacts_dataframe(df)
     save_to_csv(df_clean, OUTPUT_CSV)
-    print(f"Total ECW-matching brokers: {len(all_contacts)}. After de-dup: {len(df_clean)}. Saved: {OUTPUT_CSV}")
+    print(f"Total ECW-matching brokers: {len(df)}. After de-dup: {len(df_clean)}. Saved: {OUTPUT_CSV}")
 
     if SHEET_ID and regions is None:
         print(f"Uploading final deduped list to worksheet {WORKSHEET_NAME!r}...")
@@ -405,6 +610,7 @@ if __name__ == "__main__":
     )
     parser.add_argument("--fl", action="store_true", help="Scrape Florida only.")
     parser.add_argument("--ny", action="store_true", help="Scrape New York only.")
+    parser.add_argument("--headful", action="store_true", help="Show the browser window.")
     args = parser.parse_args()
 
     regions = None
@@ -413,4 +619,4 @@ if __name__ == "__main__":
     elif args.ny and not args.fl:
         regions = [("New York", "https://www.businessbroker.net/brokers/new-york.aspx?")]
 
-    scrape_businessbroker_directory(regions=regions)
+    scrape_businessbroker_directory(regions=regions, headless=not args.headful)
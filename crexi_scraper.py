@@ -1,21 +1,33 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import csv
 import random
 import re
+import threading
 import time
-from typing import List, Optional, Set, Tuple
+from itertools import chain
+from typing import Callable, Dict, List, Optional, Set, Tuple
 from urllib.parse import urljoin
 
-from playwright.sync_api import Page, sync_playwright
+from playwright.async_api import BrowserContext, Page, async_playwright
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+from ecw_scraper_browser import block_heavy_requests_async
 from ecw_scraper_data import (
+    CSV_COLUMNS,
     BrokerContact,
     clean_contacts_dataframe,
-    contacts_to_dataframe,
+    contact_to_row,
+    load_from_csv,
     save_to_csv,
 )
-from ecw_scraper_google_sheets import append_row_to_google_sheet
+from ecw_scraper_google_sheets import SheetBuffer
 
 DIRECTORY_URL = (
     "https://www.crexi.com/resources/find-a-broker/Florida/Special_Purpose/"
@@ -27,6 +39,13 @@ NY_DIRECTORY_URL = (
     "CCIM%2CSIOR%2CNAIOP%2CREALTOR%2CCREW%2CCRRP%2CICSC"
 )
 
+# Profiles are scraped by this many pages sharing one browser context (and
+# its Cloudflare clearance); keep it low to stay under per-IP rate limits.
+PROFILE_CONCURRENCY = 4
+
+# Matches are appended to the sheet in batches rather than one API call each.
+SHEET_FLUSH_ROWS = 20
+
 START_PAGE = 1
 COLLECT_PAGES = 50
 # NY directory: scrape only page 21 (directory ends at page 21)
@@ -57,12 +76,31 @@ KEYWORDS = [
     "slb",
 ]
 
+_KEYWORDS_LOWER = tuple(kw.lower() for kw in KEYWORDS)
+_RE_KEYWORDS = re.compile(
+    "(?=("
+    + "|".join(re.escape(kw) for kw in sorted(_KEYWORDS_LOWER, key=len, reverse=True))
+    + "))"
+)
+_KEYWORDS_JS_ALT = "|".join(re.escape(kw) for kw in _KEYWORDS_LOWER)
+_KEYWORDS_WITHIN = {kw: {k for k in _KEYWORDS_LOWER if k in kw} for kw in _KEYWORDS_LOWER}
+
+# pyahocorasick, when installed, reports every (overlapping) keyword in one
+# pass; otherwise the lookahead regex above is used.
+_KEYWORDS_AUTOMATON = None
+if ahocorasick is not None:
+    _KEYWORDS_AUTOMATON = ahocorasick.Automaton()
+    for _kw in _KEYWORDS_LOWER:
+        _KEYWORDS_AUTOMATON.add_word(_kw, _kw)
+    _KEYWORDS_AUTOMATON.make_automaton()
+
 OUTPUT_CSV = "crexi_ecw_brokers.csv"
 SHEET_ID = "1MMnxeTTlf9noOKmmvGEBl9xPinsNTd12ZXv7lBa6S9A"
 WORKSHEET_NAME = "CRE Brokers"
 SERVICE_ACCOUNT_JSON = "ecw-broker-scraper-ef955c25c30d.json"
-
-_CITY_STATE_ONLY = re.compile(r"^[^,]+,\s*[A-Za-z]{2}$")
+# Profile URLs that redirected away from a profile page, kept across runs so a
+# restart doesn't navigate to them again.
+REDIRECTS_FILE = "crexi_redirected_profiles.txt"
 
 _US_STATE_ABBREV = {
     "alabama": "AL", "alaska": "AK", "arizona": "AZ", "arkansas": "AR", "california": "CA",
@@ -77,228 +115,294 @@ _US_STATE_ABBREV = {
     "texas": "TX", "utah": "UT", "vermont": "VT", "virginia": "VA", "washington": "WA",
     "west virginia": "WV", "wisconsin": "WI", "wyoming": "WY", "district of columbia": "DC",
 }
+_US_STATE_CODES = frozenset(_US_STATE_ABBREV.values())
+_STATE_MAP = {**_US_STATE_ABBREV, **{code.lower(): code for code in _US_STATE_CODES}}
 
-_PHONE_PATTERNS = [
-    r"\(?\d{3}\)?[\s.\-]?\d{3}[\s.\-]?\d{4}",
-    r"\d{3}[\s.\-]\d{3}[\s.\-]\d{4}",
-    r"\d{10}",
-]
-
-_EMAIL_PATTERN = r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}"
+# Optional separators also cover the dashed and bare ten-digit forms.
+_RE_PHONE = re.compile(r"\(?\d{3}\)?[\s.\-]?\d{3}[\s.\-]?\d{4}")
+_RE_EMAIL = re.compile(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}")
+# Phone matches are only digits plus ()-. and spaces, all below U+0100.
+_KEEP_DIGITS = str.maketrans("", "", "".join(chr(c) for c in range(256) if not "0" <= chr(c) <= "9"))
 
 _BLOCKED_EMAILS = {"support@crexi.com"}
 _BLOCKED_PHONE_DIGITS = {"8882730423"}
 
-_RE_CITY_STATE_ZIP = re.compile(
-    r"([A-Za-z][A-Za-z\s\.\-']+?),\s*([A-Za-z]+(?:\s+[A-Za-z]+)*)\s+(\d{5}(?:-\d{4})?)",
-    re.I,
-)
 _RE_CITY_ST = re.compile(
     r"([A-Za-z][A-Za-z\s\.\-']+),\s*([A-Za-z]{2})(?:\s+\d{5}|\s|$)"
 )
+_RE_LOCATION = re.compile(
+    r"(?P<zip_city>[A-Za-z][A-Za-z\s\.\-']+?),\s*(?P<zip_state>[A-Za-z]+(?:\s+[A-Za-z]+)*)\s+\d{5}(?:-\d{4})?"
+    r"|(?P<st_city>[A-Za-z][A-Za-z\s\.\-']+),\s*(?P<st_state>[A-Za-z]{2})(?:\s+\d{5}|\s|$)"
+)
+
+
+_LISTING_CARD_SELECTOR = "[class*='listing'], [class*='property'], [class*='property-card'], [class*='listing-card'], [data-testid*='listing'], article, [role='article']"
+_LISTING_TITLE_SELECTOR = "h2, h3, h4, h5, [class*='title'], [class*='name'], [class*='heading']"
+_LISTING_DESCRIPTION_SELECTOR = "[class*='description'], [class*='overview'], [class*='summary'], [class*='details'], p"
+_LISTING_TYPE_SELECTOR = "[class*='type'], [class*='category'], [class*='property-type']"
+
+# One round-trip for every listing card: the text of the first title,
+# description and type element inside each card plus its parent's text.
+_LISTING_CARDS_JS = """
+([cardSel, titleSel, descSel, typeSel, limit]) => {
+    const text = (el) => (el && el.innerText ? el.innerText.trim() : "");
+    return Array.from(document.querySelectorAll(cardSel)).slice(0, limit).map((card) => ({
+        title: text(card.querySelector(titleSel)),
+        description: text(card.querySelector(descSel)),
+        type: text(card.querySelector(typeSel)),
+        parent: text(card.parentElement),
+    }));
+}
+"""
+
+_HREFS_JS = """
+(selectors) => selectors.flatMap(
+    (sel) => Array.from(document.querySelectorAll(sel), (el) => el.getAttribute("href"))
+)
+"""
 
 
-def _safe_text(locator, default: str = "N/A") -> str:
+async def _safe_text(locator, default: str = "N/A") -> str:
     try:
-        if locator is None or locator.count() == 0:
+        if locator is None or await locator.count() == 0:
             return default
-        text = locator.first.inner_text(timeout=5000).strip()
+        text = (await locator.first.inner_text(timeout=5000)).strip()
         return text or default
     except Exception:
         return default
 
 
 def _normalize_state(state_raw: str) -> Optional[str]:
-    s = (state_raw or "").strip()
-    if len(s) == 2 and s.isalpha():
-        return s.upper()
-    return _US_STATE_ABBREV.get(s.lower())
-
-
-def _random_delay() -> None:
-    time.sleep(random.uniform(2, 5))
-
-
-def _apply_stealth_mode(page: Page) -> None:
+    return _STATE_MAP.get((state_raw or "").strip().lower())
+
+
+async def _random_delay() -> None:
+    await asyncio.sleep(random.uniform(2, 5))
+
+
+# Covers the automation tells Cloudflare checks beyond navigator.webdriver
+# (the same set playwright-stealth patches) so profiles don't land in the
+# challenge loop.
+_STEALTH_JS = """
+(() => {
+    Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
+    window.chrome = window.chrome || {};
+    window.chrome.runtime = window.chrome.runtime || {};
+    Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [
+            { name: 'Chrome PDF Plugin', filename: 'internal-pdf-viewer' },
+            { name: 'Chrome PDF Viewer', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai' },
+            { name: 'Native Client', filename: 'internal-nacl-plugin' },
+        ],
+    });
+    if (navigator.permissions && navigator.permissions.query) {
+        const query = navigator.permissions.query.bind(navigator.permissions);
+        navigator.permissions.query = (params) => (
+            params && params.name === 'notifications'
+                ? Promise.resolve({ state: Notification.permission })
+                : query(params)
+        );
+    }
+    const patchWebGL = (proto) => {
+        if (!proto) return;
+        const getParameter = proto.getParameter;
+        proto.getParameter = function (param) {
+            if (param === 37445) return 'Intel Inc.';
+            if (param === 37446) return 'Intel Iris OpenGL Engine';
+            return getParameter.call(this, param);
+        };
+    };
+    patchWebGL(window.WebGLRenderingContext && WebGLRenderingContext.prototype);
+    patchWebGL(window.WebGL2RenderingContext && WebGL2RenderingContext.prototype);
+    const frameWindow = Object.getOwnPropertyDescriptor(HTMLIFrameElement.prototype, 'contentWindow');
+    if (frameWindow && frameWindow.get) {
+        Object.defineProperty(HTMLIFrameElement.prototype, 'contentWindow', {
+            get() {
+                const win = frameWindow.get.call(this);
+                try {
+                    if (win && !win.chrome) win.chrome = window.chrome;
+                } catch (e) {}
+                return win;
+            },
+        });
+    }
+})();
+"""
+
+
+async def _apply_stealth_mode(context: BrowserContext) -> None:
     try:
-        page.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-            window.chrome = { runtime: {} };
-        """)
+        await context.add_init_script(_STEALTH_JS)
     except Exception:
         pass
 
 
-def _is_cloudflare_challenge(page: Page) -> bool:
+async def _is_cloudflare_challenge(page: Page) -> bool:
     try:
         url = page.url.lower()
-        title = (page.title() or "").lower()
+        title = (await page.title() or "").lower()
         if "challenge" in url or "cloudflare" in title or "cf-browser-verification" in url:
             return True
-        body = page.inner_text("body", timeout=3000) or ""
+        body = await page.inner_text("body", timeout=3000) or ""
         return "verify you are human" in body.lower() or "performing security verification" in body.lower()
     except Exception:
         return False
 
 
-def _wait_for_cloudflare_pass(page: Page, max_wait_seconds: int = 120) -> bool:
+async def _wait_for_cloudflare_pass(page: Page, max_wait_seconds: int = 120) -> bool:
     start = time.time()
     while (time.time() - start) < max_wait_seconds:
-        if not _is_cloudflare_challenge(page):
-            time.sleep(2)
-            if not _is_cloudflare_challenge(page):
+        if not await _is_cloudflare_challenge(page):
+            await asyncio.sleep(2)
+            if not await _is_cloudflare_challenge(page):
                 return True
-        time.sleep(2)
+        await asyncio.sleep(2)
     return False
 
 
-def _scroll_until_content_loaded(page: Page, max_scrolls: int = 10, pause: float = 0.3) -> None:
-    try:
-        prev_height = page.evaluate("document.body.scrollHeight")
-        no_change_count = 0
-        max_no_change = 2
-        
-        for _ in range(max_scrolls):
-            page.evaluate("window.scrollBy(0, window.innerHeight)")
-            time.sleep(pause)
-            
-            current_height = page.evaluate("document.body.scrollHeight")
-            if current_height == prev_height:
-                no_change_count += 1
-                if no_change_count >= max_no_change:
-                    break
-            else:
-                no_change_count = 0
-                prev_height = current_height
-        
-        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        time.sleep(0.5)
-    except Exception:
-        pass
+async def _scroll_until_content_loaded(page: Page, max_scrolls: int = 10, timeout: int = 1000) -> None:
+    # Jump to the bottom and wait (up to timeout ms) for lazy content to grow
+    # the page; stop as soon as a scroll adds nothing.
+    for _ in range(max_scrolls):
+        try:
+            height = await page.evaluate(
+                "() => { window.scrollTo(0, document.body.scrollHeight); return document.body.scrollHeight; }"
+            )
+            await page.wait_for_function(
+                "h => document.body.scrollHeight > h", arg=height, timeout=timeout
+            )
+        except Exception:
+            break
 
 
-def _click_read_more_if_exists(page: Page) -> None:
+async def _click_read_more_if_exists(page: Page) -> None:
     try:
         read_more = page.get_by_text("Read more", exact=False).first
-        if read_more.count() > 0:
-            read_more.scroll_into_view_if_needed(timeout=3000)
-            read_more.click()
-            time.sleep(1.5)
+        if await read_more.count() > 0:
+            await read_more.scroll_into_view_if_needed(timeout=3000)
+            await read_more.click()
+            # The toggle turns into "Read less" (or goes away) once expanded.
+            await read_more.wait_for(state="hidden", timeout=1500)
     except Exception:
         pass
 
 
-def _scroll_to_listings_sections(page: Page) -> None:
+async def _scroll_to_listings_sections(page: Page) -> None:
     try:
         active_listings = page.get_by_text("Active Listings", exact=False).first
-        if active_listings.count() > 0:
-            active_listings.scroll_into_view_if_needed(timeout=5000)
-            time.sleep(0.5)
-            _scroll_until_content_loaded(page, max_scrolls=5, pause=0.3)
+        if await active_listings.count() > 0:
+            await active_listings.scroll_into_view_if_needed(timeout=5000)
+            await _scroll_until_content_loaded(page, max_scrolls=5)
     except Exception:
         pass
     
     try:
         sold_listings = page.get_by_text("Sold Listings", exact=False).first
-        if sold_listings.count() > 0:
-            sold_listings.scroll_into_view_if_needed(timeout=5000)
-            time.sleep(0.5)
-            _scroll_until_content_loaded(page, max_scrolls=5, pause=0.3)
+        if await sold_listings.count() > 0:
+            await sold_listings.scroll_into_view_if_needed(timeout=5000)
+            await _scroll_until_content_loaded(page, max_scrolls=5)
     except Exception:
         pass
     
     try:
         listings_section = page.locator("[class*='listing'], [class*='property'], [data-testid*='listing']").first
-        if listings_section.count() > 0:
-            listings_section.scroll_into_view_if_needed(timeout=5000)
-            time.sleep(0.5)
-            _scroll_until_content_loaded(page, max_scrolls=5, pause=0.3)
+        if await listings_section.count() > 0:
+            await listings_section.scroll_into_view_if_needed(timeout=5000)
+            await _scroll_until_content_loaded(page, max_scrolls=5)
     except Exception:
         pass
     
-    _scroll_until_content_loaded(page, max_scrolls=3, pause=0.3)
+    await _scroll_until_content_loaded(page, max_scrolls=3)
 
 
 def _extract_property_type_from_text(text: str) -> str:
     text_lower = text.lower()
-    property_types = [
-        "gas station", "former gas station", "gas station site",
-        "car wash", "carwash", "express car wash", "tunnel wash",
-        "retail", "retail property", "retail building",
-        "office", "office building", "office space",
-        "industrial", "warehouse", "distribution",
-        "land", "vacant land", "development land",
-        "restaurant", "qsr", "fast food",
-        "automotive", "auto service", "auto repair",
-        "special purpose", "specialty",
-    ]
-    for prop_type in property_types:
-        if prop_type in text_lower:
-            return prop_type.title()
+    best = None
+    for match in _RE_PROPERTY_TYPE.finditer(text_lower):
+        rank = _PROPERTY_TYPE_RANK[match.group(1)]
+        if best is None or rank < best:
+            best = rank
+            if rank == 0:
+                break
+    if best is not None:
+        return _PROPERTY_TYPES[best].title()
     if "former" in text_lower:
-        words = text_lower.split()
-        idx = words.index("former")
-        if idx + 1 < len(words):
-            return f"Former {words[idx + 1].title()}"
+        match = _RE_FORMER.search(text_lower)
+        if match:
+            return f"Former {match.group(1).title()}"
     return ""
 
 
-def _extract_listings_data(page: Page) -> Tuple[List[dict], List[dict]]:
+_PROPERTY_TYPES = [
+    "gas station", "former gas station", "gas station site",
+    "car wash", "carwash", "express car wash", "tunnel wash",
+    "retail", "retail property", "retail building",
+    "office", "office building", "office space",
+    "industrial", "warehouse", "distribution",
+    "land", "vacant land", "development land",
+    "restaurant", "qsr", "fast food",
+    "automotive", "auto service", "auto repair",
+    "special purpose", "specialty",
+]
+# Whole words, plurals included ("warehouses", "car washes").
+_RE_PROPERTY_TYPE = re.compile(
+    r"\b(" + "|".join(re.escape(t) for t in _PROPERTY_TYPES) + r")(?:e?s)?\b"
+)
+# Earlier entries win wherever they appear, so a match is ranked by the
+# earliest type it contains ("express car wash" counts as "car wash").
+_PROPERTY_TYPE_RANK = {
+    t: min(i for i, u in enumerate(_PROPERTY_TYPES) if re.search(r"\b%s\b" % re.escape(u), t))
+    for t in _PROPERTY_TYPES
+}
+_RE_FORMER = re.compile(r"\bformer\s+(\w+)")
+
+
+async def _extract_listings_data(page: Page) -> Tuple[List[dict], List[dict]]:
     active_listings = []
     sold_listings = []
     try:
-        body_text = page.inner_text("body", timeout=10000) or ""
-        
-        listing_cards = page.locator("[class*='listing'], [class*='property'], [class*='property-card'], [class*='listing-card'], [data-testid*='listing'], article, [role='article']")
         try:
-            n = listing_cards.count()
+            cards = await page.evaluate(
+                _LISTING_CARDS_JS,
+                [_LISTING_CARD_SELECTOR, _LISTING_TITLE_SELECTOR, _LISTING_DESCRIPTION_SELECTOR, _LISTING_TYPE_SELECTOR, 100],
+            ) or []
         except Exception:
-            n = 0
+            cards = []
         
-        for i in range(min(n, 100)):
+        for card in cards:
             try:
-                card = listing_cards.nth(i)
-                title = _safe_text(card.locator("h2, h3, h4, h5, [class*='title'], [class*='name'], [class*='heading']"), "")
-                description = _safe_text(card.locator("[class*='description'], [class*='overview'], [class*='summary'], [class*='details'], p"), "")
-                listing_type_raw = _safe_text(card.locator("[class*='type'], [class*='category'], [class*='property-type']"), "")
+                title = card.get("title") or ""
+                description = card.get("description") or ""
+                listing_type_raw = card.get("type") or ""
                 
-                full_text_raw = (title + " " + description + " " + listing_type_raw).strip()
-                if not full_text_raw:
+                title_lower = title.lower()
+                description_lower = description.lower()
+                full_text = f"{title_lower} {description_lower} {listing_type_raw.lower()}".strip()
+                if not full_text:
                     continue
                 
-                full_text = full_text_raw.lower()
-                property_type = _extract_property_type_from_text(full_text_raw)
+                property_type = _extract_property_type_from_text(full_text)
                 if not property_type and listing_type_raw:
                     property_type = listing_type_raw.strip()
                 
                 listing_data = {
-                    "title": title.lower() if title else "",
-                    "description": description.lower() if description else "",
+                    "title": title_lower,
+                    "description": description_lower,
                     "type": property_type if property_type else listing_type_raw.strip() if listing_type_raw else "",
                     "full_text": full_text
                 }
                 
-                card_text = full_text
-                parent = card.locator("xpath=..")
-                try:
-                    parent_text = _safe_text(parent, "").lower()
-                    card_text += " " + parent_text
-                except Exception:
-                    pass
-                
+                card_text = full_text + " " + (card.get("parent") or "").lower()
                 if "sold" in card_text or "closed" in card_text or "transaction" in card_text:
                     sold_listings.append(listing_data)
-                elif "active" in card_text or "available" in card_text or "for sale" in card_text or "for lease" in card_text:
-                    active_listings.append(listing_data)
                 else:
                     active_listings.append(listing_data)
             except Exception:
                 continue
         
         if not active_listings and not sold_listings:
-            text_lower = body_text.lower()
+            text_lower = (await page.inner_text("body", timeout=10000) or "").lower()
             sections_to_check = [
                 ("active listings", "active"),
                 ("active properties", "active"),
@@ -311,16 +415,17 @@ def _extract_listings_data(page: Page) -> Tuple[List[dict], List[dict]]:
                 if section_text in text_lower:
                     try:
                         section_header = page.get_by_text(section_text, exact=False).first
-                        if section_header.count() > 0:
+                        if await section_header.count() > 0:
                             section = section_header.locator("xpath=following::*[1]")
-                            section_content = _safe_text(section, "")
+                            section_content = await _safe_text(section, "")
                             if section_content and len(section_content) > 50:
-                                prop_type = _extract_property_type_from_text(section_content)
+                                section_lower = section_content.lower()
+                                prop_type = _extract_property_type_from_text(section_lower)
                                 listing_data = {
                                     "title": "",
-                                    "description": section_content.lower(),
+                                    "description": section_lower,
                                     "type": prop_type if prop_type else "",
-                                    "full_text": section_content.lower()
+                                    "full_text": section_lower
                                 }
                                 if section_type == "sold":
                                     sold_listings.append(listing_data)
@@ -334,84 +439,112 @@ def _extract_listings_data(page: Page) -> Tuple[List[dict], List[dict]]:
     return active_listings, sold_listings
 
 
+def _find_keywords(lower: str) -> List[str]:
+    hits: Set[str] = set()
+    if _KEYWORDS_AUTOMATON is not None:
+        for _, kw in _KEYWORDS_AUTOMATON.iter(lower):
+            hits.add(kw)
+            if len(hits) == len(_KEYWORDS_LOWER):
+                break
+        return [kw for kw in _KEYWORDS_LOWER if kw in hits]
+    for match in _RE_KEYWORDS.finditer(lower):
+        hits |= _KEYWORDS_WITHIN[match.group(1)]
+        if len(hits) == len(_KEYWORDS_LOWER):
+            break
+    return [kw for kw in _KEYWORDS_LOWER if kw in hits]
+
+
+async def _page_has_keywords(page: Page) -> bool:
+    try:
+        return await page.evaluate(
+            "(alt) => new RegExp(alt, 'i').test(document.body.innerText)", _KEYWORDS_JS_ALT
+        )
+    except Exception:
+        return True
+
+
 def _check_keywords_in_listings(active_listings: List[dict], sold_listings: List[dict]) -> Tuple[bool, List[str], Optional[str], Optional[str]]:
-    found_keywords = []
+    found_keywords: List[str] = []
+    found_set: Set[str] = set()
     matched_listing_type = None
     match_source = None
     
     for listing in active_listings:
+        if matched_listing_type and len(found_set) == len(_KEYWORDS_LOWER):
+            break
         full_text = listing.get("full_text", "")
         listing_type = listing.get("type", "")
         title = listing.get("title", "")
         description = listing.get("description", "")
         
-        for kw in KEYWORDS:
-            if kw.lower() in full_text:
-                if kw not in found_keywords:
-                    found_keywords.append(kw)
-                if not matched_listing_type:
-                    if listing_type:
-                        matched_listing_type = listing_type
-                    elif title:
-                        prop_type = _extract_property_type_from_text(title)
-                        if prop_type:
-                            matched_listing_type = prop_type
-                        else:
-                            matched_listing_type = title[:50] if len(title) > 0 else "Property Listing"
-                    elif description:
-                        prop_type = _extract_property_type_from_text(description[:200])
-                        if prop_type:
-                            matched_listing_type = prop_type
-                        else:
-                            matched_listing_type = "Property Listing"
+        for kw in _find_keywords(full_text):
+            if kw not in found_set:
+                found_set.add(kw)
+                found_keywords.append(kw)
+            if not matched_listing_type:
+                if listing_type:
+                    matched_listing_type = listing_type
+                elif title:
+                    prop_type = _extract_property_type_from_text(title)
+                    if prop_type:
+                        matched_listing_type = prop_type
+                    else:
+                        matched_listing_type = title[:50] if len(title) > 0 else "Property Listing"
+                elif description:
+                    prop_type = _extract_property_type_from_text(description[:200])
+                    if prop_type:
+                        matched_listing_type = prop_type
                     else:
                         matched_listing_type = "Property Listing"
-                    match_source = "Active"
+                else:
+                    matched_listing_type = "Property Listing"
+                match_source = "Active"
     
     for listing in sold_listings:
+        if matched_listing_type and len(found_set) == len(_KEYWORDS_LOWER):
+            break
         full_text = listing.get("full_text", "")
         listing_type = listing.get("type", "")
         title = listing.get("title", "")
         description = listing.get("description", "")
         
-        for kw in KEYWORDS:
-            if kw.lower() in full_text:
-                if kw not in found_keywords:
-                    found_keywords.append(kw)
-                if not matched_listing_type:
-                    if listing_type:
-                        matched_listing_type = listing_type
-                    elif title:
-                        prop_type = _extract_property_type_from_text(title)
-                        if prop_type:
-                            matched_listing_type = prop_type
-                        else:
-                            matched_listing_type = title[:50] if len(title) > 0 else "Property Listing"
-                    elif description:
-                        prop_type = _extract_property_type_from_text(description[:200])
-                        if prop_type:
-                            matched_listing_type = prop_type
-                        else:
-                            matched_listing_type = "Property Listing"
+        for kw in _find_keywords(full_text):
+            if kw not in found_set:
+                found_set.add(kw)
+                found_keywords.append(kw)
+            if not matched_listing_type:
+                if listing_type:
+                    matched_listing_type = listing_type
+                elif title:
+                    prop_type = _extract_property_type_from_text(title)
+                    if prop_type:
+                        matched_listing_type = prop_type
+                    else:
+                        matched_listing_type = title[:50] if len(title) > 0 else "Property Listing"
+                elif description:
+                    prop_type = _extract_property_type_from_text(description[:200])
+                    if prop_type:
+                        matched_listing_type = prop_type
                     else:
                         matched_listing_type = "Property Listing"
-                    match_source = "Sold"
+                else:
+                    matched_listing_type = "Property Listing"
+                match_source = "Sold"
     
     return (len(found_keywords) > 0, found_keywords, matched_listing_type, match_source)
 
 
-def _profile_contains_keywords(page: Page) -> Tuple[bool, List[str], Optional[str], Optional[str], List[dict], List[dict]]:
+async def _profile_contains_keywords(page: Page, body_text: Optional[str] = None) -> Tuple[bool, List[str], Optional[str], Optional[str], List[dict], List[dict]]:
     try:
-        body = page.inner_text("body", timeout=10000) or ""
+        body = body_text if body_text is not None else (await page.inner_text("body", timeout=10000) or "")
         lower = body.lower()
-        bio_keywords = [kw for kw in KEYWORDS if kw.lower() in lower]
+        bio_keywords = _find_keywords(lower)
         
-        _scroll_to_listings_sections(page)
-        active_listings, sold_listings = _extract_listings_data(page)
+        active_listings, sold_listings = await _extract_listings_data(page)
         
         listing_match, listing_keywords, listing_type, match_source = _check_keywords_in_listings(active_listings, sold_listings)
         
-        all_keywords = list(set(bio_keywords + listing_keywords))
+        all_keywords = list(dict.fromkeys(chain(bio_keywords, listing_keywords)))
         has_match = len(all_keywords) > 0
         
         if listing_match and listing_type:
@@ -427,22 +560,20 @@ def _profile_contains_keywords(page: Page) -> Tuple[bool, List[str], Optional[st
 def _extract_phone_from_text(text: str) -> str:
     if not text:
         return "N/A"
-    for pattern in _PHONE_PATTERNS:
-        match = re.search(pattern, text)
-        if match:
-            phone = match.group(0).strip()
-            digits = re.sub(r"\D", "", phone)
-            if len(digits) == 11 and digits.startswith("1"):
-                digits = digits[1:]
-            if len(digits) == 10 and digits not in _BLOCKED_PHONE_DIGITS:
-                return phone
+    for match in _RE_PHONE.finditer(text):
+        phone = match.group(0).strip()
+        digits = phone.translate(_KEEP_DIGITS)
+        if len(digits) == 11 and digits.startswith("1"):
+            digits = digits[1:]
+        if len(digits) == 10 and digits not in _BLOCKED_PHONE_DIGITS:
+            return phone
     return "N/A"
 
 
 def _extract_email_from_text(text: str) -> str:
     if not text:
         return "N/A"
-    match = re.search(_EMAIL_PATTERN, text)
+    match = _RE_EMAIL.search(text)
     if match:
         email = match.group(0).strip().lower()
         if email not in _BLOCKED_EMAILS:
@@ -450,268 +581,169 @@ def _extract_email_from_text(text: str) -> str:
     return "N/A"
 
 
-def _extract_name(page: Page) -> str:
-    try:
-        h1 = page.locator("h1").first
-        if h1.count() > 0:
-            text = h1.inner_text(timeout=5000).strip()
-            if text:
-                return text
-    except Exception:
-        pass
-    try:
-        heading = page.get_by_role("heading").first
-        if heading.count() > 0:
-            text = heading.inner_text(timeout=5000).strip()
-            if text:
-                return text
-    except Exception:
-        pass
-    return "N/A"
-
-
-def _is_valid_company_candidate(text: str) -> bool:
-    if not text or len(text) < 2 or len(text) > 200:
-        return False
-    lower = text.lower()
-    skip = [
-        "city", "state", "location", "address", "zip", "phone", "email", "@",
-        "logo", "image", "photo", "picture", "profile", "broker", "view",
-    ]
-    return not any(x in lower for x in skip)
+_PIN_SELECTOR = "[class*='pin'], [class*='location'], [class*='map'], svg[class*='pin'], svg[class*='location'], [data-testid*='location'], [aria-label*='location' i]"
+_LOCATION_DIV_SELECTOR = "[class*='location'], [class*='address'], [class*='city']"
+_LOGO_SELECTOR = "img[class*='logo'], img[alt*='logo' i], img[src*='logo'], [class*='company-logo'], [class*='logo'] img"
+
+# Everything the name/company/location extractors look at, read in one
+# round-trip: the location anchor is the pin icon, else the location div.
+_PROFILE_FIELDS_JS = """
+([pinSel, locationSel, logoSel]) => {
+    const text = (el) => (el && el.innerText ? el.innerText : "").trim();
+    const findByText = (label) => {
+        const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+        for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+            const parent = node.parentElement;
+            if (!parent || /^(SCRIPT|STYLE|NOSCRIPT)$/.test(parent.tagName)) continue;
+            if (node.nodeValue.toLowerCase().includes(label)) return parent;
+        }
+        return null;
+    };
+    const pin = document.querySelector(pinSel);
+    const locationDiv = document.querySelector(locationSel);
+    const anchor = pin || locationDiv;
+    const anchorParent = anchor ? anchor.parentElement : null;
+    const logo = document.querySelector(logoSel);
+    const companyLabel = findByText("company");
+    return {
+        h1: text(document.querySelector("h1")),
+        heading: text(document.querySelector("h1, h2, h3, h4, h5, h6, [role='heading']")),
+        pin_parent: pin ? text(pin.parentElement) : "",
+        pin_next: pin ? text(pin.nextElementSibling) : "",
+        location_div: text(locationDiv),
+        anchor_parent: text(anchorParent),
+        anchor_prev: anchor ? text(anchor.previousElementSibling) : "",
+        anchor_grandparent: anchorParent ? text(anchorParent.parentElement) : "",
+        anchor_parent_prev: anchorParent ? text(anchorParent.previousElementSibling) : "",
+        logo_parent: logo ? text(logo.parentElement) : "",
+        logo_next: logo ? text(logo.nextElementSibling) : "",
+        company_label_next: companyLabel ? text(companyLabel.nextElementSibling) : "",
+    };
+}
+"""
 
 
-def _extract_company(page: Page) -> str:
+async def _read_profile(page: Page) -> Dict[str, str]:
     try:
-        body_text = page.inner_text("body", timeout=5000) or ""
-        lines = [line.strip() for line in body_text.split("\n") if line.strip()]
-
-        for i, line in enumerate(lines):
-            if _RE_CITY_STATE_ZIP.search(line) or _RE_CITY_ST.search(line):
-                if i > 0:
-                    company_candidate = lines[i - 1]
-                    if _is_valid_company_candidate(company_candidate):
-                        return company_candidate
-                break
+        return await page.evaluate(
+            _PROFILE_FIELDS_JS, [_PIN_SELECTOR, _LOCATION_DIV_SELECTOR, _LOGO_SELECTOR]
+        ) or {}
+    except Exception:
+        return {}
 
-        location_element = None
-        pin_icon = page.locator("[class*='pin'], [class*='location'], [class*='map'], svg[class*='pin'], svg[class*='location'], [data-testid*='location'], [aria-label*='location' i]").first
-        if pin_icon.count() > 0:
-            location_element = pin_icon
-        else:
-            location_div = page.locator("[class*='location'], [class*='address'], [class*='city']").first
-            if location_div.count() > 0:
-                location_element = location_div
 
-        if location_element:
-            try:
-                parent = location_element.locator("xpath=..")
-                if parent.count() > 0:
-                    parent_text = parent.first.inner_text(timeout=3000).strip()
-                    if parent_text:
-                        plines = [l.strip() for l in parent_text.split("\n") if l.strip()]
-                        for j, pline in enumerate(plines):
-                            if _RE_CITY_STATE_ZIP.search(pline) or _RE_CITY_ST.search(pline):
-                                if j > 0 and _is_valid_company_candidate(plines[j - 1]):
-                                    return plines[j - 1]
-                                break
-            except Exception:
-                pass
-
-            try:
-                prev = location_element.locator("xpath=preceding-sibling::*[1]")
-                if prev.count() > 0:
-                    text = prev.first.inner_text(timeout=2000).strip()
-                    if _is_valid_company_candidate(text):
-                        return text
-            except Exception:
-                pass
+def _extract_name(data: Dict[str, str]) -> str:
+    return data.get("h1") or data.get("heading") or "N/A"
 
-            try:
-                parent = location_element.locator("xpath=..")
-                if parent.count() > 0:
-                    grandparent = parent.locator("xpath=..")
-                    if grandparent.count() > 0:
-                        gp_text = grandparent.first.inner_text(timeout=3000).strip()
-                        if gp_text:
-                            gplines = [l.strip() for l in gp_text.split("\n") if l.strip()]
-                            for k, gpline in enumerate(gplines):
-                                if _RE_CITY_STATE_ZIP.search(gpline) or _RE_CITY_ST.search(gpline):
-                                    if k > 0 and _is_valid_company_candidate(gplines[k - 1]):
-                                        return gplines[k - 1]
-                                    break
-            except Exception:
-                pass
 
-            try:
-                parent = location_element.locator("xpath=..")
-                if parent.count() > 0:
-                    prev_block = parent.locator("xpath=preceding-sibling::*[1]")
-                    if prev_block.count() > 0:
-                        text = prev_block.first.inner_text(timeout=2000).strip()
-                        first_line = text.split("\n")[0].strip() if text else ""
-                        if _is_valid_company_candidate(first_line):
-                            return first_line
-                        if _is_valid_company_candidate(text):
-                            return text
-            except Exception:
-                pass
+_RE_COMPANY_SKIP = re.compile(
+    r"city|state|location|address|zip|phone|email|@|logo|image|photo|picture|profile|broker|view",
+    re.I,
+)
 
-        logo = page.locator("img[class*='logo'], img[alt*='logo' i], img[src*='logo'], [class*='company-logo'], [class*='logo'] img").first
-        if logo.count() > 0:
-            try:
-                parent = logo.locator("xpath=..")
-                if parent.count() > 0:
-                    parent_text = parent.first.inner_text(timeout=3000).strip()
-                    if parent_text:
-                        for line in parent_text.split("\n"):
-                            line = line.strip()
-                            if _is_valid_company_candidate(line):
-                                return line
-            except Exception:
-                pass
-            try:
-                next_sibling = logo.locator("xpath=following-sibling::*[1]")
-                if next_sibling.count() > 0:
-                    text = next_sibling.first.inner_text(timeout=2000).strip()
-                    if _is_valid_company_candidate(text):
-                        return text
-            except Exception:
-                pass
 
-        company_label = page.get_by_text("Company", exact=False).first
-        if company_label.count() > 0:
-            try:
-                sib = company_label.locator("xpath=following-sibling::*[1]")
-                if sib.count() > 0:
-                    text = sib.first.inner_text(timeout=2000).strip()
-                    if text and len(text) < 200 and len(text) > 1:
-                        return text
-            except Exception:
-                pass
-    except Exception:
-        pass
+def _is_valid_company_candidate(text: str) -> bool:
+    if not text or len(text) < 2 or len(text) > 200:
+        return False
+    return _RE_COMPANY_SKIP.search(text) is None
+
+
+def _company_before_location(text: str) -> Optional[str]:
+    lines = [line.strip() for line in text.split("\n") if line.strip()]
+    for i, line in enumerate(lines):
+        if _RE_LOCATION.search(line):
+            if i > 0 and _is_valid_company_candidate(lines[i - 1]):
+                return lines[i - 1]
+            break
+    return None
+
+
+def _extract_company(data: Dict[str, str], body_text: str) -> str:
+    company = _company_before_location(body_text) or _company_before_location(data.get("anchor_parent") or "")
+    if company:
+        return company
+
+    text = data.get("anchor_prev") or ""
+    if _is_valid_company_candidate(text):
+        return text
+
+    company = _company_before_location(data.get("anchor_grandparent") or "")
+    if company:
+        return company
+
+    text = data.get("anchor_parent_prev") or ""
+    first_line = text.split("\n")[0].strip() if text else ""
+    if _is_valid_company_candidate(first_line):
+        return first_line
+    if _is_valid_company_candidate(text):
+        return text
+
+    for line in (data.get("logo_parent") or "").split("\n"):
+        line = line.strip()
+        if _is_valid_company_candidate(line):
+            return line
+    text = data.get("logo_next") or ""
+    if _is_valid_company_candidate(text):
+        return text
+
+    text = data.get("company_label_next") or ""
+    if text and len(text) < 200 and len(text) > 1:
+        return text
     return "N/A"
 
 
-def _extract_location(page: Page) -> str:
-    try:
-        pin_icon = page.locator("[class*='pin'], [class*='location'], [class*='map'], svg[class*='pin'], svg[class*='location'], [data-testid*='location'], [aria-label*='location' i]").first
-        if pin_icon.count() > 0:
-            parent = pin_icon.locator("xpath=..")
-            if parent.count() > 0:
-                text = parent.first.inner_text(timeout=3000).strip()
-                if text:
-                    for match in _RE_CITY_STATE_ZIP.finditer(text):
-                        city = match.group(1).strip()
-                        state_raw = match.group(2).strip()
-                        if not city or len(city) > 50:
-                            continue
-                        state_abbrev = _normalize_state(state_raw)
-                        if state_abbrev:
-                            city_title = city.title() if city.isupper() else city
-                            out = f"{city_title}, {state_abbrev}"
-                            if _CITY_STATE_ONLY.match(out):
-                                return out
-                    for match in _RE_CITY_ST.finditer(text):
-                        city = match.group(1).strip()
-                        state = match.group(2).strip().upper()
-                        if not city or len(city) > 50:
-                            continue
-                        city_title = city.title() if city.isupper() else city
-                        out = f"{city_title}, {state}"
-                        if _CITY_STATE_ONLY.match(out):
-                            return out
-            sib = pin_icon.locator("xpath=following-sibling::*[1]")
-            if sib.count() > 0:
-                text = sib.first.inner_text(timeout=2000).strip()
-                if text:
-                    for match in _RE_CITY_STATE_ZIP.finditer(text):
-                        city = match.group(1).strip()
-                        state_raw = match.group(2).strip()
-                        if not city or len(city) > 50:
-                            continue
-                        state_abbrev = _normalize_state(state_raw)
-                        if state_abbrev:
-                            city_title = city.title() if city.isupper() else city
-                            out = f"{city_title}, {state_abbrev}"
-                            if _CITY_STATE_ONLY.match(out):
-                                return out
-                    for match in _RE_CITY_ST.finditer(text):
-                        city = match.group(1).strip()
-                        state = match.group(2).strip().upper()
-                        if not city or len(city) > 50:
-                            continue
-                        city_title = city.title() if city.isupper() else city
-                        out = f"{city_title}, {state}"
-                        if _CITY_STATE_ONLY.match(out):
-                            return out
-    except Exception:
-        pass
-    try:
-        location_div = page.locator("[class*='location'], [class*='address'], [class*='city']").first
-        if location_div.count() > 0:
-            text = location_div.first.inner_text(timeout=3000).strip()
-            if text:
-                for match in _RE_CITY_STATE_ZIP.finditer(text):
-                    city = match.group(1).strip()
-                    state_raw = match.group(2).strip()
-                    if not city or len(city) > 50:
-                        continue
-                    state_abbrev = _normalize_state(state_raw)
-                    if state_abbrev:
-                        city_title = city.title() if city.isupper() else city
-                        out = f"{city_title}, {state_abbrev}"
-                        if _CITY_STATE_ONLY.match(out):
-                            return out
-                for match in _RE_CITY_ST.finditer(text):
-                    city = match.group(1).strip()
-                    state = match.group(2).strip().upper()
-                    if not city or len(city) > 50:
-                        continue
-                    city_title = city.title() if city.isupper() else city
-                    out = f"{city_title}, {state}"
-                    if _CITY_STATE_ONLY.match(out):
-                        return out
-    except Exception:
-        pass
-    try:
-        body = page.inner_text("body", timeout=5000) or ""
-        body = body[:10000].replace("\u00a0", " ")
-        text = " ".join(body.split())
-        for match in _RE_CITY_STATE_ZIP.finditer(text):
-            city = match.group(1).strip()
-            state_raw = match.group(2).strip()
-            if not city or len(city) > 50:
+def _first_city_state(text: str) -> Optional[str]:
+    # "City, State 12345" anywhere in the text wins over the first bare
+    # "City, ST"; both forms come out of one pass.
+    fallback = None
+    for match in _RE_LOCATION.finditer(text):
+        if match.group("zip_city") is not None:
+            city = match.group("zip_city").strip()
+            state = _normalize_state(match.group("zip_state"))
+            if state and len(city) <= 50:
+                return f"{city.title() if city.isupper() else city}, {state}"
+            if fallback is not None:
                 continue
-            state_abbrev = _normalize_state(state_raw)
-            if state_abbrev:
-                city_title = city.title() if city.isupper() else city
-                out = f"{city_title}, {state_abbrev}"
-                if _CITY_STATE_ONLY.match(out):
-                    return out
-        for match in _RE_CITY_ST.finditer(text):
-            city = match.group(1).strip()
-            state = match.group(2).strip().upper()
-            if not city or len(city) > 50:
+            # A rejected ZIP match may hide a bare "City, ST" at the same spot.
+            match = _RE_CITY_ST.match(text, match.start())
+            if not match:
                 continue
-            city_title = city.title() if city.isupper() else city
-            out = f"{city_title}, {state}"
-            if _CITY_STATE_ONLY.match(out):
-                return out
-    except Exception:
-        pass
+            city, st = match.group(1).strip(), match.group(2)
+        elif fallback is None:
+            city, st = match.group("st_city").strip(), match.group("st_state")
+        else:
+            continue
+        if len(city) <= 50:
+            fallback = f"{city.title() if city.isupper() else city}, {st.upper()}"
+    return fallback
+
+
+def _extract_location(data: Dict[str, str], body_text: str) -> str:
+    body = body_text[:10000].replace("\u00a0", " ")
+    texts = (
+        data.get("pin_parent") or "",
+        data.get("pin_next") or "",
+        data.get("location_div") or "",
+        " ".join(body.split()),
+    )
+    for text in texts:
+        location = _first_city_state(text)
+        if location:
+            return location
     return "N/A"
 
 
-_PROFILE_SLUG_RE = re.compile(r"crexi\.com/profile/([a-z0-9\-]+)", re.I)
+_RE_NEXT = re.compile(r"next", re.I)
+_ARIA_NEXT_SELECTOR = "[aria-label*='next' i]"
+
+# Matches relative (/profile/...) and absolute crexi.com profile hrefs.
+_PROFILE_SLUG_RE = re.compile(r"(?:^|crexi\.com)/profile/([a-z0-9\-]+)", re.I)
 
 
-def _get_profile_urls_from_page(page: Page, base_url: str) -> List[str]:
+async def _get_profile_urls_from_page(page: Page, base_url: str) -> List[str]:
     """Extract all broker profile URLs from the current page. Scrolls and waits to ensure all content is loaded."""
     # Scroll to load all content
-    _scroll_until_content_loaded(page, max_scrolls=8, pause=0.4)
-    time.sleep(1)
+    await _scroll_until_content_loaded(page, max_scrolls=8)
     
     all_profile_urls: List[str] = []
     seen: Set[str] = set()
@@ -723,146 +755,124 @@ def _get_profile_urls_from_page(page: Page, base_url: str) -> List[str]:
         "[href*='/profile/']",
     ]
     
-    for selector in selectors:
-        try:
-            profile_links = page.locator(selector)
-            n = profile_links.count()
-            for i in range(n):
-                try:
-                    href = profile_links.nth(i).get_attribute("href")
-                    if not href:
-                        continue
-                    full = urljoin(base_url, href)
-                    full_lower = full.lower()
-                    if "/profile/" not in full_lower:
-                        continue
-                    match = _PROFILE_SLUG_RE.search(full_lower)
-                    if not match or not match.group(1) or len(match.group(1)) < 3:
-                        continue
-                    if full in seen:
-                        continue
-                    seen.add(full)
-                    all_profile_urls.append(full)
-                except Exception:
-                    continue
-        except Exception:
-            continue
+    try:
+        hrefs = await page.evaluate(_HREFS_JS, selectors) or []
+    except Exception:
+        hrefs = []
     
-    # Remove duplicates while preserving order
-    unique_urls = []
-    seen_unique = set()
-    for url in all_profile_urls:
-        if url not in seen_unique:
-            seen_unique.add(url)
-            unique_urls.append(url)
+    # The selectors overlap heavily; dedupe on the slug before joining URLs
+    for href in hrefs:
+        match = _PROFILE_SLUG_RE.search(href or "")
+        if not match or len(match.group(1)) < 3:
+            continue
+        slug = match.group(1).lower()
+        if slug in seen:
+            continue
+        seen.add(slug)
+        all_profile_urls.append(urljoin(base_url, href))
     
     # Skip top 3 (usually header/nav links)
     skip_top_n = 3
-    if len(unique_urls) > skip_top_n:
-        return unique_urls[skip_top_n:]
-    return unique_urls
+    if len(all_profile_urls) > skip_top_n:
+        return all_profile_urls[skip_top_n:]
+    return all_profile_urls
 
 
-def _has_next_page(page: Page) -> bool:
-    try:
-        next_btn = page.get_by_role("button", name=re.compile(r"next", re.I)).first
-        if next_btn.count() > 0:
-            disabled = next_btn.get_attribute("disabled")
-            aria_disabled = next_btn.get_attribute("aria-disabled")
-            if disabled is None and aria_disabled != "true":
-                return True
-    except Exception:
-        pass
+def _next_page_locator(page: Page):
+    return (
+        page.get_by_role("button", name=_RE_NEXT)
+        .or_(page.get_by_role("link", name=_RE_NEXT))
+        .or_(page.locator(_ARIA_NEXT_SELECTOR))
+        .first
+    )
+
+
+async def _is_enabled_next(candidate) -> bool:
+    if await candidate.count() == 0:
+        return False
+    disabled = await candidate.get_attribute("disabled")
+    aria_disabled = await candidate.get_attribute("aria-disabled")
+    return disabled is None and aria_disabled != "true"
+
+
+async def _has_next_page(page: Page) -> bool:
     try:
-        next_link = page.get_by_role("link", name=re.compile(r"next", re.I)).first
-        if next_link.count() > 0:
-            return True
+        return await _is_enabled_next(_next_page_locator(page))
     except Exception:
-        pass
+        return False
+
+
+_PAGE_LINK_SELECTOR = "a[href*='page'], button[aria-label*='page']"
+
+_PAGE_LINKS_JS = """
+els => els.map(e => ({
+    text: (e.innerText || "").trim(),
+    current: e.getAttribute("aria-current") === "page",
+}))
+"""
+
+_FIRST_PROFILE_HREF_JS = """
+() => {
+    const a = document.querySelector("a[href*='/profile/']");
+    return a ? a.getAttribute("href") : null;
+}
+"""
+
+
+async def _first_profile_href(page: Page) -> Optional[str]:
     try:
-        next_arrow = page.locator("[aria-label*='next' i], [aria-label*='Next' i]").first
-        if next_arrow.count() > 0:
-            disabled = next_arrow.get_attribute("disabled")
-            aria_disabled = next_arrow.get_attribute("aria-disabled")
-            if disabled is None and aria_disabled != "true":
-                return True
+        return await page.evaluate(_FIRST_PROFILE_HREF_JS)
     except Exception:
-        pass
-    return False
+        return None
 
 
-def _click_next_page(page: Page) -> bool:
-    """Click Next button/link. Scrolls to bottom, waits, then tries multiple selectors."""
-    page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-    time.sleep(1.5)
-    
-    # Try button first
+async def _wait_for_directory_change(page: Page, prev_href: Optional[str], timeout: int = 15000) -> None:
+    # The directory paginates client-side: wait until the first profile card
+    # differs from the one shown before the click.
     try:
-        next_btn = page.get_by_role("button", name=re.compile(r"next", re.I)).first
-        if next_btn.count() > 0:
-            disabled = next_btn.get_attribute("disabled")
-            aria_disabled = next_btn.get_attribute("aria-disabled")
-            if disabled is None and aria_disabled != "true":
-                next_btn.scroll_into_view_if_needed(timeout=5000)
-                time.sleep(0.5)
-                next_btn.click()
-                time.sleep(3)  # Wait longer for page to load
-                return True
+        await page.wait_for_function(
+            "prev => { const a = document.querySelector(\"a[href*='/profile/']\"); "
+            "return !!a && a.getAttribute('href') !== prev; }",
+            arg=prev_href,
+            timeout=timeout,
+        )
     except Exception:
         pass
+
+
+async def _click_next_page(page: Page) -> bool:
+    """Click Next button/link. Scrolls to bottom, then tries multiple selectors and waits for the next page's cards."""
+    await _scroll_until_content_loaded(page, max_scrolls=3)
+    prev_href = await _first_profile_href(page)
     
-    # Try link
     try:
-        next_link = page.get_by_role("link", name=re.compile(r"next", re.I)).first
-        if next_link.count() > 0:
-            next_link.scroll_into_view_if_needed(timeout=5000)
-            time.sleep(0.5)
-            next_link.click()
-            time.sleep(3)
+        next_btn = _next_page_locator(page)
+        if await _is_enabled_next(next_btn):
+            await next_btn.click()
+            await _wait_for_directory_change(page, prev_href)
             return True
     except Exception:
         pass
-    
-    # Try aria-label
-    try:
-        next_arrow = page.locator("[aria-label*='next' i], [aria-label*='Next' i]").first
-        if next_arrow.count() > 0:
-            disabled = next_arrow.get_attribute("disabled")
-            aria_disabled = next_arrow.get_attribute("aria-disabled")
-            if disabled is None and aria_disabled != "true":
-                next_arrow.scroll_into_view_if_needed(timeout=5000)
-                time.sleep(0.5)
-                next_arrow.click()
-                time.sleep(3)
-                return True
-    except Exception:
-        pass
-    
-    # Try numbered page links (e.g. "22", "23" if we're on page 21)
+
+    # Fall back to numbered page links (e.g. "22", "23" if we're on page 21)
     try:
-        # Look for page number links in pagination
-        page_links = page.locator("a[href*='page'], button[aria-label*='page']")
-        count = page_links.count()
-        for i in range(count):
-            try:
-                link = page_links.nth(i)
-                text = link.inner_text(timeout=2000).strip()
-                # If it's a number higher than current, try clicking
-                if text.isdigit():
-                    link.scroll_into_view_if_needed(timeout=3000)
-                    time.sleep(0.3)
-                    link.click()
-                    time.sleep(3)
-                    return True
-            except Exception:
-                continue
+        page_links = page.locator(_PAGE_LINK_SELECTOR)
+        links = await page.eval_on_selector_all(_PAGE_LINK_SELECTOR, _PAGE_LINKS_JS) or []
+        numbered = [(int(l["text"]), i, l["current"]) for i, l in enumerate(links) if l["text"].isdigit()]
+        if numbered:
+            current = next((n for n, _, is_current in numbered if is_current), None)
+            later = [(n, i) for n, i, _ in numbered if current is not None and n > current]
+            index = min(later)[1] if later else numbered[0][1]
+            await page_links.nth(index).click()
+            await _wait_for_directory_change(page, prev_href)
+            return True
     except Exception:
         pass
-    
+
     return False
 
 
-def _collect_all_profile_urls(page: Page, directory_url: str, start_page: int = 1, max_pages: int = 10) -> List[str]:
+async def _collect_all_profile_urls(page: Page, directory_url: str, start_page: int = 1, max_pages: int = 10) -> List[str]:
     """Collect profile URLs by clicking Next through pages. Start on page 1; click Next until we reach start_page, then collect through end_page. No page reload (keeps Special Purpose filter)."""
     all_urls: List[str] = []
     seen: Set[str] = set()
@@ -874,22 +884,18 @@ def _collect_all_profile_urls(page: Page, directory_url: str, start_page: int =
     while page_num <= end_page:
         try:
             current_url = page.url
-            _scroll_until_content_loaded(page, max_scrolls=5, pause=0.3)
-            time.sleep(0.5)
+            await _scroll_until_content_loaded(page, max_scrolls=5)
 
             if page_num >= start_page:
-                profile_urls = _get_profile_urls_from_page(page, current_url)
+                profile_urls = await _get_profile_urls_from_page(page, current_url)
                 if not profile_urls:
                     print(f"  Page {page_num}: no profile links found — continuing...")
                     # Don't break - maybe page is still loading, try Next anyway
                 else:
-                    new_count = 0
-                    for u in profile_urls:
-                        if u not in seen:
-                            seen.add(u)
-                            all_urls.append(u)
-                            new_count += 1
-                    print(f"  Page {page_num}: {len(profile_urls)} links ({new_count} new) — total collected: {len(all_urls)}")
+                    new = [u for u in profile_urls if u not in seen]
+                    seen.update(new)
+                    all_urls.extend(new)
+                    print(f"  Page {page_num}: {len(profile_urls)} links ({len(new)} new) — total collected: {len(all_urls)}")
                     consecutive_failures = 0  # Reset on success
             else:
                 if page_num == 1 and start_page > 1:
@@ -902,130 +908,183 @@ def _collect_all_profile_urls(page: Page, directory_url: str, start_page: int =
                 break
             
             # Try to go to next page
-            if not _has_next_page(page):
+            if not await _has_next_page(page):
                 consecutive_failures += 1
                 print(f"  Page {page_num}: No Next button found (failure {consecutive_failures}/{max_failures})")
                 if consecutive_failures >= max_failures:
                     print(f"  Stopping: {consecutive_failures} consecutive failures to find Next button.")
                     break
-                time.sleep(2)  # Wait a bit and try again
+                await asyncio.sleep(2)  # Wait a bit and try again
                 continue
             
-            if not _click_next_page(page):
+            if not await _click_next_page(page):
                 consecutive_failures += 1
                 print(f"  Page {page_num}: Failed to click Next (failure {consecutive_failures}/{max_failures})")
                 if consecutive_failures >= max_failures:
                     print(f"  Stopping: {consecutive_failures} consecutive failures to click Next.")
                     break
-                time.sleep(2)
+                await asyncio.sleep(2)
                 continue
             
             # Successfully clicked Next
             consecutive_failures = 0
             page_num += 1
-            time.sleep(random.uniform(1.5, 2.5))
+            await asyncio.sleep(random.uniform(1.5, 2.5))
         except Exception as e:
             print(f"  Page {page_num}: {e}")
             consecutive_failures += 1
             if consecutive_failures >= max_failures:
                 break
-            time.sleep(2)
+            await asyncio.sleep(2)
             continue
 
     return all_urls
 
 
-def _scrape_directory(
+_redirect_seen: Set[str] = set()
+
+
+def _load_redirect_seen() -> None:
+    try:
+        with open(REDIRECTS_FILE, encoding="utf-8") as f:
+            _redirect_seen.update(line.strip() for line in f if line.strip())
+    except OSError:
+        pass
+
+
+def _remember_redirect(profile_url: str) -> None:
+    if profile_url in _redirect_seen:
+        return
+    _redirect_seen.add(profile_url)
+    try:
+        with open(REDIRECTS_FILE, "a", encoding="utf-8") as f:
+            f.write(profile_url + "\n")
+    except OSError:
+        pass
+
+
+async def _scrape_directory(
     page: Page,
     directory_url: str,
     seen_urls: Set[str],
     *,
     start_page: int = START_PAGE,
     max_pages: int = COLLECT_PAGES,
-    sheet_id: Optional[str] = None,
-    worksheet_name: str = "CRE Brokers",
-    service_account_json: Optional[str] = None,
+    concurrency: int = PROFILE_CONCURRENCY,
+    sheet_buffer: Optional[SheetBuffer] = None,
+    write_row: Optional[Callable[[List[str]], None]] = None,
 ) -> List[BrokerContact]:
     end_page = start_page + max_pages - 1
     print(f"  Phase 1: Collecting broker profile links from page {start_page} to {end_page}...")
-    profile_urls = _collect_all_profile_urls(page, directory_url, start_page=start_page, max_pages=max_pages)
+    profile_urls = await _collect_all_profile_urls(page, directory_url, start_page=start_page, max_pages=max_pages)
     print(f"  Collected {len(profile_urls)} profile URLs. Phase 2: Scraping each broker...")
 
-    contacts: List[BrokerContact] = []
+    url_queue: "asyncio.Queue[Tuple[int, str]]" = asyncio.Queue()
     for i, profile_url in enumerate(profile_urls):
-        if profile_url in seen_urls:
+        if profile_url in seen_urls or profile_url in _redirect_seen:
             continue
         seen_urls.add(profile_url)
-        n = i + 1
-        print(f"  [{n}] Checking profile...")
-        try:
-            contact = _scrape_single_profile(
-                page,
-                profile_url,
-                entry_num=n,
-                sheet_id=sheet_id,
-                worksheet_name=worksheet_name,
-                service_account_json=service_account_json,
-            )
-            if contact:
-                contacts.append(contact)
-            _random_delay()
-        except Exception as e:
-            print(f"  [{n}] Skip: {e}")
-            _random_delay()
-        if n % 20 == 0:
-            print(f"  — Progress: {n}/{len(profile_urls)} profiles processed.")
+        url_queue.put_nowait((i + 1, profile_url))
+
+    pages: List[Page] = [page]
+    for _ in range(max(1, concurrency) - 1):
+        pages.append(await page.context.new_page())
+
+    contacts: List[BrokerContact] = []
+
+    async def _worker(worker_page: Page) -> None:
+        while True:
+            try:
+                n, profile_url = url_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            print(f"  [{n}] Checking profile...")
+            try:
+                contact = await _scrape_single_profile(
+                    worker_page,
+                    profile_url,
+                    entry_num=n,
+                    sheet_buffer=sheet_buffer,
+                    write_row=write_row,
+                )
+                if contact:
+                    contacts.append(contact)
+            except Exception as e:
+                print(f"  [{n}] Skip: {e}")
+            await _random_delay()
+            if n % 20 == 0:
+                print(f"  — Progress: {n}/{len(profile_urls)} profiles processed.")
+
+    try:
+        await asyncio.gather(*(_worker(worker_page) for worker_page in pages))
+    finally:
+        for extra in pages[1:]:
+            try:
+                await extra.close()
+            except Exception:
+                pass
 
     return contacts
 
 
-def _scrape_single_profile(
+async def _scrape_single_profile(
     page: Page,
     profile_url: str,
     *,
     entry_num: Optional[int] = None,
-    sheet_id: Optional[str] = None,
-    worksheet_name: str = "CRE Brokers",
-    service_account_json: Optional[str] = None,
+    sheet_buffer: Optional[SheetBuffer] = None,
+    write_row: Optional[Callable[[List[str]], None]] = None,
 ) -> Optional[BrokerContact]:
+    if profile_url in _redirect_seen:
+        print(f"  Skipping {profile_url} (redirected on an earlier run)")
+        return None
     try:
-        response = page.goto(profile_url, wait_until="domcontentloaded", timeout=60000)
+        response = await page.goto(profile_url, wait_until="domcontentloaded", timeout=60000)
         if response:
             final_url = response.url
             if final_url != profile_url and "crexi.com/profile" not in final_url:
                 print(f"  Redirected from {profile_url} to {final_url}")
+                _remember_redirect(profile_url)
                 return None
-        page.wait_for_load_state("load", timeout=45000)
-        time.sleep(1.5)
+        await page.wait_for_load_state("load", timeout=45000)
+        try:
+            await page.wait_for_selector("h1", timeout=5000)
+        except Exception:
+            pass
         
         current_url = page.url
         if "crexi.com/profile" not in current_url:
             print(f"  Page redirected to {current_url}, skipping")
+            _remember_redirect(profile_url)
             return None
 
-        _click_read_more_if_exists(page)
-        time.sleep(0.8)
+        await _click_read_more_if_exists(page)
 
-        has_keywords, keywords_found, listing_type, match_source, active_listings, sold_listings = _profile_contains_keywords(page)
+        # Listings lazy-load, so scroll them in before the in-page keyword test;
+        # profiles without any keyword skip the body read and card extraction.
+        await _scroll_to_listings_sections(page)
+        if not await _page_has_keywords(page):
+            num_pre = f"  [{entry_num}] " if entry_num is not None else "  "
+            print(f"{num_pre}No keywords found")
+            return None
+
+        bio_text = await page.inner_text("body", timeout=10000) or ""
+        has_keywords, keywords_found, listing_type, match_source, active_listings, sold_listings = await _profile_contains_keywords(page, bio_text)
         if not has_keywords:
             num_pre = f"  [{entry_num}] " if entry_num is not None else "  "
             print(f"{num_pre}No keywords found")
             return None
 
-        full_name = _extract_name(page)
-        company = _extract_company(page)
-        location = _extract_location(page)
+        profile_data = await _read_profile(page)
+        full_name = _extract_name(profile_data)
+        company = _extract_company(profile_data, bio_text)
+        location = _extract_location(profile_data, bio_text)
 
-        bio_text = page.inner_text("body", timeout=5000) or ""
         all_listings_text = " ".join([l.get("full_text", "") for l in active_listings + sold_listings])
         combined_text = bio_text + " " + all_listings_text
         
         phone = _extract_phone_from_text(combined_text)
-        if phone == "N/A":
-            phone = _extract_phone_from_text(bio_text)
         email = _extract_email_from_text(combined_text)
-        if email == "N/A":
-            email = _extract_email_from_text(bio_text)
 
         notes_parts = []
         display_type = listing_type or ""
@@ -1053,19 +1112,12 @@ def _scrape_single_profile(
         print(f"{num_pre}+ {full_name} ({company}) — keywords: {'; '.join(keywords_found) if keywords_found else 'N/A'}")
         print(f"    Phone: {phone}, Email: {email}, Location: {location}")
 
-        if sheet_id and service_account_json:
-            try:
-                df_one = contacts_to_dataframe([contact])
-                row = df_one.astype(str).fillna("").values.tolist()[0]
-                append_row_to_google_sheet(
-                    row,
-                    sheet_id=sheet_id,
-                    worksheet_name=worksheet_name,
-                    service_account_json_path=service_account_json,
-                )
-                print("  ✓ Added to Google Sheet")
-            except Exception as e:
-                print(f"  (Sheet append failed: {e})")
+        if sheet_buffer is not None or write_row is not None:
+            row = contact_to_row(contact)
+            if write_row is not None:
+                write_row(row)
+            if sheet_buffer is not None:
+                sheet_buffer.add(row)
 
         return contact
     except Exception as e:
@@ -1073,126 +1125,162 @@ def _scrape_single_profile(
         return None
 
 
+async def _launch_browser(p):
+    try:
+        return await p.chromium.launch(
+            headless=False,
+            channel="chrome",
+            args=["--disable-blink-features=AutomationControlled"],
+        )
+    except Exception:
+        return await p.chromium.launch(
+            headless=False,
+            args=["--disable-blink-features=AutomationControlled"],
+        )
+
+
+async def _open_page(browser) -> Page:
+    context = await browser.new_context(
+        viewport={"width": 1920, "height": 1080},
+        locale="en-US",
+        timezone_id="America/New_York",
+    )
+    # Stealth, request blocking and timeouts are set on the context so every
+    # page in the profile pool inherits them along with the Cloudflare cookies.
+    await _apply_stealth_mode(context)
+    await context.route("**/*", block_heavy_requests_async)
+    context.set_default_timeout(30000)
+    context.set_default_navigation_timeout(60000)
+    return await context.new_page()
+
+
+async def _wait_for_load(page: Page) -> None:
+    try:
+        await page.wait_for_load_state("load", timeout=10000)
+    except Exception:
+        pass
+
+
+async def _wait_for_enter(prompt: str, timeout: float) -> None:
+    loop = asyncio.get_running_loop()
+    pressed = asyncio.Event()
+
+    def _read() -> None:
+        try:
+            input()
+        except EOFError:
+            pass
+        try:
+            loop.call_soon_threadsafe(pressed.set)
+        except RuntimeError:
+            pass
+
+    print(prompt)
+    # A daemon thread, so an unanswered prompt doesn't hold up exit.
+    threading.Thread(target=_read, daemon=True).start()
+    try:
+        await asyncio.wait_for(pressed.wait(), timeout)
+    except asyncio.TimeoutError:
+        pass
+
+
+async def _scrape_crexi(
+    test_url: Optional[str],
+    use_ny: bool,
+    all_contacts: List[BrokerContact],
+    seen_urls: Set[str],
+    sheet_buffer: Optional[SheetBuffer] = None,
+    write_row: Optional[Callable[[List[str]], None]] = None,
+) -> None:
+    async with async_playwright() as p:
+        browser = await _launch_browser(p)
+        page = await _open_page(browser)
+
+        target_url = test_url or (NY_DIRECTORY_URL if use_ny else DIRECTORY_URL)
+        if not test_url:
+            print(f"Opening directory: {target_url}")
+        await page.goto(target_url, wait_until="domcontentloaded", timeout=60000)
+        await _wait_for_load(page)
+        if await _is_cloudflare_challenge(page):
+            print("  ⚠️  Cloudflare challenge detected. Solve the captcha in the browser.")
+            if not await _wait_for_cloudflare_pass(page, max_wait_seconds=120):
+                await browser.close()
+                return
+            await _wait_for_load(page)
+
+        if test_url:
+            contact = await _scrape_single_profile(
+                page,
+                test_url,
+                sheet_buffer=sheet_buffer,
+                write_row=write_row,
+            )
+            if contact:
+                all_contacts.append(contact)
+        else:
+            await _wait_for_enter(
+                "Adjust filters if needed, then press Enter to start (starting automatically in 10 seconds)...",
+                10,
+            )
+
+            print("Scraping directory...")
+            start_page = NY_START_PAGE if use_ny else START_PAGE
+            max_pages = NY_COLLECT_PAGES if use_ny else COLLECT_PAGES
+            contacts = await _scrape_directory(
+                page,
+                target_url,
+                seen_urls,
+                start_page=start_page,
+                max_pages=max_pages,
+                sheet_buffer=sheet_buffer,
+                write_row=write_row,
+            )
+            all_contacts.extend(contacts)
+            print(f"  Collected {len(contacts)} matching brokers.")
+
+        await browser.close()
+
+
 def scrape_crexi_directory(test_url: Optional[str] = None, use_ny: bool = False) -> None:
     all_contacts: List[BrokerContact] = []
     seen_urls: Set[str] = set()
+    _load_redirect_seen()
 
     if test_url:
         print(f"TEST MODE: Scraping single profile: {test_url}")
-        try:
-            with sync_playwright() as p:
-                try:
-                    browser = p.chromium.launch(
-                        headless=False,
-                        channel="chrome",
-                        args=["--disable-blink-features=AutomationControlled"],
-                    )
-                except Exception:
-                    browser = p.chromium.launch(
-                        headless=False,
-                        args=["--disable-blink-features=AutomationControlled"],
-                    )
-                context = browser.new_context(
-                    viewport={"width": 1920, "height": 1080},
-                    locale="en-US",
-                    timezone_id="America/New_York",
-                )
-                page = context.new_page()
-                _apply_stealth_mode(page)
-                page.set_default_timeout(30000)
-                page.set_default_navigation_timeout(60000)
-                
-                page.goto(test_url, wait_until="domcontentloaded", timeout=60000)
-                time.sleep(2)
-                if _is_cloudflare_challenge(page):
-                    print("  ⚠️  Cloudflare challenge detected. Solve the captcha in the browser.")
-                    if not _wait_for_cloudflare_pass(page, max_wait_seconds=120):
-                        browser.close()
-                        return
-                    time.sleep(2)
-                
-                contact = _scrape_single_profile(
-                    page,
-                    test_url,
-                    sheet_id=SHEET_ID or None,
-                    worksheet_name=WORKSHEET_NAME,
-                    service_account_json=SERVICE_ACCOUNT_JSON,
-                )
-                if contact:
-                    all_contacts.append(contact)
-
-                browser.close()
-        except KeyboardInterrupt:
-            print("\nStopped by user (Ctrl+C).")
-    else:
-        if SHEET_ID:
-            print(f"Appending to worksheet {WORKSHEET_NAME!r} from next empty row.")
-
-        directory_url = NY_DIRECTORY_URL if use_ny else DIRECTORY_URL
+    elif SHEET_ID:
+        print(f"Appending to worksheet {WORKSHEET_NAME!r} from next empty row.")
 
+    sheet_buffer = (
+        SheetBuffer(SHEET_ID, WORKSHEET_NAME, SERVICE_ACCOUNT_JSON, max_rows=SHEET_FLUSH_ROWS)
+        if SHEET_ID and SERVICE_ACCOUNT_JSON
+        else None
+    )
+    # Matches are streamed to the CSV as they are found, so an interrupted
+    # run loses nothing; the file is deduped and rewritten once at the end.
+    with open(OUTPUT_CSV, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_COLUMNS)
         try:
-            with sync_playwright() as p:
-                try:
-                    browser = p.chromium.launch(
-                        headless=False,
-                        channel="chrome",
-                        args=["--disable-blink-features=AutomationControlled"],
-                    )
-                except Exception:
-                    browser = p.chromium.launch(
-                        headless=False,
-                        args=["--disable-blink-features=AutomationControlled"],
-                    )
-                context = browser.new_context(
-                    viewport={"width": 1920, "height": 1080},
-                    locale="en-US",
-                    timezone_id="America/New_York",
-                )
-                page = context.new_page()
-                _apply_stealth_mode(page)
-                page.set_default_timeout(30000)
-                page.set_default_navigation_timeout(60000)
-                
-                print(f"Opening directory: {directory_url}")
-                page.goto(directory_url, wait_until="domcontentloaded", timeout=60000)
-                time.sleep(2)
-                if _is_cloudflare_challenge(page):
-                    print("  ⚠️  Cloudflare challenge detected. Solve the captcha in the browser.")
-                    if not _wait_for_cloudflare_pass(page, max_wait_seconds=120):
-                        browser.close()
-                        return
-                    time.sleep(2)
-                
-                print("Waiting 10 seconds before starting to scrape so you can adjust filters if needed...")
-                time.sleep(10)
-
-                print("Scraping directory...")
-                start_page = NY_START_PAGE if use_ny else START_PAGE
-                max_pages = NY_COLLECT_PAGES if use_ny else COLLECT_PAGES
-                contacts = _scrape_directory(
-                    page,
-                    directory_url,
-                    seen_urls,
-                    start_page=start_page,
-                    max_pages=max_pages,
-                    sheet_id=SHEET_ID or None,
-                    worksheet_name=WORKSHEET_NAME,
-                    service_account_json=SERVICE_ACCOUNT_JSON,
-                )
-                all_contacts.extend(contacts)
-                print(f"  Collected {len(contacts)} matching brokers.")
-
-                browser.close()
+            asyncio.run(
+                _scrape_crexi(test_url, use_ny, all_contacts, seen_urls, sheet_buffer, writer.writerow)
+            )
         except KeyboardInterrupt:
-            print("\nStopped by user (Ctrl+C). Saving what we have so far...")
+            if test_url:
+                print("\nStopped by user (Ctrl+C).")
+            else:
+                print("\nStopped by user (Ctrl+C). Saving what we have so far...")
+        finally:
+            if sheet_buffer is not None:
+                sheet_buffer.close()
 
-    if all_contacts:
-        df = contacts_to_dataframe(all_contacts)
+    df = load_from_csv(OUTPUT_CSV)
+    if df.empty:
+        print("No matching brokers found.")
+    else:
         df_clean = clean_contacts_dataframe(df)
         save_to_csv(df_clean, OUTPUT_CSV)
-        print(f"Total matching brokers: {len(all_contacts)}. After de-dup: {len(df_clean)}. Saved: {OUTPUT_CSV}")
-    else:
-        print("No matching brokers found.")
+        print(f"Total matching brokers: {len(df)}. After de-dup: {len(df_clean)}. Saved: {OUTPUT_CSV}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import re
+
+# Stylesheets stay: the extractors read innerText, which depends on CSS
+# visibility (without it hidden menus and modals leak into the text), and
+# Crexi's Cloudflare challenge has to render for the captcha to be solved.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+_RE_HEAVY_URL = re.compile(r"\.(?:png|jpe?g|gif|webp|svg|woff2?|ttf|otf|mp4|webm)(?:[?#]|$)", re.I)
+# Third-party analytics/ad hosts; matched on the host part only.
+_RE_TRACKER_HOST = re.compile(
+    r"^[a-z]+://[^/]*(?:doubleclick|googletagmanager|google-analytics|hotjar|segment\.(?:com|net|io)"
+    r"|facebook|analytics)",
+    re.I,
+)
+
+
+def is_heavy_request(request) -> bool:
+    return (
+        request.resource_type in BLOCKED_RESOURCE_TYPES
+        or _RE_HEAVY_URL.search(request.url) is not None
+        or _RE_TRACKER_HOST.match(request.url) is not None
+    )
+
+
+def block_heavy_requests(route) -> None:
+    # Route handler for the sync Playwright API.
+    if is_heavy_request(route.request):
+        route.abort()
+    else:
+        route.continue_()
+
+
+async def block_heavy_requests_async(route) -> None:
+    if is_heavy_request(route.request):
+        await route.abort()
+    else:
+        await route.continue_()
@@ -1,15 +1,41 @@
 from __future__ import annotations
 
+import json
 import re
+import sqlite3
+import threading
+import time
 from dataclasses import asdict, dataclass
-from typing import List
+from typing import List, Optional, Set, Tuple
 
 import pandas as pd
 
 _LOCATION_CITY_STATE = re.compile(r"^[^,]+,\s*[A-Za-z]{2}$")
+_NON_DIGIT = re.compile(r"\D")
+
+ECW_KEYWORDS = [
+    "express car wash",
+    "express wash",
+    "tunnel wash",
+    "car wash",
+    "carwash",
+    "conveyor wash",
+]
+
+# One scan finds every keyword: the lookahead reports the longest keyword
+# starting at each offset, and keywords contained in it are implied.
+_RE_ECW_KEYWORDS = re.compile(
+    "(?=("
+    + "|".join(re.escape(kw) for kw in sorted(ECW_KEYWORDS, key=len, reverse=True))
+    + "))"
+)
+_ECW_KEYWORDS_WITHIN = {kw: {k for k in ECW_KEYWORDS if k in kw} for kw in ECW_KEYWORDS}
+# Every keyword contains "wash", so text without it can be rejected with a
+# single substring scan before the regex runs.
+_KEYWORD_ANCHOR = "wash" if all("wash" in kw for kw in ECW_KEYWORDS) else ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BrokerContact:
     full_name: str = ""
     phone_number: str = ""
@@ -30,35 +56,67 @@ CSV_COLUMNS = [
     "Notes (URL Link)",
 ]
 
+_FIELD_COLUMNS = {
+    "full_name": "Full Name",
+    "phone_number": "Phone Number",
+    "email": "Email Address",
+    "location": "Location (City, State)",
+    "company": "Company",
+    "source_url": "URL",
+    "notes": "Notes (URL Link)",
+}
+
+
+def find_ecw_keywords(lower: str) -> List[str]:
+    if _KEYWORD_ANCHOR not in lower:
+        return []
+    hits: Set[str] = set()
+    for match in _RE_ECW_KEYWORDS.finditer(lower):
+        hits |= _ECW_KEYWORDS_WITHIN[match.group(1)]
+        if len(hits) == len(ECW_KEYWORDS):
+            break
+    return [kw for kw in ECW_KEYWORDS if kw in hits]
+
+
+def _na_or(value: str) -> str:
+    if value is None:
+        return "N/A"
+    text = str(value).strip()
+    return text if text else "N/A"
+
+
+def _location_city_state_only(loc: str) -> str:
+    s = _na_or(loc)
+    if s == "N/A" or len(s) > 80:
+        return "N/A"
+    return s if _LOCATION_CITY_STATE.match(s) else "N/A"
+
+
+def contact_to_row(c: BrokerContact) -> List[str]:
+    return [
+        _na_or(c.full_name),
+        _na_or(c.phone_number),
+        _na_or(c.email),
+        _location_city_state_only(c.location),
+        _na_or(c.company),
+        _na_or(c.source_url),
+        _na_or(c.notes),
+    ]
+
 
 def contacts_to_dataframe(contacts: List[BrokerContact]) -> pd.DataFrame:
-    def _na_or(value: str) -> str:
-        if value is None:
-            return "N/A"
-        text = str(value).strip()
-        return text if text else "N/A"
-
-    def _location_city_state_only(loc: str) -> str:
-        s = _na_or(loc)
-        if s == "N/A" or len(s) > 80:
-            return "N/A"
-        return s if _LOCATION_CITY_STATE.match(s) else "N/A"
-
-    records = []
-    for c in contacts:
-        records.append(
-            {
-                "Full Name": _na_or(c.full_name),
-                "Phone Number": _na_or(c.phone_number),
-                "Location (City, State)": _location_city_state_only(c.location),
-                "Company": _na_or(c.company),
-                "Email Address": _na_or(c.email),
-                "URL": _na_or(c.source_url),
-                "Notes (URL Link)": _na_or(c.notes),
-            }
-        )
-
-    df = pd.DataFrame(records, columns=CSV_COLUMNS)
+    if not contacts:
+        return pd.DataFrame(columns=CSV_COLUMNS)
+    # Same cleanup as contact_to_row, done column-wise instead of per contact.
+    df = pd.DataFrame.from_records(
+        [asdict(c) for c in contacts], columns=list(_FIELD_COLUMNS)
+    ).rename(columns=_FIELD_COLUMNS)[CSV_COLUMNS]
+    df = df.fillna("").astype(str).apply(lambda col: col.str.strip())
+    df = df.mask(df.eq(""), "N/A")
+    loc = df["Location (City, State)"]
+    df["Location (City, State)"] = loc.where(
+        loc.str.len().le(80) & loc.str.match(_LOCATION_CITY_STATE), "N/A"
+    )
     return df
 
 
@@ -70,29 +128,84 @@ def clean_contacts_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     for col in df.columns:
         df[col] = df[col].astype(str).str.strip()
 
-    df["_key_with_phone"] = (
-        df["Full Name"].str.lower().fillna("")
-        + "|"
-        + df["Phone Number"].str.replace(r"\D", "", regex=True).fillna("")
-        + "|"
-        + df["Company"].str.lower().fillna("")
-    )
-    df["_key_no_phone"] = (
-        df["Full Name"].str.lower().fillna("")
-        + "|"
-        + df["Company"].str.lower().fillna("")
-    )
-
-    df["_dedup_key"] = df["_key_with_phone"]
-    mask_no_phone = df["Phone Number"].str.strip() == ""
-    df.loc[mask_no_phone, "_dedup_key"] = df.loc[mask_no_phone, "_key_no_phone"]
-
-    df = df.drop_duplicates(subset="_dedup_key").drop(
-        columns=["_key_with_phone", "_key_no_phone", "_dedup_key"]
+    name = df["Full Name"].str.lower()
+    company = df["Company"].str.lower()
+    phone = df["Phone Number"]
+    # Contacts without a phone dedupe on name + company alone.
+    key = (name + "|" + phone.str.replace(_NON_DIGIT, "", regex=True) + "|" + company).where(
+        phone.ne(""), name + "|" + company
     )
-    return df
+    return df[~key.duplicated()]
 
 
 def save_to_csv(df: pd.DataFrame, path: str) -> None:
     df.to_csv(path, index=False)
 
+
+def load_from_csv(path: str) -> pd.DataFrame:
+    return pd.read_csv(path, dtype=str, keep_default_na=False)
+
+
+class ProfileCache:
+    """Outcome of each profile visit keyed by URL.
+
+    A stored row holds either the extracted contact or NULL for a profile
+    that did not match, the page's HTTP validators when the scraper
+    revalidates with them, and the time it was scraped. Rows older than
+    ttl_seconds read as missing.
+    """
+
+    _COLUMNS = ["url", "contact", "etag", "last_modified", "scraped_at"]
+
+    def __init__(self, path: str, ttl_seconds: Optional[float] = None, commit_every: int = 1) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._commit_every = commit_every
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            # A cache file from an older layout is dropped; it only saves work.
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(profiles)")]
+            if columns and columns != self._COLUMNS:
+                self._conn.execute("DROP TABLE profiles")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS profiles ("
+                "url TEXT PRIMARY KEY, contact TEXT, etag TEXT, last_modified TEXT, scraped_at REAL)"
+            )
+            self._conn.commit()
+
+    def get(self, url: str) -> Optional[Tuple[Optional[BrokerContact], Optional[str], Optional[str]]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT contact, etag, last_modified, scraped_at FROM profiles WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        contact_json, etag, last_modified, scraped_at = row
+        if self._ttl_seconds is not None and time.time() - scraped_at > self._ttl_seconds:
+            return None
+        contact = BrokerContact(**json.loads(contact_json)) if contact_json else None
+        return contact, etag, last_modified
+
+    def put(
+        self,
+        url: str,
+        contact: Optional[BrokerContact],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        contact_json = json.dumps(asdict(contact)) if contact is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO profiles VALUES (?, ?, ?, ?, ?)",
+                (url, contact_json, etag, last_modified, time.time()),
+            )
+            self._pending += 1
+            if self._pending >= self._commit_every:
+                self._conn.commit()
+                self._pending = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
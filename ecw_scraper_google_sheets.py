@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Optional, Set, Tuple
 
 import pandas as pd
 
@@ -11,39 +15,60 @@ except ImportError:
     gspread = None
     Credentials = None
 
+_SCOPES = (
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive",
+)
 
-def upload_dataframe_to_google_sheet(
-    df: pd.DataFrame,
-    sheet_id: str,
-    worksheet_name: str = "ECW Brokers",
-    service_account_json_path: Optional[str] = None,
-) -> None:
+# Worksheet handles keyed by (sheet_id, worksheet_name, service_account_json_path),
+# so repeated appends don't re-open the spreadsheet.
+_SHEET_CACHE: dict = {}
+
+
+def _require_gspread() -> None:
     if gspread is None or Credentials is None:
         raise RuntimeError(
             "gspread / google-auth are not installed. "
             "Either install them or disable Google Sheets upload."
         )
 
-    scopes = [
-        "https://www.googleapis.com/auth/spreadsheets",
-        "https://www.googleapis.com/auth/drive",
-    ]
 
+@lru_cache(maxsize=8)
+def _get_client(service_account_json_path: Optional[str]):
+    _require_gspread()
     if service_account_json_path:
         creds = Credentials.from_service_account_file(
-            service_account_json_path, scopes=scopes
+            service_account_json_path, scopes=list(_SCOPES)
         )
-        client = gspread.authorize(creds)
-    else:
-        client = gspread.service_account()
+        return gspread.authorize(creds)
+    return gspread.service_account()
 
-    sh = client.open_by_key(sheet_id)
 
+def _get_worksheet(
+    sheet_id: str,
+    worksheet_name: str,
+    service_account_json_path: Optional[str],
+):
+    key = (sheet_id, worksheet_name, service_account_json_path)
+    worksheet = _SHEET_CACHE.get(key)
+    if worksheet is not None:
+        return worksheet
+    sh = _get_client(service_account_json_path).open_by_key(sheet_id)
     try:
         worksheet = sh.worksheet(worksheet_name)
     except gspread.WorksheetNotFound:
         worksheet = sh.add_worksheet(title=worksheet_name, rows=100, cols=20)
+    _SHEET_CACHE[key] = worksheet
+    return worksheet
+
 
+def upload_dataframe_to_google_sheet(
+    df: pd.DataFrame,
+    sheet_id: str,
+    worksheet_name: str = "ECW Brokers",
+    service_account_json_path: Optional[str] = None,
+) -> None:
+    worksheet = _get_worksheet(sheet_id, worksheet_name, service_account_json_path)
     worksheet.batch_clear(["A2:Z1000"])
     values = df.astype(str).fillna("").values.tolist()
     if values:
@@ -55,27 +80,7 @@ def clear_worksheet_data(
     worksheet_name: str = "ECW Brokers",
     service_account_json_path: Optional[str] = None,
 ) -> None:
-    if gspread is None or Credentials is None:
-        raise RuntimeError(
-            "gspread / google-auth are not installed. "
-            "Either install them or disable Google Sheets upload."
-        )
-    scopes = [
-        "https://www.googleapis.com/auth/spreadsheets",
-        "https://www.googleapis.com/auth/drive",
-    ]
-    if service_account_json_path:
-        creds = Credentials.from_service_account_file(
-            service_account_json_path, scopes=scopes
-        )
-        client = gspread.authorize(creds)
-    else:
-        client = gspread.service_account()
-    sh = client.open_by_key(sheet_id)
-    try:
-        worksheet = sh.worksheet(worksheet_name)
-    except gspread.WorksheetNotFound:
-        worksheet = sh.add_worksheet(title=worksheet_name, rows=100, cols=20)
+    worksheet = _get_worksheet(sheet_id, worksheet_name, service_account_json_path)
     worksheet.batch_clear(["A2:Z1000"])
 
 
@@ -85,27 +90,79 @@ def append_row_to_google_sheet(
     worksheet_name: str = "ECW Brokers",
     service_account_json_path: Optional[str] = None,
 ) -> None:
-    if gspread is None or Credentials is None:
-        raise RuntimeError(
-            "gspread / google-auth are not installed. "
-            "Either install them or disable Google Sheets upload."
-        )
-    scopes = [
-        "https://www.googleapis.com/auth/spreadsheets",
-        "https://www.googleapis.com/auth/drive",
-    ]
-    if service_account_json_path:
-        creds = Credentials.from_service_account_file(
-            service_account_json_path, scopes=scopes
-        )
-        client = gspread.authorize(creds)
-    else:
-        client = gspread.service_account()
-    sh = client.open_by_key(sheet_id)
-    try:
-        worksheet = sh.worksheet(worksheet_name)
-    except gspread.WorksheetNotFound:
-        worksheet = sh.add_worksheet(title=worksheet_name, rows=100, cols=20)
+    worksheet = _get_worksheet(sheet_id, worksheet_name, service_account_json_path)
     row_str = [str(v) for v in row_values]
     worksheet.append_row(row_str, value_input_option="USER_ENTERED")
 
+
+def append_rows_to_google_sheet(
+    rows: list,
+    sheet_id: str,
+    worksheet_name: str = "ECW Brokers",
+    service_account_json_path: Optional[str] = None,
+) -> None:
+    if not rows:
+        return
+    worksheet = _get_worksheet(sheet_id, worksheet_name, service_account_json_path)
+    rows_str = [[str(v) for v in row] for row in rows]
+    worksheet.append_rows(rows_str, value_input_option="USER_ENTERED")
+
+
+class SheetBuffer:
+    # Batches live appends for the scrapers. A batch is sent once max_rows are
+    # pending or, with max_age set, once the last send is that many seconds
+    # old; a row repeated within a batch is sent once. One writer thread keeps
+    # appends ordered and off worker threads and event loops, and close()
+    # sends the rest and waits for them.
+    def __init__(
+        self,
+        sheet_id: str,
+        worksheet_name: str,
+        service_account_json: Optional[str],
+        max_rows: int = 25,
+        max_age: Optional[float] = None,
+    ) -> None:
+        self._sheet_id = sheet_id
+        self._worksheet_name = worksheet_name
+        self._service_account_json = service_account_json
+        self._max_rows = max_rows
+        self._max_age = max_age
+        self._rows: List[List[str]] = []
+        self._pending: Set[Tuple[str, ...]] = set()
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._writer = ThreadPoolExecutor(max_workers=1)
+
+    def add(self, row: List[str]) -> None:
+        with self._lock:
+            key = tuple(row)
+            if key not in self._pending:
+                self._pending.add(key)
+                self._rows.append(row)
+            if len(self._rows) >= self._max_rows or (
+                self._max_age is not None and time.monotonic() - self._last_flush > self._max_age
+            ):
+                self._submit_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            self._submit_locked()
+        self._writer.shutdown(wait=True)
+
+    def _submit_locked(self) -> None:
+        rows, self._rows = self._rows, []
+        self._pending.clear()
+        self._last_flush = time.monotonic()
+        if rows:
+            self._writer.submit(self._write, rows)
+
+    def _write(self, rows: List[List[str]]) -> None:
+        try:
+            append_rows_to_google_sheet(
+                rows,
+                sheet_id=self._sheet_id,
+                worksheet_name=self._worksheet_name,
+                service_account_json_path=self._service_account_json,
+            )
+        except Exception as e:
+            print(f"  (Sheet append of {len(rows)} rows failed: {e})")
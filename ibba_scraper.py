@@ -1,19 +1,35 @@
 from __future__ import annotations
 
+import argparse
+import csv
+import os
+import queue
 import re
-from typing import List, Optional, Tuple
-from urllib.parse import urljoin
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
 
-from playwright.sync_api import Page, sync_playwright
+from playwright.sync_api import Browser, BrowserContext, Page, sync_playwright
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+from ecw_scraper_browser import block_heavy_requests
 from ecw_scraper_data import (
+    CSV_COLUMNS,
     BrokerContact,
+    ProfileCache,
     clean_contacts_dataframe,
-    contacts_to_dataframe,
+    contact_to_row,
+    load_from_csv,
     save_to_csv,
 )
 from ecw_scraper_google_sheets import (
-    append_row_to_google_sheet,
+    SheetBuffer,
     clear_worksheet_data,
     upload_dataframe_to_google_sheet,
 )
@@ -30,123 +46,252 @@ ECW_KEYWORDS = [
     "Wash Concepts",
 ]
 
+# pyahocorasick, when installed, finds every keyword in one pass over the bio;
+# otherwise each keyword is a substring check.
+_ECW_KEYWORDS_LOWER = tuple(kw.lower() for kw in ECW_KEYWORDS)
+_KEYWORDS_AUTOMATON = None
+if ahocorasick is not None:
+    _KEYWORDS_AUTOMATON = ahocorasick.Automaton()
+    for _i, _kw in enumerate(_ECW_KEYWORDS_LOWER):
+        _KEYWORDS_AUTOMATON.add_word(_kw, _i)
+    _KEYWORDS_AUTOMATON.make_automaton()
+
+# Listing cards mentioning any of these (and no ECW keyword) are skipped
+# without opening the profile. Empty by default: a broker listed under an
+# unrelated specialty can still sell car washes.
+CARD_DENY_KEYWORDS: List[str] = []
+_CARD_DENY_KEYWORDS_LOWER = tuple(kw.lower() for kw in CARD_DENY_KEYWORDS)
+
 OUTPUT_CSV = "ibba_ecw_brokers.csv"
 MAX_PROFILES_PER_STATE: Optional[int] = None
+# Each profile worker runs its own browser; keep this small to stay polite.
+PROFILE_WORKERS = 4
+# Each worker swaps in a fresh context after this many profiles, which frees
+# the DOM and JS heap a long-lived page accumulates.
+PROFILES_PER_CONTEXT = 25
 SHEET_ID = "1MMnxeTTlf9noOKmmvGEBl9xPinsNTd12ZXv7lBa6S9A"
 WORKSHEET_NAME = "IBBA"
 SERVICE_ACCOUNT_JSON = "ecw-broker-scraper-ef955c25c30d.json"
+SHEET_FLUSH_ROWS = 20
+# Profile outcomes are reused across runs until they are this old.
+PROFILE_CACHE_PATH: Optional[str] = ".ibba_cache.db"
+PROFILE_CACHE_TTL_SECONDS = 7 * 24 * 3600
+_PROFILE_CACHE_COMMIT_EVERY = 20
+# Cookies and local storage saved per state, so the next run of that state
+# starts warm without leaking into other states. Set to None to start clean.
+STORAGE_STATE_PATH: Optional[str] = "ibba_storage_{state}.json"
+
+_RE_CONTACT = re.compile(r"contact", re.I)
+_RE_MORE_DETAILS = re.compile(r"more\s+details\s*»?", re.I)
+_RE_PHONE_US = re.compile(r"\(?\d{3}\)?[\s.\-]?\d{3}[\s.\-]?\d{4}")
+_RE_ANY_DIGIT = re.compile(r"\d")
+_RE_THREE_DIGITS = re.compile(r"\d{3}")
+_RE_ALL_DIGITS = re.compile(r"^\d+$")
+_RE_NON_DIGIT = re.compile(r"\D")
+_KEEP_DIGITS = str.maketrans("", "", "".join(chr(c) for c in range(256) if not "0" <= chr(c) <= "9"))
+# All three obfuscated forms in one pass; the group name ranks the match.
+_RE_MAILTO_OBFUSCATED = re.compile(
+    r"(?P<bracket>[\w.\-+]+?\s*\[at\]\s*[\w.\-+]+\s*\[dot\]\s*\w+)"
+    r"|(?P<paren>[\w.\-+]+?\s*\(at\)\s*[\w.\-+]+\s*\(dot\)\s*\w+)"
+    r"|(?P<plain>[\w.\-+]+?\s*@\s*[\w.\-+]+\s*\.\s*\w+)",
+    re.I,
+)
+_RE_OBFUSCATION_TOKEN = re.compile(r"\[at\]|\(at\)|\[dot\]|\(dot\)| ", re.I)
+_OBFUSCATION_TOKENS = {"[at]": "@", "(at)": "@", "[dot]": ".", "(dot)": "."}
+
+_SEL_MAILTO = "a[href^='mailto:']"
+_SEL_TEL = "a[href^='tel:']"
+# CSS form of _RE_MORE_DETAILS for the rendered state page.
+_SEL_MORE_DETAILS = "a:text-matches('more\\s+details', 'i')"
 
 OUTPUT_HEADERS = {
     "Notes (URL Link)": "Notes (Keywords Found)",
 }
 
-def _safe_text(locator, default: str = "N/A") -> str:
-    try:
-        if locator is None or locator.count() == 0:
-            return default
-        text = locator.first.inner_text(timeout=5000).strip()
-        return text or default
-    except Exception:
-        return default
+# Raw-HTML form of ECW_KEYWORDS: words may be split by newlines, &nbsp; or
+# inline tags. A loose match only costs a render; a missed one loses a broker.
+_RE_ECW_KEYWORDS_HTML = re.compile(
+    "|".join(
+        r"(?:\s|&nbsp;|&#160;|<[^>]*>)+".join(re.escape(word) for word in kw.split())
+        for kw in ECW_KEYWORDS
+    ),
+    re.I,
+)
+
 
+# Present on any real profile; a block or challenge page served with a 200
+# has none of them, so its missing keywords say nothing about the broker.
+_RE_PROFILE_MARKERS_HTML = re.compile(r"icon-location|href\s*=\s*[\"']?(?:tel|mailto):", re.I)
 
-def _safe_attr(locator, attr: str, default: Optional[str] = None) -> Optional[str]:
+
+def _fetch_html(page: Page, url: str) -> Optional[str]:
+    # page.request shares the browser context's cookies and connection pool.
     try:
-        if locator is None or locator.count() == 0:
-            return default
-        return locator.first.get_attribute(attr)
+        response = page.request.get(url, timeout=20000)
+        if not response.ok:
+            return None
+        return response.text()
     except Exception:
-        return default
+        return None
 
 
 def _profile_contains_ecw_keyword(bio_specialties: str) -> Tuple[bool, List[str]]:
     if not bio_specialties or bio_specialties == "N/A":
         return False, []
     text = bio_specialties.lower()
-    found = [kw for kw in ECW_KEYWORDS if kw.lower() in text]
+    if _KEYWORDS_AUTOMATON is not None:
+        hits = {i for _, i in _KEYWORDS_AUTOMATON.iter(text)}
+        found = [kw for i, kw in enumerate(ECW_KEYWORDS) if i in hits]
+    elif not any(kw in text for kw in _ECW_KEYWORDS_LOWER):
+        return False, []
+    else:
+        found = [kw for kw, kw_lower in zip(ECW_KEYWORDS, _ECW_KEYWORDS_LOWER) if kw_lower in text]
     return (len(found) > 0, found)
 
 
-def _extract_email_from_profile(page: Page) -> str:
-    try:
-        mailto = page.locator("a[href^='mailto:']").first
-        if mailto.count() > 0:
-            href = mailto.get_attribute("href")
-            if href and href.startswith("mailto:"):
-                addr = href.replace("mailto:", "").strip().split("?")[0].strip()
-                if addr and "@" in addr:
-                    return addr
-    except Exception:
-        pass
+# Elements that carry the contact data; once one is attached the profile is
+# readable, without waiting for the full "load" event.
+_PROFILE_READY_SELECTOR = "img[src*='icon-location'], a[href^='tel:'], a[href^='mailto:']"
+
+# Only this much of the main/body text is ever scanned, so it is cut in-page
+# before crossing the Playwright connection.
+_MAX_PROFILE_TEXT = 50000
+
+_BIO_LABELS = ["Specialty", "Specialties", "Bio", "About", "Areas of Expertise"]
+_BIO_FALLBACK_SELECTOR = "main p, main div, .content p, .profile p, [class*='bio']"
+
+# Everything the extractors need from a rendered profile, read in one
+# evaluate instead of a locator round-trip per field.
+_PROFILE_FIELDS_JS = """
+([bioLabels, bioFallbackSelector, mailtoSelector, telSelector, maxText]) => {
+    const SKIP = new Set(["SCRIPT", "STYLE", "NOSCRIPT", "TEMPLATE"]);
+    const text = (el) => (el ? (el.innerText || "").trim() : "");
+    // Closest stand-in for get_by_text(label, exact=False).first: the element
+    // holding the first visible text node that contains the label.
+    const byText = (label) => {
+        const needle = label.toLowerCase();
+        const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+        for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+            const parent = node.parentElement;
+            if (!parent || SKIP.has(parent.tagName)) continue;
+            if (node.nodeValue.replace(/\\s+/g, " ").toLowerCase().includes(needle)) return parent;
+        }
+        return null;
+    };
+    const companyLabel = byText("Company");
+    const heading = document.querySelector("h1, h2, h3, h4, h5, h6, [role='heading']");
+    const mailto = document.querySelector(mailtoSelector);
+    const main = document.querySelector("main") || document.body;
+    return {
+        bio_candidates: bioLabels.map((label) => {
+            const el = byText(label);
+            return el && el.parentElement ? text(el.parentElement) : null;
+        }),
+        bio_fallback: text(document.querySelector(bioFallbackSelector)),
+        heading: text(heading),
+        mailto_href: mailto ? mailto.getAttribute("href") : null,
+        tels: Array.from(document.querySelectorAll(telSelector)).map((a) => ({
+            href: a.getAttribute("href"),
+            text: (a.innerText || "").trim(),
+        })),
+        company_label_next: companyLabel ? text(companyLabel.nextElementSibling) : null,
+        main_text: main ? (main.innerText || "").slice(0, maxText) : "",
+        body_text: document.body ? (document.body.innerText || "").slice(0, maxText) : "",
+    };
+}
+"""
 
-    try:
-        contact_btn = page.get_by_role("button", name=re.compile(r"contact", re.I)).first
-        if contact_btn.count() > 0:
-            contact_btn.click()
-            page.wait_for_load_state("load", timeout=10000)
-            mailto_after = page.locator("a[href^='mailto:']").first
-            if mailto_after.count() > 0:
-                href = mailto_after.get_attribute("href")
-                if href and "@" in href:
-                    return href.replace("mailto:", "").strip().split("?")[0].strip()
-    except Exception:
-        pass
 
+def _read_profile(page: Page) -> Dict:
     try:
-        contact_link = page.get_by_role("link", name=re.compile(r"contact", re.I)).first
-        if contact_link.count() > 0:
-            contact_link.click()
-            page.wait_for_load_state("load", timeout=10000)
-            mailto_after = page.locator("a[href^='mailto:']").first
-            if mailto_after.count() > 0:
-                href = mailto_after.get_attribute("href")
-                if href and "@" in href:
-                    return href.replace("mailto:", "").strip().split("?")[0].strip()
+        page.wait_for_selector(_PROFILE_READY_SELECTOR, timeout=10000)
     except Exception:
         pass
-
     try:
-        body_text = page.locator("body").inner_text(timeout=5000)
-        for pat in [
-            r"[\w.\-+]+?\s*\[at\]\s*[\w.\-+]+\s*\[dot\]\s*\w+",
-            r"[\w.\-+]+?\s*\(at\)\s*[\w.\-+]+\s*\(dot\)\s*\w+",
-            r"[\w.\-+]+?\s*@\s*[\w.\-+]+\s*\.\s*\w+",
-        ]:
-            m = re.search(pat, body_text, re.I)
-            if m:
-                candidate = m.group(0).replace("[at]", "@").replace("[dot]", ".").replace("(at)", "@").replace("(dot)", ".").replace(" ", "")
-                if "@" in candidate and "." in candidate:
-                    return candidate
+        return page.evaluate(
+            _PROFILE_FIELDS_JS,
+            [_BIO_LABELS, _BIO_FALLBACK_SELECTOR, _SEL_MAILTO, _SEL_TEL, _MAX_PROFILE_TEXT],
+        ) or {}
     except Exception:
-        pass
+        return {}
 
-    return "N/A"
 
+def _extract_bio_specialties(data: Dict) -> str:
+    for text in data.get("bio_candidates") or []:
+        if text and len(text) < 2000:
+            return text
+    return data.get("bio_fallback") or "N/A"
 
-def _extract_bio_specialties(page: Page) -> str:
-    for label in ["Specialty", "Specialties", "Bio", "About", "Areas of Expertise"]:
-        try:
-            el = page.get_by_text(label, exact=False).first
-            if el.count() == 0:
-                continue
-            parent = el.locator("xpath=..")
-            if parent.count() > 0:
-                text = parent.first.inner_text(timeout=3000).strip()
-                if text and len(text) < 2000:
-                    return text
-        except Exception:
-            continue
+
+def _email_from_contact_control(page: Page, role: str) -> Optional[str]:
+    # Some profiles only reveal the mailto link behind a "Contact" button or
+    # link; this navigates, so it runs after every other field has been read.
     try:
-        block = page.locator("main p, main div, .content p, .profile p, [class*='bio']").first
-        if block.count() > 0:
-            return block.first.inner_text(timeout=3000).strip() or "N/A"
+        control = page.get_by_role(role, name=_RE_CONTACT).first
+        if control.count() > 0:
+            control.click()
+            page.wait_for_load_state("domcontentloaded", timeout=10000)
+            # The wait hands back the link itself, so no separate count()
+            # and lookup; a timeout means the page has none.
+            mailto_after = page.wait_for_selector(_SEL_MAILTO, state="attached", timeout=5000)
+            href = mailto_after.get_attribute("href") if mailto_after else None
+            if href and "@" in href:
+                return href.replace("mailto:", "").strip().split("?")[0].strip()
     except Exception:
         pass
+    return None
+
+
+def _email_from_obfuscated_text(body_text: str) -> Optional[str]:
+    # [at]/[dot] beats (at)/(dot), which beats a spaced-out "@": the first
+    # bracket match returns at once, the others wait for the scan to finish.
+    found: Dict[str, str] = {}
+    for m in _RE_MAILTO_OBFUSCATED.finditer(body_text):
+        kind = m.lastgroup
+        if kind in found:
+            continue
+        candidate = _RE_OBFUSCATION_TOKEN.sub(
+            lambda t: _OBFUSCATION_TOKENS.get(t.group(0).lower(), ""), m.group(0)
+        )
+        if "@" not in candidate or "." not in candidate:
+            continue
+        if kind == "bracket":
+            return candidate
+        found[kind] = candidate
+    return found.get("paren") or found.get("plain")
+
+
+# When a profile has no mailto link, the fallback that last worked on the
+# same host is tried first, so hosts that never need the contact click stop
+# paying for it.
+_EMAIL_FALLBACKS = ("contact_button", "contact_link", "obfuscated")
+_EMAIL_STRATEGY_CACHE: Dict[str, str] = {}
+
+
+def _extract_email(data: Dict, page: Optional[Page] = None) -> str:
+    href = data.get("mailto_href")
+    if href and href.startswith("mailto:"):
+        addr = href.replace("mailto:", "").strip().split("?")[0].strip()
+        if addr and "@" in addr:
+            return addr
+
+    host = urlsplit(page.url).netloc if page is not None else ""
+    cached = _EMAIL_STRATEGY_CACHE.get(host)
+    for strategy in sorted(_EMAIL_FALLBACKS, key=lambda name: name != cached):
+        if strategy == "obfuscated":
+            addr = _email_from_obfuscated_text(data.get("body_text") or "")
+        elif page is None:
+            continue
+        else:
+            addr = _email_from_contact_control(page, "button" if strategy == "contact_button" else "link")
+        if addr:
+            _EMAIL_STRATEGY_CACHE[host] = strategy
+            return addr
+
     return "N/A"
 
 
 _CITY_STATE_ONLY = re.compile(r"^[^,]+,\s*[A-Za-z]{2}$")
-_RE_CITY_ST = re.compile(r"([A-Za-z][A-Za-z\s\.\-']+),\s*([A-Za-z]{2})(?:\s+\d{5}(?:-\d{4})?|\s+United States|\s|$)")
 
 _US_STATE_ABBREV = {
     "alabama": "AL", "alaska": "AK", "arizona": "AZ", "arkansas": "AR", "california": "CA",
@@ -161,70 +306,71 @@ _US_STATE_ABBREV = {
     "texas": "TX", "utah": "UT", "vermont": "VT", "virginia": "VA", "washington": "WA",
     "west virginia": "WV", "wisconsin": "WI", "wyoming": "WY", "district of columbia": "DC",
 }
-_RE_CITY_STATE_BEFORE_ZIP = re.compile(
-    r"([A-Za-z][A-Za-z\s\.\-']+?),\s*([A-Za-z]+(?:\s+[A-Za-z]+)*)\s+\d{5}(?:-\d{4})?",
-    re.I,
+# Lowercased full names and two-letter codes, both mapped to the code.
+_STATE_TO_ABBREV = {
+    **_US_STATE_ABBREV,
+    **{code.lower(): code for code in _US_STATE_ABBREV.values()},
+}
+# Location tiers, each scanned on its own: a lower tier's match would
+# otherwise consume text a higher one needs ("Broker, St" hiding
+# "St. Petersburg, FL").
+_RE_CITY_STATE_ZIP = re.compile(
+    r"([A-Za-z][A-Za-z\s\.\-']+?),\s*([A-Za-z]+(?:\s+[A-Za-z]+)*)\s+\d{5}(?:-\d{4})?"
 )
+_RE_CITY_ST = re.compile(
+    r"([A-Za-z][A-Za-z\s\.\-']+),\s*([A-Za-z]{2})(?:\s+\d{5}(?:-\d{4})?|\s+United States|\s|$)"
+)
+_RE_CITY_ST_WORD = re.compile(r"([A-Za-z][A-Za-z\s\.\-']+),\s*([A-Za-z]{2})\b")
 
 
 def _normalize_state_to_abbrev(state_raw: str) -> Optional[str]:
-    s = (state_raw or "").strip()
-    if len(s) == 2 and s.isalpha():
-        return s.upper()
-    return _US_STATE_ABBREV.get(s.lower())
+    return _STATE_TO_ABBREV.get((state_raw or "").strip().lower())
 
 
-def _extract_location_from_profile(page: Page) -> str:
-    try:
-        page.wait_for_selector("img[src*='icon-location'], a[href^='tel:']", timeout=10000)
-    except Exception:
-        pass
-    try:
-        body_text = page.evaluate(
-            "() => (document.querySelector('main') || document.body || {}).innerText || ''"
-        )
-    except Exception:
-        body_text = ""
+def _zip_location(city: str, state_raw: str) -> Optional[str]:
+    city = city.strip()
+    if not city or len(city) > 50 or _RE_ALL_DIGITS.match(city):
+        return None
+    state_abbrev = _normalize_state_to_abbrev(state_raw)
+    if not state_abbrev:
+        return None
+    out = f"{city}, {state_abbrev}"
+    return out if _CITY_STATE_ONLY.match(out) else None
+
+
+def _st_location(city: str, state: str) -> Optional[str]:
+    city = city.strip()
+    if not city or len(city) > 50 or _RE_ALL_DIGITS.match(city):
+        return None
+    out = f"{city}, {state.upper()}"
+    return out if _CITY_STATE_ONLY.match(out) else None
+
+
+def _extract_location(data: Dict) -> str:
+    body_text = data.get("main_text") or data.get("body_text") or ""
     if not body_text or not isinstance(body_text, str):
-        try:
-            body_text = page.inner_text("body", timeout=3000) or ""
-        except Exception:
-            return "N/A"
-    body_text = body_text[:50000].replace("\u00a0", " ")
+        return "N/A"
+    body_text = body_text[:_MAX_PROFILE_TEXT].replace("\u00a0", " ")
     text = " ".join(body_text.split())
     cutoff = int(len(text) * 0.75)
 
-    for match in _RE_CITY_STATE_BEFORE_ZIP.finditer(text):
+    for match in _RE_CITY_STATE_ZIP.finditer(text):
         if match.start() > cutoff:
             break
-        city = match.group(1).strip()
-        state_raw = match.group(2).strip()
-        if not city or len(city) > 50 or re.match(r"^\d+$", city):
-            continue
-        state_abbrev = _normalize_state_to_abbrev(state_raw)
-        if state_abbrev:
-            out = f"{city}, {state_abbrev}"
-            if _CITY_STATE_ONLY.match(out):
-                return out
-
+        out = _zip_location(match.group(1), match.group(2))
+        if out:
+            return out
     for match in _RE_CITY_ST.finditer(text):
         if match.start() > cutoff:
             break
-        city = match.group(1).strip()
-        state = match.group(2).strip()
-        if len(state) != 2 or not city or len(city) > 50:
-            continue
-        if re.match(r"^\d+$", city):
-            continue
-        out = f"{city}, {state.upper()}"
-        if _CITY_STATE_ONLY.match(out):
+        out = _st_location(match.group(1), match.group(2))
+        if out:
+            return out
+    # endpos behaves like the old text[:cutoff] slice without copying it.
+    for match in _RE_CITY_ST_WORD.finditer(text, 0, cutoff):
+        out = _st_location(match.group(1), match.group(2))
+        if out:
             return out
-    for match in re.finditer(r"([A-Za-z][A-Za-z\s\.\-']+),\s*([A-Za-z]{2})\b", text[:cutoff]):
-        city, state = match.group(1).strip(), match.group(2).strip()
-        if len(state) == 2 and city and len(city) <= 50 and not re.match(r"^\d+$", city):
-            out = f"{city}, {state.upper()}"
-            if _CITY_STATE_ONLY.match(out):
-                return out
     return "N/A"
 
 
@@ -232,7 +378,12 @@ _IBBA_HEADER_DIGITS = "8886864222"
 
 
 def _normalize_phone_digits(s: str) -> str:
-    return re.sub(r"\D", "", s) if s else ""
+    if not s:
+        return ""
+    # The table only covers U+0000-U+00FF; anything left above that (rare in
+    # a tel: link) goes through the regex.
+    digits = s.translate(_KEEP_DIGITS)
+    return digits if digits.isascii() else _RE_NON_DIGIT.sub("", digits)
 
 
 def _is_ibba_header(digits: str) -> bool:
@@ -242,116 +393,41 @@ def _is_ibba_header(digits: str) -> bool:
     return d == _IBBA_HEADER_DIGITS
 
 
-def _extract_phone_from_profile(page: Page) -> str:
-    try:
-        all_tel = page.locator("a[href^='tel:']")
-        n = all_tel.count()
-        for i in range(n):
-            node = all_tel.nth(i)
-            href = node.get_attribute("href")
-            if not href or not href.startswith("tel:"):
-                continue
-            num_raw = href.replace("tel:", "").strip().split("?")[0].strip()
-            digits = _normalize_phone_digits(num_raw)
-            if _is_ibba_header(digits):
-                continue
-            if len(digits) >= 10:
-                text = node.inner_text(timeout=2000).strip()
-                return text if (text and re.search(r"\d", text)) else num_raw
-        for i in range(n):
-            node = all_tel.nth(i)
-            text = node.inner_text(timeout=2000).strip()
-            if not text or not re.search(r"\d{3}", text):
-                continue
-            digits = _normalize_phone_digits(text)
-            if _is_ibba_header(digits):
-                continue
-            if len(digits) >= 10:
-                return text
-    except Exception:
-        pass
-    return "N/A"
-
-
-def _extract_company_from_profile(page: Page) -> str:
-    icon_selectors = (
-        "[class*='apartment'], [class*='fa-apartment'], "
-        "[class*='building'], [class*='fa-building'], "
-        "svg[class*='building'], svg[class*='apartment'], "
-        "[class*='icon-apartment'], [class*='icon-building']"
-    )
-    try:
-        icon = page.locator(icon_selectors).first
-        if icon.count() > 0:
-            next_sib = icon.locator("xpath=following-sibling::*[1]")
-            if next_sib.count() > 0:
-                text = next_sib.first.inner_text(timeout=2000).strip()
-                if text and len(text) <= 200:
-                    return text
-            parent = icon.locator("xpath=..")
-            if parent.count() > 0:
-                raw = parent.first.inner_text(timeout=2000).strip()
-                if raw and len(raw) <= 200:
-                    for prefix in ("apartment", "building", "company"):
-                        if raw.lower().startswith(prefix):
-                            raw = raw[len(prefix):].strip()
-                            break
-                    if raw:
-                        return raw
-    except Exception:
-        pass
-    try:
-        company = page.evaluate("""
-            () => {
-                const walk = (el) => {
-                    const text = (el.innerText || '').trim();
-                    const m = text.match(/^(apartment|building|company)\\s+(.+)$/i);
-                    if (m && m[2].length > 0 && m[2].length < 200) return m[2].trim();
-                    for (const c of el.children || []) { const r = walk(c); if (r) return r; }
-                    return null;
-                };
-                return walk(document.body) || null;
-            }
-        """)
-        if company:
-            return company
-    except Exception:
-        pass
-    try:
-        company_label = page.get_by_text("Company", exact=False).first
-        if company_label.count() > 0:
-            sib = company_label.locator("xpath=following-sibling::*[1]")
-            if sib.count() > 0:
-                return sib.first.inner_text(timeout=2000).strip() or "N/A"
-    except Exception:
-        pass
+def _extract_phone(data: Dict) -> str:
+    tels = data.get("tels") or []
+    for tel in tels:
+        href = tel.get("href")
+        if not href or not href.startswith("tel:"):
+            continue
+        num_raw = href.replace("tel:", "").strip().split("?")[0].strip()
+        digits = _normalize_phone_digits(num_raw)
+        if _is_ibba_header(digits):
+            continue
+        if len(digits) >= 10:
+            text = tel.get("text") or ""
+            return text if (text and _RE_ANY_DIGIT.search(text)) else num_raw
+    for tel in tels:
+        text = tel.get("text") or ""
+        if not text or not _RE_THREE_DIGITS.search(text):
+            continue
+        digits = _normalize_phone_digits(text)
+        if _is_ibba_header(digits):
+            continue
+        if len(digits) >= 10:
+            return text
     return "N/A"
 
 
-def _get_listing_cards_and_links(page: Page):
-    more_details = page.get_by_role("link", name=re.compile(r"more\s+details\s*»?", re.I))
+def _get_listing_cards_and_links(page: Page) -> List[Tuple[Optional[str], str]]:
     try:
-        n = more_details.count()
+        return page.locator(_SEL_MORE_DETAILS).evaluate_all(_LISTING_CARDS_JS) or []
     except Exception:
-        n = 0
-    for i in range(n):
-        link = more_details.nth(i)
-        try:
-            card = link.locator("xpath=ancestor::*[self::div or self::article or self::li or self::section][position()<=4][1]")
-            if card.count() == 0:
-                card = link.locator("xpath=..")
-            yield (card, link)
-        except Exception:
-            yield (None, link)
+        return []
 
 
-def _text_from_card(card, page: Page) -> str:
-    if card is None or card.count() == 0:
-        return ""
-    try:
-        return card.first.inner_text(timeout=5000).strip()
-    except Exception:
-        return ""
+def _starts_with_area_code(line: str) -> bool:
+    digits = line[1:4] if line.startswith("(") else line[:3]
+    return len(digits) == 3 and digits.isdecimal()
 
 
 def _parse_listing_card_text(card_text: str) -> Tuple[str, str, str]:
@@ -359,126 +435,338 @@ def _parse_listing_card_text(card_text: str) -> Tuple[str, str, str]:
     if not card_text:
         return name, company, phone
     lines = [ln.strip() for ln in card_text.splitlines() if ln.strip()]
-    phone_match = re.search(r"\(?\d{3}\)?[\s.\-]?\d{3}[\s.\-]?\d{4}", card_text)
+    phone_match = _RE_PHONE_US.search(card_text)
     if phone_match:
         phone = phone_match.group(0).strip()
     if lines:
         name = lines[0]
-    if len(lines) >= 2 and lines[1] != phone and not re.match(r"^\(?\d{3}\)?", lines[1]):
+    if len(lines) >= 2 and lines[1] != phone and not _starts_with_area_code(lines[1]):
         company = lines[1]
     return name, company, phone
 
 
-def _scrape_state_page(
-    page: Page,
-    state_name: str,
-    state_url: str,
-    max_profiles: Optional[int] = None,
-    *,
-    sheet_id: Optional[str] = None,
-    worksheet_name: str = "IBBA",
-    service_account_json: Optional[str] = None,
-) -> List[BrokerContact]:
-    contacts: List[BrokerContact] = []
-    page.goto(state_url, wait_until="domcontentloaded", timeout=60000)
+class _ListingHTMLParser(HTMLParser):
+    # "more details" links and their card text from the server-rendered state
+    # page, with the same card rule as _LISTING_CARDS_JS. A card's text is
+    # known once its element closes, so links wait on their card's frame.
+    _SKIP = {"script", "style", "noscript", "template"}
+    _BLOCK = {"p", "div", "br", "li", "tr", "h1", "h2", "h3", "h4", "h5", "h6", "section", "article"}
+    _CARD = {"div", "article", "li", "section"}
+    _VOID = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+    # Source line breaks are plain whitespace; only block edges start a line.
+    _WHITESPACE = str.maketrans("\n\r\t\f", "    ")
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.cards: List[List[str]] = []
+        self._text: List[str] = []
+        # Open elements as [tag, text start index, cards waiting on this one].
+        self._stack: List[list] = []
+        self._skip = 0
+        self._link: Optional[tuple] = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self._SKIP:
+            self._skip += 1
+            return
+        if self._skip:
+            return
+        if tag in self._BLOCK:
+            self._text.append("\n")
+        if tag in self._VOID:
+            return
+        frame = [tag, len(self._text), []]
+        if tag == "a" and self._stack:
+            card = next((f for f in reversed(self._stack) if f[0] in self._CARD), self._stack[-1])
+            attrs = dict(attrs)
+            self._link = (frame, attrs.get("href"), attrs.get("aria-label"), card)
+        self._stack.append(frame)
+
+    def handle_endtag(self, tag):
+        if tag in self._SKIP:
+            self._skip = max(0, self._skip - 1)
+            return
+        if self._skip:
+            return
+        if tag in self._BLOCK:
+            self._text.append("\n")
+        if not any(f[0] == tag for f in self._stack):
+            return
+        while self._stack:
+            frame = self._stack.pop()
+            self._close(frame)
+            if frame[0] == tag:
+                break
+
+    def handle_data(self, data):
+        if not self._skip:
+            self._text.append(data.translate(self._WHITESPACE))
+
+    def _close(self, frame: list) -> None:
+        if self._link is not None and self._link[0] is frame:
+            _, href, label, card = self._link
+            self._link = None
+            name = label or "".join(self._text[frame[1]:])
+            if _RE_MORE_DETAILS.search(" ".join(name.split())):
+                entry = [href, ""]
+                self.cards.append(entry)
+                card[2].append(entry)
+        if frame[2]:
+            lines = ("".join(self._text[frame[1]:])).split("\n")
+            text = "\n".join(" ".join(ln.split()) for ln in lines if ln.strip())
+            for entry in frame[2]:
+                entry[1] = text
+
+    def result(self) -> List[List[str]]:
+        while self._stack:
+            self._close(self._stack.pop())
+        return self.cards
+
+
+def _parse_listing_html(raw_html: str) -> List[List[str]]:
+    parser = _ListingHTMLParser()
     try:
-        page.get_by_role("link", name=re.compile(r"more\s+details", re.I)).first.wait_for(state="visible", timeout=25000)
+        parser.feed(raw_html)
+        parser.close()
     except Exception:
-        print(f"  No 'more details' links found on {state_url}; state page may have changed or be empty.")
-        return contacts
+        pass
+    return parser.result()
+
 
+def _collect_listings(
+    cards: List,
+    state_url: str,
+    max_profiles: Optional[int] = None,
+) -> List[Tuple[str, str, str, List[str]]]:
+    listings: List[Tuple[str, str, str, List[str]]] = []
     seen_urls = set()
-    visited = 0
-    for card, link in _get_listing_cards_and_links(page):
-        if max_profiles is not None and visited >= max_profiles:
+    for href, card_text in cards:
+        if max_profiles is not None and len(listings) >= max_profiles:
             break
-        try:
-            href = _safe_attr(link, "href")
-            if not href:
+        if not href:
+            continue
+        profile_url = urljoin(state_url, href)
+        if profile_url in seen_urls:
+            continue
+        seen_urls.add(profile_url)
+        _, card_keywords = _profile_contains_ecw_keyword(card_text)
+        if not card_keywords and _CARD_DENY_KEYWORDS_LOWER:
+            card_lower = card_text.lower()
+            if any(kw in card_lower for kw in _CARD_DENY_KEYWORDS_LOWER):
                 continue
-            profile_url = urljoin(state_url, href)
-            if profile_url in seen_urls:
+        list_name, list_company, _ = _parse_listing_card_text(card_text)
+        listings.append((profile_url, list_name, list_company, card_keywords))
+    return listings
+
+
+def _scrape_profile(
+    page: Page,
+    profile_url: str,
+    list_name: str,
+    list_company: str,
+    card_keywords: Optional[List[str]] = None,
+) -> Tuple[Optional[BrokerContact], bool]:
+    # Returns the contact (None for no match) and whether that outcome came
+    # from a real profile read, i.e. is safe to cache.
+    # Profiles are server-rendered, so one plain GET decides most of them: no
+    # keyword anywhere in the HTML means no keyword in the bio. Only
+    # candidates (or failed fetches) get the full Chromium render. A card
+    # that already names a keyword is a match, so it goes straight to render.
+    if not card_keywords:
+        raw_html = _fetch_html(page, profile_url)
+        if raw_html is not None and not _RE_ECW_KEYWORDS_HTML.search(raw_html):
+            return None, _RE_PROFILE_MARKERS_HTML.search(raw_html) is not None
+
+    for _attempt in range(2):
+        try:
+            page.goto(profile_url, wait_until="domcontentloaded", timeout=60000)
+            break
+        except Exception as goto_err:
+            if _attempt == 0:
                 continue
-            seen_urls.add(profile_url)
-            visited += 1
+            raise goto_err
+
+    data = _read_profile(page)
+    # An empty read (evaluate failed, or nothing rendered) is not a verdict.
+    read_ok = bool(data.get("body_text"))
+    _, bio_keywords = _profile_contains_ecw_keyword(_extract_bio_specialties(data))
+    if card_keywords:
+        keywords_found = [kw for kw in ECW_KEYWORDS if kw in bio_keywords or kw in card_keywords]
+    else:
+        keywords_found = bio_keywords
+    if not keywords_found:
+        return None, read_ok
+
+    location = _extract_location(data)
+    full_name = list_name if list_name != "N/A" else (data.get("heading") or "N/A")
+    company = list_company if list_company != "N/A" else (data.get("company_label_next") or "N/A")
+    phone = _extract_phone(data)
+    email = _extract_email(data, page)
+
+    notes = "; ".join(keywords_found) if keywords_found else "N/A"
+    contact = BrokerContact(
+        full_name=full_name,
+        phone_number=phone,
+        location=location,
+        company=company,
+        email=email,
+        source_url=profile_url,
+        notes=notes,
+    )
+    return contact, read_ok
+
 
-            card_text = _text_from_card(card, page)
-            list_name, list_company, list_phone = _parse_listing_card_text(card_text)
+def _storage_state_path(state_name: str) -> Optional[str]:
+    if not STORAGE_STATE_PATH:
+        return None
+    slug = re.sub(r"[^a-z0-9]+", "_", state_name.lower()).strip("_")
+    return STORAGE_STATE_PATH.format(state=slug)
+
+
+def _new_context(browser: Browser, storage_path: Optional[str] = None) -> BrowserContext:
+    if storage_path and os.path.exists(storage_path):
+        try:
+            return browser.new_context(storage_state=storage_path)
+        except Exception as e:
+            print(f"  (Ignoring saved storage state {storage_path!r}: {e})")
+    return browser.new_context()
 
-            _loaded = False
-            for _attempt in range(2):
+
+def _save_storage_state(context: BrowserContext, storage_path: Optional[str]) -> None:
+    if not storage_path:
+        return
+    try:
+        context.storage_state(path=storage_path)
+    except Exception as e:
+        print(f"  (Could not save storage state: {e})")
+
+
+def _new_page(browser: Browser | BrowserContext) -> Page:
+    page = browser.new_page()
+    page.route("**/*", block_heavy_requests)
+    page.set_default_timeout(30000)
+    page.set_default_navigation_timeout(60000)
+    return page
+
+
+def _profile_worker(
+    listing_queue: "queue.Queue[Tuple[str, str, str, List[str]]]",
+    on_contact: Callable[[BrokerContact], None],
+    cache: Optional[ProfileCache] = None,
+    storage_path: Optional[str] = None,
+    stop: Optional[threading.Event] = None,
+) -> List[BrokerContact]:
+    # Playwright's sync API is bound to the thread that started it, so every
+    # worker drives its own Playwright instance and browser.
+    contacts: List[BrokerContact] = []
+    with sync_playwright() as p, p.chromium.launch(headless=False) as browser:
+        context = _new_context(browser, storage_path)
+        page = _new_page(context)
+        scraped = 0
+        try:
+            while stop is None or not stop.is_set():
                 try:
-                    page.goto(profile_url, wait_until="domcontentloaded", timeout=60000)
-                    page.wait_for_load_state("load", timeout=30000)
-                    _loaded = True
+                    profile_url, list_name, list_company, card_keywords = listing_queue.get_nowait()
+                except queue.Empty:
                     break
-                except Exception as goto_err:
-                    if _attempt == 0:
+                cached = cache.get(profile_url) if cache is not None else None
+                if cached is not None:
+                    contact = cached[0]
+                else:
+                    if scraped >= PROFILES_PER_CONTEXT:
+                        context.close()
+                        context = _new_context(browser, storage_path)
+                        page = _new_page(context)
+                        scraped = 0
+                    scraped += 1
+                    try:
+                        contact, cacheable = _scrape_profile(
+                            page, profile_url, list_name, list_company, card_keywords
+                        )
+                    except Exception as e:
+                        print(f"  Skip broker {profile_url}: {e}")
                         continue
-                    raise goto_err
-            if not _loaded:
-                raise RuntimeError("profile load failed")
-
-            bio_specialties = _extract_bio_specialties(page)
-            passes, keywords_found = _profile_contains_ecw_keyword(bio_specialties)
-            if not passes:
-                page.goto(state_url, wait_until="domcontentloaded", timeout=60000)
-                page.get_by_role("link", name=re.compile(r"more\s+details", re.I)).first.wait_for(state="visible", timeout=20000)
-                continue
+                    if cache is not None and cacheable:
+                        cache.put(profile_url, contact)
+                if contact is None:
+                    continue
+                contacts.append(contact)
+                on_contact(contact)
+        finally:
+            context.close()
+    return contacts
 
-            email = _extract_email_from_profile(page)
-            location = _extract_location_from_profile(page)
-            full_name = list_name if list_name != "N/A" else _safe_text(page.get_by_role("heading").first)
-            company = list_company if list_company != "N/A" else _safe_text(page.get_by_text("Company", exact=False).first.locator("xpath=following-sibling::*[1]"))
-            phone = _extract_phone_from_profile(page)
-
-            notes = "; ".join(keywords_found) if keywords_found else "N/A"
-            contact = BrokerContact(
-                full_name=full_name,
-                phone_number=phone,
-                location=location,
-                company=company,
-                email=email,
-                source_url=profile_url,
-                notes=notes,
-            )
-            contacts.append(contact)
-            print(f"  + {full_name} ({company}) — keywords: {notes}")
-            if sheet_id and service_account_json:
-                try:
-                    df_one = contacts_to_dataframe([contact]).rename(columns=OUTPUT_HEADERS)
-                    row = df_one.astype(str).fillna("").values.tolist()[0]
-                    append_row_to_google_sheet(
-                        row,
-                        sheet_id=sheet_id,
-                        worksheet_name=worksheet_name,
-                        service_account_json_path=service_account_json,
-                    )
-                except Exception as e:
-                    print(f"  (Sheet append failed: {e})")
 
-            page.goto(state_url, wait_until="domcontentloaded", timeout=60000)
-            page.get_by_role("link", name=re.compile(r"more\s+details", re.I)).first.wait_for(state="visible", timeout=20000)
-        except Exception as e:
-            print(f"  Skip broker at {state_url}: {e}")
-            for _ in range(2):
+def _scrape_state_page(
+    page: Page,
+    state_name: str,
+    state_url: str,
+    max_profiles: Optional[int] = None,
+    *,
+    workers: int = PROFILE_WORKERS,
+    sheet_buffer: Optional[SheetBuffer] = None,
+    cache: Optional[ProfileCache] = None,
+    write_row: Optional[Callable[[List[str]], None]] = None,
+    storage_path: Optional[str] = None,
+) -> List[BrokerContact]:
+    contacts: List[BrokerContact] = []
+    # The directory is server-rendered: a plain GET usually has every card.
+    # Render it in Chromium only when that finds nothing.
+    raw_html = _fetch_html(page, state_url)
+    listings = _collect_listings(_parse_listing_html(raw_html), state_url, max_profiles) if raw_html else []
+    if not listings:
+        page.goto(state_url, wait_until="domcontentloaded", timeout=60000)
+        try:
+            page.wait_for_selector(_SEL_MORE_DETAILS, timeout=10000)
+        except Exception:
+            print(f"  No 'more details' links found on {state_url}; state page may have changed or be empty.")
+            return contacts
+        listings = _collect_listings(_get_listing_cards_and_links(page), state_url, max_profiles)
+    if not listings:
+        return contacts
+    listing_queue: "queue.Queue[Tuple[str, str, str, List[str]]]" = queue.Queue()
+    for listing in listings:
+        listing_queue.put(listing)
+    n_workers = max(1, min(workers, len(listings)))
+    print(f"  Checking {len(listings)} broker profiles with {n_workers} workers...")
+
+    write_lock = threading.Lock()
+
+    def _on_contact(contact: BrokerContact) -> None:
+        print(f"  + {contact.full_name} ({contact.company}) — keywords: {contact.notes}")
+        row = contact_to_row(contact)
+        if write_row is not None:
+            with write_lock:
+                write_row(row)
+        if sheet_buffer is not None:
+            sheet_buffer.add(row)
+
+    stop = threading.Event()
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        futures = [
+            executor.submit(_profile_worker, listing_queue, _on_contact, cache, storage_path, stop)
+            for _ in range(n_workers)
+        ]
+        try:
+            for future in as_completed(futures):
                 try:
-                    page.goto(state_url, wait_until="domcontentloaded", timeout=60000)
-                    page.get_by_role("link", name=re.compile(r"more\s+details", re.I)).first.wait_for(state="visible", timeout=25000)
-                    break
-                except Exception:
-                    pass
-            continue
+                    contacts.extend(future.result())
+                except Exception as e:
+                    print(f"  Profile worker failed: {e}")
+        except KeyboardInterrupt:
+            # Workers finish the profile in hand and leave the rest queued.
+            stop.set()
+            executor.shutdown(cancel_futures=True)
+            raise
 
     return contacts
 
 
-def _save_and_upload_contacts(all_contacts: List[BrokerContact]) -> None:
-    df = contacts_to_dataframe(all_contacts)
-    df_clean = clean_contacts_dataframe(df)
-    df_out = df_clean.rename(columns=OUTPUT_HEADERS)
+def _save_and_upload_contacts() -> None:
+    df = load_from_csv(OUTPUT_CSV)
+    df_out = clean_contacts_dataframe(df)
     save_to_csv(df_out, OUTPUT_CSV)
-    print(f"Total ECW-matching brokers: {len(all_contacts)}.")
+    print(f"Total ECW-matching brokers: {len(df)}.")
     print(f"After de-duplication: {len(df_out)}.")
     print(f"Saved to: {OUTPUT_CSV}")
     if SHEET_ID:
@@ -492,9 +780,7 @@ def _save_and_upload_contacts(all_contacts: List[BrokerContact]) -> None:
         print("Google Sheets upload completed.")
 
 
-def scrape_ibba_directory() -> None:
-    all_contacts: List[BrokerContact] = []
-
+def scrape_ibba_directory(use_cache: bool = True) -> None:
     if SHEET_ID:
         try:
             clear_worksheet_data(
@@ -506,35 +792,62 @@ def scrape_ibba_directory() -> None:
         except Exception as e:
             print(f"Could not clear sheet: {e}")
 
-    try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=False)
-            page = browser.new_page()
-            page.set_default_timeout(30000)
-            page.set_default_navigation_timeout(60000)
-
-            for state_name, state_url in STATE_DIRECTORY_URLS:
-                print(f"Scraping state: {state_name} — {state_url}")
-                state_contacts = _scrape_state_page(
-                    page,
-                    state_name,
-                    state_url,
-                    max_profiles=MAX_PROFILES_PER_STATE,
-                    sheet_id=SHEET_ID,
-                    worksheet_name=WORKSHEET_NAME,
-                    service_account_json=SERVICE_ACCOUNT_JSON,
-                )
-                all_contacts.extend(state_contacts)
-                print(f"  Collected {len(state_contacts)} ECW-matching brokers from {state_name}.")
-
-            browser.close()
-
-        _save_and_upload_contacts(all_contacts)
-    except KeyboardInterrupt:
-        print("\nStopped by user (Ctrl+C). Saving and uploading what we have so far...")
-        _save_and_upload_contacts(all_contacts)
-        print("Done.")
+    sheet_buffer = (
+        SheetBuffer(SHEET_ID, WORKSHEET_NAME, SERVICE_ACCOUNT_JSON, max_rows=SHEET_FLUSH_ROWS)
+        if SHEET_ID and SERVICE_ACCOUNT_JSON
+        else None
+    )
+    cache = (
+        ProfileCache(
+            PROFILE_CACHE_PATH,
+            ttl_seconds=PROFILE_CACHE_TTL_SECONDS,
+            commit_every=_PROFILE_CACHE_COMMIT_EVERY,
+        )
+        if use_cache and PROFILE_CACHE_PATH
+        else None
+    )
+    # Matches are streamed to the CSV as they are found, so an interrupted
+    # run loses nothing; the file is deduped and rewritten once at the end.
+    with open(OUTPUT_CSV, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow([OUTPUT_HEADERS.get(col, col) for col in CSV_COLUMNS])
+        try:
+            with sync_playwright() as p, p.chromium.launch(headless=False) as browser:
+                for state_name, state_url in STATE_DIRECTORY_URLS:
+                    print(f"Scraping state: {state_name} — {state_url}")
+                    # A fresh context per state, loaded only from that state's
+                    # own storage file, keeps cookies from carrying over between
+                    # states and drops the previous state's DOM.
+                    storage_path = _storage_state_path(state_name)
+                    with _new_context(browser, storage_path) as context:
+                        state_contacts = _scrape_state_page(
+                            _new_page(context),
+                            state_name,
+                            state_url,
+                            max_profiles=MAX_PROFILES_PER_STATE,
+                            sheet_buffer=sheet_buffer,
+                            cache=cache,
+                            write_row=writer.writerow,
+                            storage_path=storage_path,
+                        )
+                        _save_storage_state(context, storage_path)
+                    print(f"  Collected {len(state_contacts)} ECW-matching brokers from {state_name}.")
+        except KeyboardInterrupt:
+            print("\nStopped by user (Ctrl+C). Saving and uploading what we have so far...")
+        finally:
+            if cache is not None:
+                cache.close()
+
+    # Flush live appends before the final upload rewrites the sheet.
+    if sheet_buffer is not None:
+        sheet_buffer.close()
+    _save_and_upload_contacts()
 
 
 if __name__ == "__main__":
-    scrape_ibba_directory()
+    parser = argparse.ArgumentParser(description="Scrape the IBBA directory for ECW brokers.")
+    parser.add_argument(
+        "--no-cache", action="store_true", help=f"Re-scrape every profile, ignoring {PROFILE_CACHE_PATH}"
+    )
+    args = parser.parse_args()
+    scrape_ibba_directory(use_cache=not args.no_cache)
@@ -0,0 +1,53 @@
+import unittest
+
+import bizquest_scraper
+import businessbroker_scraper
+import ibba_scraper
+
+
+class BizQuestCityStateTest(unittest.TestCase):
+    def test_abbreviated_city_prefix_is_kept(self):
+        cases = {
+            "Business Broker, St. Louis, MO": "St. Louis, MO",
+            "Business Broker, St. Petersburg, FL": "St. Petersburg, FL",
+            "Business Broker, Ft. Lauderdale, FL": "Ft. Lauderdale, FL",
+            "Business Broker, Ft. Myers, FL 33901": "Ft. Myers, FL",
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(bizquest_scraper._parse_city_state(text), expected)
+
+    def test_abbrev_tier_beats_earlier_full_state_match(self):
+        self.assertEqual(
+            bizquest_scraper._parse_city_state("Business Broker, New York, NY 10001"),
+            "New York, NY",
+        )
+
+
+class BusinessBrokerLocationTest(unittest.TestCase):
+    def test_rejected_zip_state_falls_back_to_city_st(self):
+        self.assertEqual(
+            businessbroker_scraper._extract_location({"body": "Tampa, XX 33602 office"}),
+            "Tampa, XX",
+        )
+
+
+class IbbaLocationTest(unittest.TestCase):
+    def _location(self, text):
+        # Pad so the match sits inside the first 75% of the profile text.
+        return ibba_scraper._extract_location({"main_text": text + " Contact" * 10})
+
+    def test_abbreviated_city_prefix_is_kept(self):
+        cases = {
+            "Business Broker, St. Louis, MO": "St. Louis, MO",
+            "Business Broker, St. Petersburg, FL": "St. Petersburg, FL",
+            "Business Broker, Ft. Lauderdale, FL": "Ft. Lauderdale, FL",
+            "Business Broker, Ft. Myers, FL": "Ft. Myers, FL",
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(self._location(text), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
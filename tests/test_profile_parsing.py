@@ -0,0 +1,43 @@
+import unittest
+
+import businessbroker_scraper
+import crexi_scraper
+
+
+class BusinessBrokerProfileHTMLTest(unittest.TestCase):
+    def test_body_text_skips_head_and_hidden_subtrees(self):
+        data = businessbroker_scraper._parse_profile_html(
+            "<html><head><title>Car Wash Brokers</title></head><body>"
+            "<h1>Jane Doe</h1>"
+            "<div hidden><p>Tunnel wash menu</p><div>nested</div></div>"
+            "<nav style='display: none'>Express wash modal</nav>"
+            "<div aria-hidden='true'><span>Carwash</span></div>"
+            "<h2>Acme Brokers</h2><p>Tampa, FL 33602</p>"
+            "</body></html>"
+        )
+        self.assertEqual(data["h1"], "Jane Doe")
+        self.assertEqual(data["h2"], "Acme Brokers")
+        body = data["body"].lower()
+        self.assertIn("tampa, fl 33602", body)
+        for hidden in ("car wash brokers", "tunnel wash", "nested", "express wash", "carwash"):
+            self.assertNotIn(hidden, body)
+
+
+class CrexiPropertyTypeTest(unittest.TestCase):
+    def test_plurals_match_their_type(self):
+        cases = {
+            "Two warehouses for sale": "Warehouse",
+            "Restaurants portfolio": "Restaurant",
+            "Class A offices": "Office",
+            "Express car washes": "Car Wash",
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(crexi_scraper._extract_property_type_from_text(text), expected)
+
+    def test_partial_words_do_not_match(self):
+        self.assertEqual(crexi_scraper._extract_property_type_from_text("Retailer HQ"), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
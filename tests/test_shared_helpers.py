@@ -0,0 +1,60 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from ecw_scraper_data import BrokerContact, ProfileCache, find_ecw_keywords
+
+
+class FindEcwKeywordsTest(unittest.TestCase):
+    def test_contained_keywords_are_implied(self):
+        self.assertEqual(
+            find_ecw_keywords("sold an express car wash and a carwash"),
+            ["express car wash", "car wash", "carwash"],
+        )
+
+    def test_no_keywords(self):
+        self.assertEqual(find_ecw_keywords("laundromat broker"), [])
+
+
+class ProfileCacheTest(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+
+    def test_round_trip_with_validators(self):
+        contact = BrokerContact(full_name="Jane Doe", notes="car wash")
+        cache = ProfileCache(self.path)
+        cache.put("https://a", contact, etag='"abc"')
+        cache.put("https://b", None)
+        cache.close()
+
+        cache = ProfileCache(self.path)
+        self.assertEqual(cache.get("https://a"), (contact, '"abc"', None))
+        self.assertEqual(cache.get("https://b"), (None, None, None))
+        self.assertIsNone(cache.get("https://c"))
+        cache.close()
+
+    def test_expired_rows_read_as_missing(self):
+        cache = ProfileCache(self.path, ttl_seconds=-1)
+        cache.put("https://a", None)
+        self.assertIsNone(cache.get("https://a"))
+        cache.close()
+
+    def test_older_layout_is_dropped(self):
+        conn = sqlite3.connect(self.path)
+        conn.execute("CREATE TABLE profiles (url TEXT PRIMARY KEY, contact TEXT, scraped_at REAL)")
+        conn.execute("INSERT INTO profiles VALUES ('https://a', NULL, 0)")
+        conn.commit()
+        conn.close()
+
+        cache = ProfileCache(self.path)
+        self.assertIsNone(cache.get("https://a"))
+        cache.put("https://a", None)
+        self.assertEqual(cache.get("https://a"), (None, None, None))
+        cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()